@@ -0,0 +1,61 @@
+'''
+Created on Oct 19, 2026
+
+Benchmark: GMAT deploy time against constellation size.
+Compares one gmat.Initialize() per satellite (plain set_keplerian calls)
+with a single Initialize for the whole constellation (batch_initialize).
+! note: Requires GMAT (gmat_env.py path)
+
+@author: mcvalenti
+'''
+
+import json
+import time
+import numpy as np
+from constellation_env import SatelliteConstellation, walker_elements
+from space_env import Satellite, batch_initialize
+
+KEPLER_KEYS = ("sma", "ecc", "inc", "raan", "aop", "ta")
+
+
+def deploy(elements, prefix, batch):
+    """
+    Creates and configures one GMAT Satellite per element set.
+    :return: elapsed time [sec]
+    """
+    n_sats = len(elements["sma"])
+    t0 = time.perf_counter()
+    if batch:
+        with batch_initialize():
+            for i in range(n_sats):
+                Satellite(f"{prefix}_{i}").set_keplerian(**{k: elements[k][i] for k in KEPLER_KEYS})
+    else:
+        for i in range(n_sats):
+            Satellite(f"{prefix}_{i}").set_keplerian(**{k: elements[k][i] for k in KEPLER_KEYS})
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    #====================
+    # SCALING CURVE
+    #====================
+    print(f"{'Sats':>6} | {'Init per sat [s]':>16} | {'Single init [s]':>15}")
+    print("-" * 45)
+    for n_planes, sats_per_plane in [(2, 5), (4, 10), (6, 20), (8, 40)]:
+        n_sats = n_planes * sats_per_plane
+        elements = walker_elements(n_sats, n_planes, 1, 53.0, 6371.0 + 550.0)
+        t_loop = deploy(elements, f"Loop{n_sats}", batch=False)
+        t_batch = deploy(elements, f"Batch{n_sats}", batch=True)
+        print(f"{n_sats:>6} | {t_loop:>16.3f} | {t_batch:>15.3f}")
+
+    #====================
+    # ONEWEB-LIKE SHELL
+    #====================
+    with open('Constellations_LEO_2026.JSON', 'r', encoding='utf-8') as f:
+        catalog = json.load(f)['leo_constellations_2026']
+    oneweb = SatelliteConstellation.from_json(next(c for c in catalog if c['name'] == 'OneWeb'))
+
+    t0 = time.perf_counter()
+    oneweb.deploy_in_gmat_from_Walker(planes=12, phasing=1)   # "12 planes" in the catalog
+    print(f"OneWeb-like shell: {len(oneweb.satellites)} satellites deployed in "
+          f"{np.round(time.perf_counter() - t0, 2)} s")
@@ -20,6 +20,7 @@ from analytics import *
 from space_env import Satellite, Propagator
 from config import load_beomat_configuration
 from visualizer import graficar_2d_plotly
+from ground_track import longitude_shift_per_rev
 
 # ==========================================================================
 #  Scenario - Load from DB or input a new satellite
@@ -117,9 +118,8 @@ print(f"Maximum Angle coverage (2Lmax): {np.round(2*Lmax,4)} [deg]")
 
 # Longitude drifting because of Earth rotation and RAAN drift
 P = sat.get_keplerian_period() # [sec]
-DeltaL = (P/60.0)*(cts.earth_angular_velocity)
-DeltaL_j2=J2_RAAN_drift(sat.sma,selected_sat['eccentricity'],selected_sat['inclination'])* P/cts.secinday # [deg/orbit]      
-DeltaL_total = DeltaL - DeltaL_j2 # TODO: Confirm signs
+# Earth rotation minus J2 node regression over one nodal period
+DeltaL_total = longitude_shift_per_rev(sat.sma, selected_sat['eccentricity'], selected_sat['inclination']) # [deg/orbit]
 print(f"Total Longitude drift per orbit: {np.round(DeltaL_total,4)} [deg/orbit]" )
 
 # REVISIT
@@ -16,6 +16,8 @@ from datetime import time
 from astropy.time import Time
 import ground_segment as gs
 import access_manager as am
+from trajectory_store import TrajectoryStore
+from orbit_design import sso_inclination, raan_for_ltan
 
 #====================
 # ORBIT
@@ -23,13 +25,15 @@ import access_manager as am
 # LEO orbit circular
 h = 550 # km
 LTAN = time(9,0,0)
-Lon_RAAN= LTAN.hour*15 # [deg/hs]
+# Sun-synchronous: inclination from the altitude, RAAN from the LTAN at the start epoch
+inc_sso = sso_inclination(h)
+Lon_RAAN = raan_for_ltan(LTAN.hour + LTAN.minute/60.0, Time("2026-02-10T12:00:00", format='isot', scale='utc')) # [deg]
 # GMAT Spacecraft creation
 sat = Satellite("Salta")
 sat.set_keplerian(
     sma=cts.Re + h, 
     ecc=0.0001, 
-    inc=98.2, 
+    inc=float(inc_sso), 
     raan=Lon_RAAN, 
     aop=0, 
     ta=0
@@ -55,7 +59,17 @@ prop = Propagator("MyPropagator", config=config_leo)
 duracion_sim = 5 * 3600  # [sec]
 print("Propagating ...")
 # Esto devuelve un array de numpy: [tiempo, x, y, z]
-trajectory = prop.run(sat, duration_sec=duracion_sim, step_size=60)
+# Identical runs are read back from disk instead of propagated again
+store = TrajectoryStore()
+key, trajectory = store.get_or_run(
+    lambda: prop.run(sat, duration_sec=duracion_sim, step_size=60),
+    satellite=sat.name,
+    epoch="2026-02-10T12:00:00",
+    force_model=config_leo,
+    step=60,
+    duration=duracion_sim,
+    elements={k: getattr(sat, k) for k in ('sma', 'ecc', 'inc', 'raan', 'aop', 'ta')}
+)
 print(f" Ready -  {trajectory.shape[0]} data points available")
 
 #====================
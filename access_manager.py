@@ -8,10 +8,11 @@ Created on Jan 17, 2026
 
 
 import numpy as np
-from astropy.time import Time, TimeDelta
 from astropy.coordinates import CartesianRepresentation, GCRS, ITRS, AltAz
 from astropy import units as u
-from ground_segment import Pass
+from ground_segment import Pass, PassTable
+import frames
+from time_grid import TimeGrid
 
 class AccessManager:
     """
@@ -21,68 +22,142 @@ class AccessManager:
     @staticmethod
     def calculate_access(trajectory_data, start_epoch_astropy, site):
         """
+        Frames: Astropy GCRS -> ITRS -> AltAz (precise, slower).
         :trajectory_data: numpy array [time_offset, x, y, z] from GMAT
         :start_epoch_astropy: The Astropy Time of the first point (t=0)
         :site: A Station or ROI object
         :return: List of Pass objects
         """
+        trajectory_data = np.asarray(trajectory_data, dtype=float)
+        grid = TimeGrid.from_time(start_epoch_astropy, trajectory_data[:, 0])
+
+        # 1. One Time array for the whole trajectory (not one Time per row)
+        times = grid.to_time()
+
+        # 2. Position in GCRS (Inertial - GMAT's default), GMAT uses km
+        inertial_pos = GCRS(CartesianRepresentation(trajectory_data[:, 1:4].T * u.km), obstime=times)
+
+        # 3. Transform to ITRS (Earth-Fixed)
+        earth_fixed_pos = inertial_pos.transform_to(ITRS(obstime=times))
+
+        # 4. Elevation relative to the Site, all samples at once
+        altaz_frame = AltAz(obstime=times, location=site.location)
+        elevation = earth_fixed_pos.transform_to(altaz_frame).alt.deg
+
+        # 5. AOS/LOS (Acquisition/Loss of Signal)
+        min_el = getattr(site, 'min_elevation', 0.0) # Default to 0 if it's an ROI
+        starts, stops = AccessManager._windows(elevation, min_el)
+        if len(starts) == 0:
+            return []
+        aos_times = grid.to_time(starts).datetime
+        los_times = grid.to_time(stops).datetime
+        t = grid.offsets
+
+        passes = []
+        for k, (i0, i1) in enumerate(zip(starts, stops)):
+            passes.append(Pass(
+                aos=aos_times[k],
+                los=los_times[k],
+                max_elevation=float(elevation[i0:i1].max()),
+                duration_sec=float(t[i1] - t[i0])
+            ))
+        return passes
+
+    @staticmethod
+    def calculate_access_profiles(trajectory_data, start_epoch_astropy, site, decimation=1, dtype=np.float32):
+        """
+        Passes with per-sample azimuth, elevation, range and range-rate profiles,
+        computed for the whole trajectory at once.
+        Frames: frames.py MJ2000Eq -> Earth fixed (GMST + precession, ~1 km in LEO),
+        then topocentric ENU at the site; no Astropy transformation.
+        :trajectory_data: numpy array [time_offset, x, y, z, vx, vy, vz]
+                          (Propagator.run(..., with_velocity=True)); with only [t, x, y, z]
+                          the velocity is estimated by finite differences
+        :start_epoch_astropy: The Astropy Time of the first point (t=0)
+        :site: A Station or ROI object
+        :decimation: keep one sample out of 'decimation' in the profiles
+                     (AOS/LOS and maximum elevation use every sample)
+        :dtype: storage type of the profiles (float32 by default)
+        :return: List of Pass objects with profiles
+        """
+        t, el, starts, stops, profiles = AccessManager._visibility(trajectory_data, start_epoch_astropy, site)
+        if len(starts) == 0:
+            return []
+        az, rng, range_rate = profiles()
+
+        grid = TimeGrid.from_time(start_epoch_astropy, t)
+        aos_times = grid.to_time(starts).datetime
+        los_times = grid.to_time(stops).datetime
+
         passes = []
-        is_visible = False
-        current_pass_start = None
-        max_el = 0.0
-
-        # 1. Iterate through the trajectory steps
-        for row in trajectory_data:
-            t_offset, x, y, z = row
-            
-            # Calculate actual time for this point
-            current_time = start_epoch_astropy + TimeDelta(t_offset, format='sec')
-            
-            # 2. Define the position in GCRS (Inertial - GMAT's default)
-            # GMAT uses km, so we multiply by u.km
-            inertial_pos = GCRS(
-                CartesianRepresentation(x=x*u.km, y=y*u.km, z=z*u.km),
-                obstime=current_time
-            )
-            
-            # 3. Transform to ITRS (Earth-Fixed)
-            earth_fixed_pos = inertial_pos.transform_to(ITRS(obstime=current_time))
-            
-            # 4. Calculate Elevation/Azimuth relative to the Site
-            # This is where we see if the satellite is "above the horizon"
-            altaz_frame = AltAz(obstime=current_time, location=site.location)
-            satellite_altaz = earth_fixed_pos.transform_to(altaz_frame)
-            
-            elevation = satellite_altaz.alt.deg
-            
-            # 5. Logical check for AOS/LOS (Acquisition/Loss of Signal)
-            min_el = getattr(site, 'min_elevation', 0.0) # Default to 0 if it's an ROI
-            
-            if elevation >= min_el:
-                if not is_visible:
-                    # AOS detected
-                    is_visible = True
-                    current_pass_start = current_time
-                    max_el = elevation
-                else:
-                    # Update max elevation during the pass
-                    if elevation > max_el:
-                        max_el = elevation
-            else:
-                if is_visible:
-                    # LOS detected
-                    is_visible = False
-                    duration = (current_time - current_pass_start).sec
-                    
-                    # Create the Pass object (assuming you imported it)
-                    # from entities import Pass
-                    new_pass = Pass(
-                        aos=current_pass_start.datetime,
-                        los=current_time.datetime,
-                        max_elevation=max_el,
-                        duration_sec=duration
-                    )
-                    passes.append(new_pass)
-                    max_el = 0.0
-                    
-        return passes
\ No newline at end of file
+        for k, (i0, i1) in enumerate(zip(starts, stops)):
+            idx = np.arange(i0, i1, decimation)
+            passes.append(Pass(
+                aos=aos_times[k],
+                los=los_times[k],
+                max_elevation=float(el[i0:i1].max()),
+                duration_sec=float(t[i1] - t[i0]),
+                time_offsets=(t[idx] - t[i0]).astype(dtype),
+                azimuth=az[idx].astype(dtype),
+                elevation=el[idx].astype(dtype),
+                range_km=rng[idx].astype(dtype),
+                range_rate=range_rate[idx].astype(dtype)
+            ))
+        return passes
+
+    @staticmethod
+    def calculate_access_table(trajectory_data, start_epoch_astropy, site, satellite=""):
+        """
+        Same passes as calculate_access_profiles, returned as a columnar PassTable
+        (no Pass objects are created).
+        Frames: frames.py approximation (~1 km in LEO), as calculate_access_profiles.
+        :satellite: name stored in the table
+        :return: PassTable
+        """
+        t, el, starts, stops, _ = AccessManager._visibility(trajectory_data, start_epoch_astropy, site)
+        grid = TimeGrid.from_time(start_epoch_astropy, t)
+        n = len(starts)
+        max_el = np.maximum.reduceat(el, np.column_stack([starts, stops]).ravel())[::2] if n else []
+        return PassTable(grid.datetime64(starts).astype(np.int64),
+                         grid.datetime64(stops).astype(np.int64),
+                         max_el, t[stops] - t[starts], np.zeros(n), np.zeros(n),
+                         [satellite], [site.name], {site.name: site})
+
+    @staticmethod
+    def _visibility(trajectory_data, start_epoch_astropy, site):
+        """
+        Vectorized look angles (frames) of a whole trajectory and its visibility windows.
+        :return: times, elevation, AOS sample indexes, LOS sample indexes,
+                 function giving (azimuth, range, range-rate) of every sample
+        """
+        trajectory_data = np.asarray(trajectory_data, dtype=float)
+        t = trajectory_data[:, 0]
+        r = trajectory_data[:, 1:4]
+
+        jd1, jd2 = TimeGrid.from_time(start_epoch_astropy, t).jd
+        site_alt_km = site.alt_m / 1000.0
+        r_ecef = frames.eci_to_ecef(r, jd1, jd2)
+        az, el, rng = frames.look_angles(r_ecef, site.lat, site.lon, site_alt_km)
+
+        def profiles():
+            # Velocity from the trajectory, or by finite differences with only [t, x, y, z]
+            v = trajectory_data[:, 4:7] if trajectory_data.shape[1] >= 7 else np.gradient(r, t, axis=0)
+            _, v_ecef = frames.eci_to_ecef(r, jd1, jd2, v)
+            rho = r_ecef - frames.geodetic_to_ecef(site.lat, site.lon, site_alt_km)
+            return az, rng, np.sum(rho * v_ecef, axis=1) / rng
+
+        starts, stops = AccessManager._windows(el, getattr(site, 'min_elevation', 0.0))
+        return t, el, starts, stops, profiles
+
+    @staticmethod
+    def _windows(elevation, min_el):
+        """
+        AOS: first visible sample, LOS: first sample below the mask.
+        :return: AOS sample indexes, LOS sample indexes
+        """
+        visible = np.r_[False, elevation >= min_el, False]
+        edges = np.diff(visible.astype(np.int8))
+        starts = np.nonzero(edges == 1)[0]
+        stops = np.nonzero(edges == -1)[0]
+        complete = stops < len(elevation)          # passes still open at the end have no LOS
+        return starts[complete], stops[complete]
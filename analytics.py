@@ -8,10 +8,14 @@ or compute mathematical expressions for raw analitical estimations
 @author: mcvalenti
 '''
 
+import os
 import numpy as np
 import pandas as pd
 import constants as cts
 
+# SMAD atmosphere table, next to this module (independent of the working directory)
+ATM_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Tables', 'atmospheric.csv')
+
 def get_density(altitude):
     """
     Compute atmospheric density from table and a logarithmic interpolation
@@ -27,7 +31,7 @@ def get_density(altitude):
     Returns:
         float: Interpolated density at target_altitude kg/m3.
     """
-    path_atm_table='Tables/atmospheric.csv'
+    path_atm_table=ATM_TABLE
 
     df_atm=pd.read_csv(path_atm_table, 
                        skiprows=1, 
@@ -96,7 +100,7 @@ def estimate_lifetime(params):
     delta_a_rev = drag_decay_per_rev(params)
 
     # SMAD table 
-    path_atm_table='Tables/atmospheric.csv'
+    path_atm_table=ATM_TABLE
     df_atm=pd.read_csv(path_atm_table, 
                        skiprows=1, 
                     names=['h', 'rho', 'H', 'T', 'P', 'M'])
@@ -169,16 +173,29 @@ def J2_RAAN_drift(a,e,i):
     J2_RAAN_drift raw estimation of the drift of the Node
     when considering the J2 perturbation
     [Ref]  Larson & Wertz - pag 143
+    OMEGA_dot = -2.06474e14 a^(-7/2) cos(i) (1-e^2)^(-2)
     :param a: semimajor-axis [km]
     :param e: eccentriticty
     :param i: inclination [deg]
     -----------------------------
     return OMEGA_drift [deg/day]
     """
-    return -2.06474e14*a**(-7/2)*np.cos(i*cts.deg2rad)*(1-e)**(-2)
-
-
-
-
-
+    return -2.06474e14*a**(-7/2)*np.cos(i*cts.deg2rad)*(1-e**2)**(-2)
 
+def hohmann_dv(r1, r2):
+    """
+    Hohmann transfer between two circular coplanar orbits
+    [Ref]  Vallado - Sec. 6.3.1
+    :param r1: initial radius [km]
+    :param r2: final radius [km]
+    -----------------------------
+    return: total delta-v [km/s], transfer time [sec]
+    """
+    r1 = np.asarray(r1, dtype=float)
+    r2 = np.asarray(r2, dtype=float)
+    a_t = 0.5*(r1 + r2)
+    v1 = np.sqrt(cts.mu_e/r1)
+    v2 = np.sqrt(cts.mu_e/r2)
+    dv1 = np.abs(np.sqrt(cts.mu_e*(2/r1 - 1/a_t)) - v1)
+    dv2 = np.abs(v2 - np.sqrt(cts.mu_e*(2/r2 - 1/a_t)))
+    return dv1 + dv2, np.pi*np.sqrt(a_t**3/cts.mu_e)
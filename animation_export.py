@@ -0,0 +1,217 @@
+'''
+Created on Oct 19, 2026
+
+Streaming time-animation export
+(Do not use GMAT environment)
+Positions of a whole constellation are read in time chunks from any
+ephemeris source and written out chunk by chunk, so memory is bounded by
+one chunk (n_sats x chunk_steps) whatever the length of the animation:
+    - CZML (Cesium): one packet per satellite and chunk; Cesium appends the
+      samples of packets with the same id, so the file is written incrementally
+    - Plotly frames: sub-satellite points of every step, one JSON file per
+      chunk (Plotly.addFrames input) plus the base figure
+Sources:
+    - position cube (n_sats, n_steps, 3+) [km], numpy or memory-mapped
+      (Propagator.run_many states, TrajectoryStore.load(key)[..., 1:4])
+    - callable times -> (n_sats, len(times), 3+), e.g. lambda t: walker_positions(elements, t)
+    - list of Ephemeris (interpolated) or TLEHandler (SGP4 on the time grid,
+      rotated from TEME to MJ2000Eq so both kinds share one frame)
+
+@author: mcvalenti
+'''
+
+import os
+import json
+import numpy as np
+import frames
+from time_grid import TimeGrid
+
+# Time steps per chunk
+CHUNK_STEPS = 360
+# Path drawn behind every satellite in CZML [sec]
+TRAIL_SEC = 1800.0
+
+
+def position_chunks(source, times, epoch, chunk_steps=CHUNK_STEPS):
+    """
+    Streams the positions of every satellite in time chunks.
+    :param source: position cube, callable or list of Ephemeris / TLEHandler (see module docstring)
+    :param times: offsets from the epoch of every step [sec]; for a cube, one per cube step
+    :param epoch: Astropy Time or ISO string of t=0
+    :param chunk_steps: time steps per chunk
+    :yield: TimeGrid of the chunk, positions (n_sats, k, 3) [km]
+    """
+    grid = TimeGrid.from_time(epoch, times)
+    for i0 in range(0, len(grid), chunk_steps):
+        chunk = grid[i0:i0 + chunk_steps]
+        if callable(source):
+            pos = source(chunk.offsets)
+        elif isinstance(source, (list, tuple)):
+            pos = np.stack([_states(item, chunk) for item in source])
+        else:
+            pos = source[:, i0:i0 + chunk_steps]
+        yield chunk, np.asarray(pos, dtype=float)[..., :3]
+
+
+def _states(item, chunk):
+    """Inertial (MJ2000Eq) positions of one satellite on a chunk: TLEHandler (SGP4) or Ephemeris."""
+    if hasattr(item, 'propagate'):
+        return chunk.teme_to_eci(item.propagate(chunk)[:, 1:4])
+    return item.interpolate(chunk.offsets)[:, :3]
+
+
+"""
+ CZML
+"""
+def czml_packets(source, times, epoch, names=None, chunk_steps=CHUNK_STEPS, multiplier=60,
+                 color=(255, 255, 0, 255), trail_sec=TRAIL_SEC):
+    """
+    CZML packets, generated chunk by chunk.
+    Positions are written in the inertial frame (GMAT MJ2000Eq ~ ICRF) [m].
+    :param names: satellite ids (default SAT-<index>)
+    :param multiplier: clock speed of the animation
+    :param color: RGBA of the point and path
+    :param trail_sec: length of the drawn path behind each satellite [sec]
+    :yield: dict packets, the document packet first
+    """
+    grid = TimeGrid.from_time(epoch, times)
+    epoch_iso = grid.epoch.isot + 'Z'
+    interval = f"{epoch_iso}/{grid[-1:].to_time(format='isot')[0].value}Z"
+
+    yield {
+        'id': 'document',
+        'name': 'BEOMAT',
+        'version': '1.0',
+        'clock': {'interval': interval, 'currentTime': epoch_iso, 'multiplier': multiplier,
+                  'range': 'LOOP_STOP', 'step': 'SYSTEM_CLOCK_MULTIPLIER'}
+    }
+
+    for n, (chunk, pos) in enumerate(position_chunks(source, times, epoch, chunk_steps)):
+        n_sats = pos.shape[0]
+        if names is None:
+            names = [f"SAT-{k}" for k in range(n_sats)]
+        # Interleaved [t, x, y, z, t, x, y, z, ...] of every satellite [sec, m]
+        samples = np.empty((n_sats, len(chunk), 4))
+        samples[..., 0] = chunk.offsets
+        samples[..., 1:] = pos * 1000.0
+        samples = np.round(samples, 1)
+
+        for k in range(n_sats):
+            packet = {
+                'id': str(names[k]),
+                'position': {'epoch': epoch_iso, 'referenceFrame': 'INERTIAL',
+                             'cartesian': samples[k].ravel().tolist()}
+            }
+            if n == 0:
+                packet['name'] = str(names[k])
+                packet['availability'] = interval
+                packet['position'].update({'interpolationAlgorithm': 'LAGRANGE', 'interpolationDegree': 5})
+                packet['point'] = {'pixelSize': 4, 'color': {'rgba': list(color)}}
+                packet['path'] = {'width': 1, 'leadTime': 0, 'trailTime': trail_sec,
+                                  'material': {'solidColor': {'color': {'rgba': list(color)}}}}
+            yield packet
+
+
+def write_czml(path, source, times, epoch, **kwargs):
+    """
+    Writes a CZML file packet by packet (bounded memory).
+    :param kwargs: czml_packets options (names, chunk_steps, multiplier, color, trail_sec)
+    :return: number of packets written
+    """
+    count = 0
+    with open(path, 'w') as f:
+        f.write('[\n')
+        for packet in czml_packets(source, times, epoch, **kwargs):
+            if count:
+                f.write(',\n')
+            f.write(json.dumps(packet, separators=(',', ':')))
+            count += 1
+        f.write('\n]\n')
+    return count
+
+
+"""
+ PLOTLY FRAMES
+"""
+def plotly_frame_chunks(source, times, epoch, chunk_steps=CHUNK_STEPS, marker=None):
+    """
+    Plotly animation frames (sub-satellite points of every step), one list per chunk.
+    Frames are plain dicts, ready for Plotly.addFrames / go.Figure(frames=...).
+    :param marker: marker properties of the satellites
+    :yield: list of frames of the chunk
+    """
+    marker = marker or dict(size=3, color='red')
+    for chunk, pos in position_chunks(source, times, epoch, chunk_steps):
+        lat, lon, _ = frames.ecef_to_geodetic(chunk.eci_to_ecef(pos))
+        lat, lon = np.round(lat, 3), np.round(lon, 3)
+        labels = np.datetime_as_string(chunk.datetime64(), unit='s')
+        yield [{
+            'name': labels[k],
+            'data': [{'type': 'scattergeo', 'mode': 'markers', 'marker': marker,
+                      'lat': lat[:, k].tolist(), 'lon': lon[:, k].tolist()}],
+            'traces': [0]
+        } for k in range(len(chunk))]
+
+
+def base_figure(first_frame, frame_duration_ms=50, title="Constellation"):
+    """
+    Figure (dict) showing the first frame, with play/pause buttons.
+    """
+    return {
+        'data': first_frame['data'],
+        'layout': {
+            'title': {'text': title},
+            'geo': {'projection': {'type': 'equirectangular'}, 'showland': True, 'showcountries': True},
+            'margin': {'r': 0, 't': 50, 'l': 0, 'b': 0},
+            'updatemenus': [{
+                'type': 'buttons',
+                'buttons': [
+                    {'label': 'Play', 'method': 'animate',
+                     'args': [None, {'frame': {'duration': frame_duration_ms, 'redraw': True},
+                                     'transition': {'duration': 0}, 'fromcurrent': True}]},
+                    {'label': 'Pause', 'method': 'animate',
+                     'args': [[None], {'frame': {'duration': 0, 'redraw': False}, 'mode': 'immediate'}]}
+                ]
+            }]
+        }
+    }
+
+
+def write_plotly_frames(directory, source, times, epoch, chunk_steps=CHUNK_STEPS, **kwargs):
+    """
+    Writes figure.json (first frame + layout) and frames_<n>.json (one list of
+    frames per chunk) into a directory. In a page:
+        Plotly.newPlot(div, figure); for each chunk: Plotly.addFrames(div, frames)
+    :param kwargs: base_figure options (frame_duration_ms, title)
+    :return: list of written files
+    """
+    os.makedirs(directory, exist_ok=True)
+    files = []
+    for n, chunk in enumerate(plotly_frame_chunks(source, times, epoch, chunk_steps)):
+        if n == 0:
+            path = os.path.join(directory, 'figure.json')
+            with open(path, 'w') as f:
+                json.dump(base_figure(chunk[0], **kwargs), f, separators=(',', ':'))
+            files.append(path)
+        path = os.path.join(directory, f"frames_{n:04d}.json")
+        with open(path, 'w') as f:
+            json.dump(chunk, f, separators=(',', ':'))
+        files.append(path)
+    return files
+
+
+if __name__ == "__main__":
+    import tempfile
+    import constants as cts
+    from constellation_env import walker_elements
+    from isl import walker_positions
+
+    # 24 satellites, 2 h at 60 s, positions generated chunk by chunk
+    elements = walker_elements(24, 3, 1, 53.0, cts.Re + 550.0)
+    times = np.arange(0, 7200, 60.0)
+    source = lambda t: walker_positions(elements, t)
+    out_dir = tempfile.mkdtemp()
+
+    n_packets = write_czml(os.path.join(out_dir, 'constellation.czml'), source, times, "2026-02-10T12:00:00")
+    files = write_plotly_frames(os.path.join(out_dir, 'frames'), source, times, "2026-02-10T12:00:00")
+    print(f"CZML: {n_packets} packets, Plotly: {len(files)} files -> {out_dir}")
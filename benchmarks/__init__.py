@@ -0,0 +1,8 @@
+'''
+Created on Oct 19, 2026
+
+BEOMAT benchmark suite (run from the repository root):
+    python -m benchmarks.run [--quick] [--only access] [--compare benchmarks/baseline.json] [--fail-on-regression]
+
+@author: mcvalenti
+'''
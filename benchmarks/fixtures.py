@@ -0,0 +1,84 @@
+'''
+Created on Oct 19, 2026
+
+Synthetic fixtures for the benchmarks
+(Do not use GMAT environment)
+Walker shells, pre-computed trajectories, synthetic TLE/OMM catalogs and
+ground station networks of any size, reproducible from a seed.
+
+@author: mcvalenti
+'''
+
+import numpy as np
+from sgp4.exporter import export_tle
+import constants as cts
+from constellation_env import walker_elements
+from ground_segment import Station
+from isl import walker_positions
+
+EPOCH = "2026-02-10T12:00:00"
+
+
+def walker_shell(n_sats, planes=None, altitude_km=550.0, inc=53.0, phasing=1):
+    """Walker delta element set (n_sats rounded down to a multiple of the planes)."""
+    planes = planes or max(1, int(round(np.sqrt(n_sats / 2))))
+    n_sats = max(planes, n_sats - n_sats % planes)
+    return walker_elements(n_sats, planes, phasing, inc, cts.Re + altitude_km)
+
+
+def trajectory(n_samples, step=30.0, altitude_km=550.0, inc=97.6, raan=0.0):
+    """Pre-computed trajectory [time, x, y, z] of one circular orbit (J2 secular)."""
+    elements = {'sma': [cts.Re + altitude_km], 'inc': [inc], 'raan': [raan], 'aop': [0.0], 'ta': [0.0]}
+    t = np.arange(n_samples) * step
+    return np.column_stack([t, walker_positions(elements, t)[0]])
+
+
+def constellation_cube(n_sats, n_steps, step=60.0, **kwargs):
+    """Inertial positions (n_sats, n_steps, 3) of a Walker shell, and the step offsets."""
+    elements = walker_shell(n_sats, **kwargs)
+    times = np.arange(n_steps) * step
+    return times, walker_positions(elements, times), elements
+
+
+def omm_catalog(n, seed=0, epoch=EPOCH):
+    """
+    Synthetic CelesTrak GP (OMM) records of LEO objects.
+    Mean motion from 300-1200 km altitude, near-circular, any inclination.
+    """
+    rng = np.random.default_rng(seed)
+    altitude = rng.uniform(300.0, 1200.0, n)
+    mean_motion = 86400.0 / (2 * np.pi * np.sqrt((cts.Re + altitude)**3 / cts.mu_e))   # [rev/day]
+    inclination = rng.choice([53.0, 70.0, 87.9, 97.6], n) + rng.normal(0.0, 0.5, n)
+    return [{
+        'OBJECT_NAME': f"SYN-{k}",
+        'NORAD_CAT_ID': 80000 + k,
+        'EPOCH': epoch,
+        'MEAN_MOTION': float(mean_motion[k]),
+        'ECCENTRICITY': float(rng.uniform(0.0, 0.005)),
+        'INCLINATION': float(inclination[k]),
+        'RA_OF_ASC_NODE': float(rng.uniform(0.0, 360.0)),
+        'ARG_OF_PERICENTER': float(rng.uniform(0.0, 360.0)),
+        'MEAN_ANOMALY': float(rng.uniform(0.0, 360.0)),
+        'BSTAR': float(rng.uniform(1e-5, 5e-4)),
+        'MEAN_MOTION_DOT': 0.0,
+        'MEAN_MOTION_DDOT': 0.0
+    } for k in range(n)]
+
+
+def tle_catalog(n, seed=0, epoch=EPOCH):
+    """Synthetic TLEHandler objects with real TLE lines (exported from the OMM records)."""
+    from space_env import TLEHandler
+
+    handlers = []
+    for record in omm_catalog(n, seed, epoch):
+        line1, line2 = export_tle(TLEHandler.from_omm(record).satrec)
+        handlers.append(TLEHandler(record['OBJECT_NAME'], line1, line2))
+    return handlers
+
+
+def station_network(n, seed=0, min_elevation=10.0):
+    """Stations spread uniformly over the sphere (|lat| < 70 deg)."""
+    rng = np.random.default_rng(seed)
+    lat = np.degrees(np.arcsin(rng.uniform(-np.sin(np.radians(70)), np.sin(np.radians(70)), n)))
+    lon = rng.uniform(-180.0, 180.0, n)
+    return [Station(f"GS{k}", float(lat[k]), float(lon[k]), min_elevation=min_elevation) for k in range(n)]
@@ -0,0 +1,224 @@
+'''
+Created on Oct 19, 2026
+
+GMAT stand-in for the benchmarks
+(Do not use GMAT environment)
+Implements the part of the gmatpy API used by space_env (Construct, Initialize,
+Spacecraft Keplerian/Cartesian fields, PropSetup and propagator stepping)
+with a numpy two-body + J2 RK4 integrator, so the benchmarks run on plain Linux.
+It is installed through gmat_env._GMAT_INSTANCE before space_env is imported.
+Drag and SRP forces are accepted and ignored: GMAT's own cost is not
+represented, only the BEOMAT code around it.
+
+@author: mcvalenti
+'''
+
+import numpy as np
+import constants as cts
+import gmat_env
+
+KEPLER_FIELDS = ('SMA', 'ECC', 'INC', 'RAAN', 'AOP', 'TA')
+KEPLER_DEFAULTS = (7000.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+CARTESIAN_FIELDS = ('X', 'Y', 'Z', 'VX', 'VY', 'VZ')
+
+# RK4 substep [sec]; Step() without argument takes NATURAL_STEP, growing by
+# NATURAL_GROWTH every step (as an adaptive integrator does), up to MaxStep [sec]
+SUBSTEP = 30.0
+NATURAL_STEP = 60.0
+NATURAL_GROWTH = 1.5
+MAX_STEP = 2700.0
+
+
+def keplerian_to_cartesian(sma, ecc, inc, raan, aop, ta, mu=cts.mu_e):
+    """Inertial state [km, km/s] from classical elements [km, -, deg]."""
+    i, raan, aop, nu = np.radians([inc, raan, aop, ta])
+    p = sma * (1 - ecc**2)
+    r = p / (1 + ecc * np.cos(nu))
+    r_pf = np.array([r * np.cos(nu), r * np.sin(nu), 0.0])
+    v_pf = np.sqrt(mu / p) * np.array([-np.sin(nu), ecc + np.cos(nu), 0.0])
+
+    cO, sO = np.cos(raan), np.sin(raan)
+    cw, sw = np.cos(aop), np.sin(aop)
+    ci, si = np.cos(i), np.sin(i)
+    rot = np.array([[cO * cw - sO * sw * ci, -cO * sw - sO * cw * ci, sO * si],
+                    [sO * cw + cO * sw * ci, -sO * sw + cO * cw * ci, -cO * si],
+                    [sw * si, cw * si, ci]])
+    return np.r_[rot @ r_pf, rot @ v_pf]
+
+
+def derivatives(y, j2):
+    """Time derivative of the states (n, 6): two-body (+ J2) [km/s, km/s^2]"""
+    r = y[:, :3]
+    r_norm = np.linalg.norm(r, axis=1)[:, None]
+    acc = -cts.mu_e * r / r_norm**3
+    if j2:
+        z2 = (r[:, 2:3] / r_norm)**2
+        k = 1.5 * cts.J2 * cts.mu_e * cts.Re**2 / r_norm**5
+        acc = acc + k * r * np.c_[5 * z2 - 1, 5 * z2 - 1, 5 * z2 - 3]
+    return np.hstack([y[:, 3:], acc])
+
+
+class StandInObject:
+    """Any GMAT resource: keeps its fields and references."""
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+        self.fields = {}
+        self.references = []
+
+    def SetField(self, field, value):
+        self.fields[field] = value
+        return True
+
+    def SetReal(self, field, value):
+        return self.SetField(field, float(value))
+
+    def GetField(self, field):
+        return self.fields.get(field)
+
+    def GetNumber(self, field):
+        return float(self.fields.get(field, 0.0))
+
+    def SetReference(self, obj):
+        self.references.append(obj)
+        return True
+
+    def AddForce(self, force):
+        self.references.append(force)
+
+
+class Spacecraft(StandInObject):
+    """Spacecraft whose Cartesian state follows its Keplerian or Cartesian fields."""
+    def __init__(self, kind, name):
+        super().__init__(kind, name)
+        self._state = keplerian_to_cartesian(*KEPLER_DEFAULTS)
+        self._kepler_pending = False
+
+    def SetField(self, field, value):
+        if field in CARTESIAN_FIELDS:
+            self.state()
+            self._state[CARTESIAN_FIELDS.index(field)] = float(value)
+        elif field in KEPLER_FIELDS:
+            self._kepler_pending = True
+        return super().SetField(field, value)
+
+    def GetField(self, field):
+        if field in CARTESIAN_FIELDS:
+            return float(self.state()[CARTESIAN_FIELDS.index(field)])
+        return super().GetField(field)
+
+    def GetNumber(self, field):
+        if field in CARTESIAN_FIELDS:
+            return self.GetField(field)
+        return super().GetNumber(field)
+
+    def state(self):
+        """Cartesian state [km, km/s]"""
+        if self._kepler_pending:
+            elements = [float(self.fields.get(k, d)) for k, d in zip(KEPLER_FIELDS, KEPLER_DEFAULTS)]
+            self._state = keplerian_to_cartesian(*elements)
+            self._kepler_pending = False
+        return self._state.copy()
+
+
+class StandInPropagator:
+    """Fixed-substep RK4 over the joint state vector of a PropSetup."""
+    def __init__(self, state, j2):
+        self.state = np.asarray(state, dtype=float)
+        self.j2 = j2
+        self.step_taken = 0.0
+        self.fields = {'MaxStep': MAX_STEP}
+        self._natural = NATURAL_STEP
+
+    def SetField(self, field, value):
+        self.fields[field] = float(value)
+        return True
+
+    def GetNumber(self, field):
+        return float(self.fields[field])
+
+    def Step(self, dt=None):
+        if dt is None:
+            dt = min(self._natural, self.fields['MaxStep'])
+            self._natural *= NATURAL_GROWTH
+        dt = float(dt)
+        n_sub = max(1, int(np.ceil(abs(dt) / SUBSTEP)))
+        h = dt / n_sub
+        y = self.state.reshape(-1, 6)
+        for _ in range(n_sub):
+            k1 = derivatives(y, self.j2)
+            k2 = derivatives(y + 0.5 * h * k1, self.j2)
+            k3 = derivatives(y + 0.5 * h * k2, self.j2)
+            k4 = derivatives(y + h * k3, self.j2)
+            y = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        self.state = y.ravel()
+        self.step_taken = dt
+        return True
+
+    def GetState(self):
+        return self.state.copy()
+
+    def GetStepTaken(self):
+        return self.step_taken
+
+
+class PropSetup(StandInObject):
+    def __init__(self, kind, name):
+        super().__init__(kind, name)
+        self.objects = []
+        self._propagator = None
+
+    def AddPropObject(self, obj):
+        if obj not in self.objects:
+            self.objects.append(obj)
+
+    def _j2(self):
+        """J2 unless the force model is a point mass (degree 0) or degree < 2."""
+        for ref in self.references:
+            for force in getattr(ref, 'references', []):
+                if force.kind == 'PointMassForce':
+                    return False
+                if force.kind == 'GravityField' and int(force.fields.get('Degree', 2)) < 2:
+                    return False
+        return True
+
+    def PrepareInternals(self):
+        state = np.concatenate([obj.state() for obj in self.objects]) if self.objects else np.zeros(0)
+        self._propagator = StandInPropagator(state, self._j2())
+
+    def GetPropagator(self):
+        return self._propagator
+
+
+class StandInGMAT:
+    """Module-like object returned by gmat_env.get_gmat()."""
+    def __init__(self):
+        self.objects = {}
+        self.initialize_calls = 0
+
+    def Construct(self, kind, name=None, *args):
+        cls = Spacecraft if kind == 'Spacecraft' else PropSetup if kind == 'PropSetup' else StandInObject
+        obj = cls(kind, name)
+        self.objects[name] = obj
+        return obj
+
+    def GetObject(self, name):
+        return self.objects.get(name)
+
+    def Initialize(self):
+        self.initialize_calls += 1
+        return True
+
+    def Setup(self, *args):
+        return True
+
+
+def install():
+    """
+    Makes gmat_env.get_gmat() return the stand-in (unless GMAT was already loaded).
+    Must be called before space_env is imported.
+    :return: the GMAT instance in use
+    """
+    if gmat_env._GMAT_INSTANCE is None:
+        gmat_env._GMAT_INSTANCE = StandInGMAT()
+    return gmat_env._GMAT_INSTANCE
@@ -0,0 +1,360 @@
+'''
+Created on Oct 19, 2026
+
+BEOMAT benchmark runner
+(Do not use GMAT environment: a numpy stand-in is installed, see gmat_standin.py)
+Every case builds its synthetic fixture for a list of sizes and times one
+call (best of 'repeat' measurements). The report gives, per case, the time per
+size, the time per item and the scaling exponent (slope of log(time) vs log(size)).
+The baseline stores times relative to a fixed reference workload timed in the
+same run, so it is compared across machines: a case is flagged when its relative
+time (geometric mean over the sizes) or its scaling exponent grows beyond the tolerances.
+
+    python -m benchmarks.run                          full sizes, compare with baseline.json
+    python -m benchmarks.run --quick --only access    two smallest sizes of the access cases
+    python -m benchmarks.run --save benchmarks/baseline.json
+    python -m benchmarks.run --plot scaling.html      log-log scaling curves (plotly)
+
+@author: mcvalenti
+'''
+
+import os
+import sys
+import re
+import json
+import time
+import argparse
+import platform
+import warnings
+from collections import OrderedDict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks import gmat_standin
+gmat_standin.install()
+
+import numpy as np
+import pandas as pd
+from astropy.utils import iers
+from astropy.time import Time
+import constants as cts
+from benchmarks import fixtures
+
+# No IERS downloads while timing
+iers.conf.auto_download = False
+
+BASELINE_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+# Relative time ratio current / baseline (geometric mean over the sizes of a case) beyond
+# which the case is reported slower (or faster). On a shared machine a case still moves
+# by up to ~50% between runs with no code change; use e.g. --tolerance 0.25 on a quiet one.
+DEFAULT_TOLERANCE = 1.0
+# Growth of the scaling exponent reported as a complexity regression (n -> n^2 is +1)
+EXPONENT_TOLERANCE = 0.5
+# Every measurement loops on the case for at least this long [sec]
+MIN_TIME = 0.1
+
+# name -> dict(setup, sizes, repeat, unit)
+CASES = OrderedDict()
+
+
+def case(name, sizes, repeat=5, unit='items'):
+    """
+    Registers a benchmark. The decorated function receives a size, builds its
+    fixture and returns the zero-argument callable to time.
+    """
+    def register(setup):
+        CASES[name] = dict(setup=setup, sizes=list(sizes), repeat=repeat, unit=unit)
+        return setup
+    return register
+
+
+# ==============
+#  Access
+# ==============
+@case('access.calculate_access', [720, 2880, 11520], unit='samples')
+def _calculate_access(n):
+    from access_manager import AccessManager
+    traj = fixtures.trajectory(n)
+    epoch, site = Time(fixtures.EPOCH), fixtures.station_network(1)[0]
+    return lambda: AccessManager.calculate_access(traj, epoch, site)
+
+
+@case('access.calculate_access_table', [2880, 28800, 288000], unit='samples')
+def _calculate_access_table(n):
+    from access_manager import AccessManager
+    traj = fixtures.trajectory(n)
+    epoch, site = Time(fixtures.EPOCH), fixtures.station_network(1)[0]
+    return lambda: AccessManager.calculate_access_table(traj, epoch, site)
+
+
+@case('access.station_network', [10, 40, 160], unit='stations')
+def _station_network(n):
+    from access_manager import AccessManager
+    from ground_segment import PassTable
+    traj = fixtures.trajectory(2880)
+    epoch, sites = Time(fixtures.EPOCH), fixtures.station_network(n)
+    return lambda: PassTable.concat([AccessManager.calculate_access_table(traj, epoch, s) for s in sites])
+
+
+# ==============
+#  TLE / SGP4
+# ==============
+@case('tle.get_state_at', [10, 100, 1000], unit='satellites')
+def _get_state_at(n):
+    handlers = fixtures.tle_catalog(n)
+    return lambda: [h.get_state_at("2026-02-10T18:00:00") for h in handlers]
+
+
+@case('tle.to_geodetic', [5, 20, 80], unit='satellites')
+def _to_geodetic(n):
+    handlers = fixtures.tle_catalog(n)
+    return lambda: [h.to_geodetic("2026-02-10T18:00:00") for h in handlers]
+
+
+@case('tle.propagate_grid', [10, 100, 1000], unit='satellites')
+def _propagate_grid(n):
+    from time_grid import TimeGrid
+    handlers = fixtures.tle_catalog(n)
+    grid = TimeGrid.from_time(fixtures.EPOCH, np.arange(0, 86400, 60.0))
+    return lambda: [h.propagate(grid) for h in handlers]
+
+
+# ==============
+#  Analytics
+# ==============
+@case('analytics.get_density', [10, 100, 1000], unit='altitudes')
+def _get_density(n):
+    from analytics import get_density
+    altitudes = np.linspace(200.0, 1000.0, n)
+    return lambda: [get_density(h) for h in altitudes]
+
+
+@case('analytics.estimate_lifetime', [10, 100, 500], unit='spacecraft')
+def _estimate_lifetime(n):
+    from analytics import estimate_lifetime
+    altitudes = np.linspace(300.0, 900.0, n)
+    params = [{'cd': 2.2, 'area': 1.0, 'mass': 100.0, 'a': 6378.0 + h, 'h': h} for h in altitudes]
+    return lambda: [estimate_lifetime(p) for p in params]
+
+
+# ==============
+#  Visualizer
+# ==============
+@case('visualizer.geodetic_track', [1000, 10000, 100000], unit='samples')
+def _geodetic_track(n):
+    from visualizer import geodetic_track
+    traj = fixtures.trajectory(n)
+    return lambda: geodetic_track(traj, fixtures.EPOCH)
+
+
+@case('visualizer.track_segments', [10000, 100000, 1000000], unit='samples')
+def _track_segments(n):
+    from visualizer import geodetic_track, track_segments
+    traj = fixtures.trajectory(n, step=10.0)
+    lat, lon, alt = geodetic_track(traj, fixtures.EPOCH, precise=False)
+    return lambda: track_segments(lat, lon, np.column_stack([traj[:, 0], alt]))
+
+
+@case('visualizer.plot_constellation_tracks', [24, 96, 384], unit='satellites')
+def _plot_constellation_tracks(n):
+    from visualizer import plot_constellation_tracks
+    times, cube, elements = fixtures.constellation_cube(n, 1440)
+    return lambda: plot_constellation_tracks(cube, times, fixtures.EPOCH, planes=elements['plane'])
+
+
+# ==============
+#  GMAT side (stand-in)
+# ==============
+@case('constellation.deploy', [20, 80, 320], unit='satellites')
+def _deploy(n):
+    from Benchmark_deploy import deploy
+    elements = fixtures.walker_shell(n)
+    calls = iter(range(10**6))
+    return lambda: deploy(elements, f"Bench{n}_{next(calls)}", batch=True)
+
+
+@case('propagator.run', [1440, 5760], unit='steps')
+def _propagator_run(n):
+    from space_env import Satellite, Propagator
+    calls = iter(range(10**6))
+
+    def run():
+        k = next(calls)
+        sat = Satellite(f"BenchRun{n}_{k}")
+        sat.set_keplerian(sma=cts.Re + 550.0, ecc=0.0, inc=97.6, raan=0.0, aop=0.0, ta=0.0)
+        return Propagator(f"BenchProp{n}_{k}").run(sat, n * 60, 60)
+    return run
+
+
+# ==============
+#  Runner
+# ==============
+def reference_workload():
+    """
+    Fixed numpy + Python workload timed next to every case. Case times are stored
+    relative to it, so a baseline saved on one machine is comparable on another.
+    """
+    x = np.linspace(0.0, 1.0, 200_000)
+    for _ in range(5):
+        x = np.sqrt(np.sin(x)**2 + np.cos(x) * x + 1.0)
+    total = 0.0
+    for k in range(20_000):
+        total += k * 0.5
+    return x.sum() + total
+
+
+def measure(fn, repeat, warmup=False, min_time=MIN_TIME):
+    """
+    Best and median wall time of one call [sec], over 'repeat' measurements.
+    Every measurement loops on fn until min_time has elapsed (fast cases are
+    averaged over many calls instead of timing one millisecond call).
+    :param warmup: one untimed call first (IERS tables, imports, caches)
+    """
+    if warmup:
+        fn()
+    times = []
+    for _ in range(max(1, repeat)):
+        calls, t0 = 0, time.perf_counter()
+        while True:
+            fn()
+            calls += 1
+            elapsed = time.perf_counter() - t0
+            if elapsed >= min_time:
+                break
+        times.append(elapsed / calls)
+    return min(times), float(np.median(times))
+
+
+def run_suite(only=None, quick=False, repeat=None, log=print):
+    """
+    :param only: regular expression on the case names
+    :param quick: only the two smallest sizes
+    :return: DataFrame: case, size, unit, best_sec, median_sec, per_item_us,
+             relative (best_sec / reference workload time, timed before the case)
+    """
+    rows = []
+    for name, spec in CASES.items():
+        if only and not re.search(only, name):
+            continue
+        sizes = spec['sizes'][:2] if quick else spec['sizes']
+        n_repeat = repeat or spec['repeat']
+        # Timed next to every case, so a change of machine load during the run cancels out
+        reference, _ = measure(reference_workload, n_repeat, warmup=True)
+        for k, size in enumerate(sizes):
+            fn = spec['setup'](size)
+            best, median = measure(fn, n_repeat, warmup=(k == 0))
+            rows.append((name, size, spec['unit'], best, median, best / size * 1e6, best / reference))
+            log(f"  {name:<38} {size:>8} {spec['unit']:<11} {best:>10.4f} s")
+    return pd.DataFrame(rows, columns=['case', 'size', 'unit', 'best_sec', 'median_sec', 'per_item_us', 'relative'])
+
+
+def _exponent(sizes, values):
+    """Slope of log(value) vs log(size), NaN with less than two sizes."""
+    sizes, values = np.asarray(sizes, dtype=float), np.asarray(values, dtype=float)
+    if len(sizes) < 2 or not (values > 0).all():
+        return np.nan
+    return np.polyfit(np.log(sizes), np.log(values), 1)[0]
+
+
+def scaling(results):
+    """Scaling exponent per case: slope of log(best time) vs log(size) (1 = linear)."""
+    return pd.Series({name: _exponent(group['size'], group['best_sec'])
+                      for name, group in results.groupby('case', sort=False)}, name='exponent')
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    """
+    Stores the relative times {case: {size: best_sec / reference}}; the machine
+    description is kept for information only.
+    """
+    baseline = {
+        'meta': {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+                 'numpy': np.__version__, 'machine': platform.machine(), 'processor': platform.processor(),
+                 'units': 'best time / reference_workload time'},
+        'results': {name: {str(int(size)): float(rel) for size, rel in zip(group['size'], group['relative'])}
+                    for name, group in results.groupby('case', sort=False)}
+    }
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2)
+    return path
+
+
+def compare(results, path=BASELINE_PATH, tolerance=DEFAULT_TOLERANCE, exponent_tolerance=EXPONENT_TOLERANCE):
+    """
+    Compares a run with a baseline, on machine independent numbers.
+    A case is 'slower' ('faster') when the geometric mean over its sizes of
+    relative / baseline is beyond the tolerance, and 'steeper' when its scaling
+    exponent grew more than exponent_tolerance (both fitted on the sizes of the run).
+    :return: per size: DataFrame case, size, baseline, relative, ratio;
+             per case: DataFrame case, ratio, baseline_exponent, exponent, status
+    """
+    with open(path, 'r') as f:
+        stored = json.load(f)['results']
+    base = pd.DataFrame([(name, int(size), rel) for name, sizes in stored.items() for size, rel in sizes.items()],
+                        columns=['case', 'size', 'baseline'])
+    table = base.merge(results[['case', 'size', 'relative']], on=['case', 'size'])
+    table['ratio'] = table['relative'] / table['baseline']
+
+    cases = pd.DataFrame([(name, float(np.exp(np.log(group['ratio']).mean())),
+                           _exponent(group['size'], group['baseline']), _exponent(group['size'], group['relative']))
+                          for name, group in table.groupby('case', sort=False)],
+                         columns=['case', 'ratio', 'baseline_exponent', 'exponent'])
+    steeper = cases['exponent'] - cases['baseline_exponent'] > exponent_tolerance
+    cases['status'] = np.select([steeper, cases['ratio'] > 1 + tolerance, cases['ratio'] < 1 / (1 + tolerance)],
+                                ['steeper', 'slower', 'faster'], 'ok')
+    return table, cases
+
+
+def scaling_figure(results):
+    """Log-log scaling curves, one line per case (plotly)."""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    for name, group in results.groupby('case', sort=False):
+        fig.add_trace(go.Scatter(x=group['size'], y=group['best_sec'], mode='lines+markers', name=name))
+    fig.update_layout(title="BEOMAT benchmarks", xaxis=dict(type='log', title='size'),
+                      yaxis=dict(type='log', title='best time [s]'))
+    return fig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BEOMAT benchmark suite")
+    parser.add_argument('--only', help="regular expression on the case names")
+    parser.add_argument('--quick', action='store_true', help="two smallest sizes of every case")
+    parser.add_argument('--repeat', type=int, help="repetitions per size (best time is kept)")
+    parser.add_argument('--save', help="store the results as a baseline JSON")
+    parser.add_argument('--compare', default=BASELINE_PATH, help="baseline JSON to compare with")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--plot', help="write the scaling curves to an HTML file")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="exit code 1 if a case is slower or scales worse than the baseline")
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter('ignore')      # ERFA "dubious year" and IERS warnings
+    print(f"GMAT: {type(gmat_standin.install()).__name__}")
+    results = run_suite(args.only, args.quick, args.repeat)
+
+    with pd.option_context('display.width', 140, 'display.max_rows', 200):
+        print("\nScaling exponents (1 = linear):")
+        print(scaling(results).round(2).to_string())
+
+        regressions = 0
+        if args.compare and os.path.exists(args.compare) and not args.save:
+            table, cases = compare(results, args.compare, args.tolerance)
+            regressions = int(cases['status'].isin(['slower', 'steeper']).sum())
+            print(f"\nAgainst {os.path.relpath(args.compare)}, times relative to the reference workload:")
+            print(table.round(4).to_string(index=False))
+            print(f"\nPer case (ratio tolerance {args.tolerance:.0%}, exponent tolerance +{EXPONENT_TOLERANCE}):")
+            print(cases.round(2).to_string(index=False))
+
+    if args.save:
+        print(f"\nBaseline saved: {save_baseline(results, args.save)}")
+    if args.plot:
+        scaling_figure(results).write_html(args.plot)
+        print(f"Scaling curves: {args.plot}")
+    return 1 if args.fail_on_regression and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,4 +18,21 @@ mu_e = 398600.4415 # [km3/s2]
 min_sidereal_day= 1436.068167
 # earth_angular_velocity
 earth_angular_velocity = 360/1440 # [deg/min]
-secinday=86164  # seconds in solar day
\ No newline at end of file
+secinday=86164  # seconds in solar day
+# Earth rotation rate (sidereal)
+omega_earth = 7.292115e-5 # [rad/s]
+# Zonal harmonics
+J2 = 1.08262668e-3
+J3 = -2.53265648e-6
+
+"""
+PHYSICS
+"""
+# Speed of light
+c_light = 299792.458 # [km/s]
+
+"""
+SUN
+"""
+# Astronomical unit
+AU = 149597870.7 # [km]
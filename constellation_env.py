@@ -1,7 +1,143 @@
+import re
 import json
+import numpy as np
+import pandas as pd
 from dataclasses import dataclass, field
-from typing import List, Union, Optional
-from space_env import Satellite
+from typing import List, Union, Optional, Any
+
+# NOTE: space_env (and therefore GMAT) is imported only when satellites are
+# actually deployed in GMAT, so constellation geometry can be generated without it.
+
+
+def walker_elements(t_total, p_planes, f_phasing, inc, sma, pattern="delta"):
+    """
+    Orbital elements of every satellite of a Walker constellation T/P/F,
+    computed in one vectorized step (no GMAT objects involved).
+    :param t_total: total number of satellites (T)
+    :param p_planes: number of orbital planes (P)
+    :param f_phasing: relative phasing between adjacent planes (F)
+    :param inc: inclination [deg]
+    :param sma: semi-major axis [km]
+    :param pattern: 'delta' (RAAN spread over 360 deg) or 'star' (over 180 deg)
+    :return: dict of arrays, one entry per satellite:
+             sma, ecc, inc, raan, aop, ta [km, deg], plane and slot indexes
+    """
+    if t_total % p_planes != 0:
+        raise ValueError(f"T={t_total} is not a multiple of P={p_planes}")
+    pattern = pattern.lower()
+    if pattern not in ("delta", "star"):
+        raise ValueError(f"Unknown Walker pattern: {pattern}")
+
+    sats_per_plane = t_total // p_planes
+    raan_span = 360.0 if pattern == "delta" else 180.0
+
+    plane = np.repeat(np.arange(p_planes), sats_per_plane)
+    slot = np.tile(np.arange(sats_per_plane), p_planes)
+
+    raan = plane * (raan_span / p_planes)
+    ta = (slot * (360.0 / sats_per_plane) + plane * (360.0 * f_phasing / t_total)) % 360.0
+
+    return {
+        "sma": np.full(t_total, float(sma)),
+        "ecc": np.zeros(t_total),
+        "inc": np.full(t_total, float(inc)),
+        "raan": raan,
+        "aop": np.zeros(t_total),
+        "ta": ta,
+        "plane": plane,
+        "slot": slot,
+    }
+
+
+# Planes assumed when the configuration says "Multiple ... planes" without a number
+MULTIPLE_PLANES = 3
+
+_NUMBER = r"\d+(?:\.\d+)?"
+_RANGE = rf"({_NUMBER})\s*-\s*({_NUMBER})"
+
+
+def parse_inclinations(text):
+    """
+    Inclinations from the free text of the catalog, one per shell.
+    "53, 43, 97" -> [53., 43., 97.] ; 87.9 -> [87.9]
+    A range is one shell at its upper bound (the highest latitude it covers):
+    "0 - 55" -> [55.]
+    """
+    if isinstance(text, (int, float)):
+        return [float(text)]
+    incs = []
+    for item in str(text).split(","):
+        span = re.search(_RANGE, item)
+        if span:
+            incs.append(max(float(span.group(1)), float(span.group(2))))
+        else:
+            incs.extend(float(x) for x in re.findall(_NUMBER, item))
+    return incs
+
+
+def parse_configuration(text):
+    """
+    Planes and satellites per plane from the free text of the catalog.
+    "72 planes x 22-50 sat"               -> [{'planes': 72, 'spp': (22, 50)}]
+    "12 planes x 49 sat"                  -> [{'planes': 12, 'spp': (49, 49)}]
+    "6 Polar planes / 12 Inclined planes" -> [{'planes': 6, ...}, {'planes': 12, ...}]
+    "6 planes x 11 sat (+9 spares)"       -> [{'planes': 6, 'spp': (11, 11), 'spares': 9}]
+    "Multiple SSO planes"                 -> [{'planes': MULTIPLE_PLANES, ...}]
+    Groups without numbers ("Flock / Train formation") give planes=None.
+    :return: list of dicts: planes, spp (min, max) or None, spares
+    """
+    text = str(text or "")
+    groups = []
+    for part in text.split("/"):
+        planes = re.search(r"(\d+)\s*(?:[A-Za-z]+\s+)?planes?", part, re.IGNORECASE)
+        spp = re.search(r"x\s*(\d+)(?:\s*-\s*(\d+))?\s*sat", part, re.IGNORECASE)
+        spares = re.search(r"\+\s*(\d+)\s*spare", part, re.IGNORECASE)
+        n_planes = int(planes.group(1)) if planes else None
+        if n_planes is None and re.search(r"multiple", part, re.IGNORECASE):
+            n_planes = MULTIPLE_PLANES
+        groups.append({
+            'planes': n_planes,
+            'spp': (int(spp.group(1)), int(spp.group(2) or spp.group(1))) if spp else None,
+            'spares': int(spares.group(1)) if spares else 0
+        })
+    with_planes = [g for g in groups if g['planes'] is not None]
+    return with_planes if with_planes else [{'planes': None, 'spp': None, 'spares': 0}]
+
+
+def plane_groups(n_satellites, planes, sats_per_plane):
+    """
+    (planes, sats_per_plane) groups holding exactly n_satellites: the configured
+    planes first, then the remainder in extra planes of the same size and one
+    partially filled plane.
+    :return: list of (planes, sats_per_plane)
+    """
+    if n_satellites <= 0:
+        return []
+    spp = min(sats_per_plane, n_satellites)
+    planes = max(min(planes, n_satellites // spp), 1)
+    groups = [(planes, spp)]
+    rest = n_satellites - planes * spp
+    if rest >= spp:
+        groups.append((rest // spp, spp))
+    if rest % spp:
+        groups.append((1, rest % spp))
+    return groups
+
+@dataclass
+class Shell:
+    """One orbital shell (single altitude and inclination) of a constellation."""
+    constellation: str
+    altitude_km: float
+    inclination_deg: float
+    planes: int
+    sats_per_plane: int
+    country_of_origin: str = "International"
+    classification: str = "Broadband"
+
+    @property
+    def n_satellites(self):
+        return self.planes * self.sats_per_plane
+
 
 @dataclass
 class SatelliteConstellation:
@@ -18,7 +154,8 @@ class SatelliteConstellation:
     configuration: str = "Standard LEO"
     primary_launcher: str = "TBD"
     primary_purpose: str = "Communication"
-    satellites: List[Satellite] = field(default_factory=list)
+    satellites: List[Any] = field(default_factory=list)   # space_env.Satellite objects
+    elements: Optional[dict] = None                        # arrays from walker_elements
 
     @classmethod
     def from_json(cls, data: dict):
@@ -42,7 +179,77 @@ class SatelliteConstellation:
             primary_purpose="Research/Navigation"
         )
     
+    def generate_walker(self, planes: int, phasing: int, pattern: str = "delta", earth_radius: float = 6371.0):
+        """
+        Computes (without GMAT) the elements of every satellite of the Walker
+        configuration and keeps them in self.elements.
+        """
+        self.elements = walker_elements(self.approx_satellites - self.approx_satellites % planes,
+                                        planes, phasing, float(self.inclination_deg),
+                                        earth_radius + self.altitude_km, pattern)
+        return self.elements
+
+    def shells(self) -> List[Shell]:
+        """
+        Splits the catalog entry into shells with numeric planes, satellites per
+        plane and inclination (parse_inclinations / parse_configuration).
+        One plane group per inclination when both lists match, otherwise the
+        planes are shared evenly among the inclinations. Satellites per plane
+        come from the configuration, or from approx_satellites (clipped to the
+        configured range, e.g. "22-50 sat").
+        The shells always add up to approx_satellites: satellites that do not fit
+        the configured planes (e.g. "(+9 spares)") go to extra planes at the same
+        altitude and inclination (plane_groups).
+        """
+        incs = parse_inclinations(self.inclination_deg) or [0.0]
+        groups = parse_configuration(self.configuration)
+        n_shells = len(incs)
+
+        if len(groups) == n_shells:
+            planes = [g['planes'] for g in groups]
+            spp_ranges = [g['spp'] for g in groups]
+        else:
+            total = groups[0]['planes'] or n_shells
+            planes = [total // n_shells + (1 if k < total % n_shells else 0) for k in range(n_shells)]
+            spp_ranges = [groups[0]['spp']] * n_shells
+        planes = [max(p or 1, 1) for p in planes]
+
+        # integer share of approx_satellites per inclination (largest remainder)
+        shares = self.approx_satellites * np.array(planes) / sum(planes)
+        targets = np.floor(shares).astype(int)
+        targets[np.argsort(targets - shares)[:self.approx_satellites - targets.sum()]] += 1
+
+        shells = []
+        for inc, n_planes, spp_range, target in zip(incs, planes, spp_ranges, targets):
+            spp = max(int(round(target / n_planes)), 1)
+            if spp_range is not None:
+                spp = int(np.clip(spp, *spp_range))
+            for group_planes, group_spp in plane_groups(int(target), n_planes, spp):
+                shells.append(Shell(
+                    constellation=self.name,
+                    altitude_km=float(self.altitude_km),
+                    inclination_deg=inc,
+                    planes=group_planes,
+                    sats_per_plane=group_spp,
+                    country_of_origin=self.country_of_origin,
+                    classification=self.classification
+                ))
+        return shells
+
+    def build_satellite(self, index: int):
+        """
+        Creates the GMAT Satellite for one entry of self.elements, on demand.
+        """
+        from space_env import Satellite
+
+        el = self.elements
+        plane, slot = int(el["plane"][index]), int(el["slot"][index])
+        new_sat = Satellite(name=f"{self.name}_{plane}_{slot}")
+        new_sat.set_keplerian(**{k: el[k][index] for k in ("sma", "ecc", "inc", "raan", "aop", "ta")})
+        return new_sat
+
     def deploy_in_gmat_from_list(self, sat_list):
+        from space_env import Satellite
         # Instantiate our Satellite class
         for sat in sat_list:
             new_sat = Satellite(name=sat[0])
@@ -60,43 +267,20 @@ class SatelliteConstellation:
         
         print(f"Successfully deployed {len(self.satellites)} satellites in GMAT.")
     
-    def deploy_in_gmat_from_Walker(self, planes: int, phasing: int):
+    def deploy_in_gmat_from_Walker(self, planes: int, phasing: int, pattern: str = "delta"):
         """
         Logic to automatically create Satellite objects and configure 
         their orbits in GMAT according to Walker Delta logic.
+        Elements come from generate_walker; GMAT objects are created here.
         """
-        earth_radius = 6371.0
-        sma = earth_radius + self.altitude_km
-        
-        sats_per_plane = self.approx_satellites // planes
-        raan_spacing = 360 / planes
-        ta_spacing = 360 / sats_per_plane
-        phase_offset = (360 * phasing) / self.approx_satellites
-
-        for p in range(planes):
-            current_raan = p * raan_spacing
-            for s in range(sats_per_plane):
-                # 1. Create unique name
-                sat_name = f"{self.name}_{p}_{s}"
-                
-                # 2. Instantiate our Satellite class
-                new_sat = Satellite(name=sat_name)
-                
-                # 3. Calculate True Anomaly (TA) with phasing
-                current_ta = (s * ta_spacing) + (p * phase_offset)
-                
-                # 4. Set GMAT parameters
-                new_sat.set_keplerian(
-                    sma=sma,
-                    ecc=0.0, # Circular orbit
-                    inc=self.inclination_deg,
-                    raan=current_raan,
-                    aop=0.0,
-                    ta=current_ta
-                )
-                
-                # 5. Store in the constellation list
-                self.satellites.append(new_sat)
+        from space_env import batch_initialize
+
+        self.generate_walker(planes, phasing, pattern)
+
+        # GMAT is initialized once for the whole constellation
+        with batch_initialize():
+            for index in range(len(self.elements["sma"])):
+                self.satellites.append(self.build_satellite(index))
         
         print(f"Successfully deployed {len(self.satellites)} satellites in GMAT.")
 
@@ -104,9 +288,78 @@ class SatelliteConstellation:
 class ConstellationManager:
     def __init__(self, constellations: Optional[List[SatelliteConstellation]] = None):
         self.constellations = constellations if constellations else []
+        self._shells = None
+
+    @classmethod
+    def from_json_file(cls, path: str = 'Constellations_LEO_2026.JSON', key: str = 'leo_constellations_2026'):
+        """Loads every constellation of the catalog file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)[key]
+        return cls([SatelliteConstellation.from_json(entry) for entry in catalog])
 
     def add_constellation(self, constellation: SatelliteConstellation):
         self.constellations.append(constellation)
+        self._shells = None
+
+    def shell_table(self) -> pd.DataFrame:
+        """
+        Every shell of every constellation as typed columns:
+        constellation/country/classification (category), altitude_km, inclination_deg (float64),
+        planes, sats_per_plane, n_satellites (int64). Cached until a constellation is added.
+        """
+        if self._shells is None:
+            shells = [shell for c in self.constellations for shell in c.shells()]
+            self._shells = pd.DataFrame({
+                'constellation': pd.Categorical([s.constellation for s in shells]),
+                'country_of_origin': pd.Categorical([s.country_of_origin for s in shells]),
+                'classification': pd.Categorical([s.classification for s in shells]),
+                'altitude_km': np.array([s.altitude_km for s in shells], dtype=np.float64),
+                'inclination_deg': np.array([s.inclination_deg for s in shells], dtype=np.float64),
+                'planes': np.array([s.planes for s in shells], dtype=np.int64),
+                'sats_per_plane': np.array([s.sats_per_plane for s in shells], dtype=np.int64),
+            })
+            self._shells['n_satellites'] = self._shells['planes'] * self._shells['sats_per_plane']
+        return self._shells
+
+    def count_by_altitude_band(self, edges=(200, 400, 600, 800, 1000, 1200, 1400, 2000)) -> pd.Series:
+        """Satellites per altitude band [km] (edges of the bands)."""
+        table = self.shell_table()
+        counts, edges = np.histogram(table['altitude_km'], bins=edges, weights=table['n_satellites'])
+        labels = [f"{lo:g}-{hi:g}" for lo, hi in zip(edges[:-1], edges[1:])]
+        return pd.Series(counts.astype(np.int64), index=labels, name='n_satellites')
+
+    def count_by_inclination(self, edges=(0, 30, 45, 60, 80, 90, 100, 180)) -> pd.Series:
+        """Satellites per inclination band [deg] (edges of the bands)."""
+        table = self.shell_table()
+        counts, edges = np.histogram(table['inclination_deg'], bins=edges, weights=table['n_satellites'])
+        labels = [f"{lo:g}-{hi:g}" for lo, hi in zip(edges[:-1], edges[1:])]
+        return pd.Series(counts.astype(np.int64), index=labels, name='n_satellites')
+
+    def count_by_country(self) -> pd.Series:
+        """Satellites per country of origin (catalog text, e.g. 'UK / France')."""
+        table = self.shell_table()
+        codes = table['country_of_origin'].cat.codes.to_numpy()
+        counts = np.bincount(codes, weights=table['n_satellites'], minlength=len(table['country_of_origin'].cat.categories))
+        return pd.Series(counts.astype(np.int64), index=table['country_of_origin'].cat.categories,
+                         name='n_satellites').sort_values(ascending=False)
+
+    def population_elements(self, phasing: int = 1, earth_radius: float = 6371.0, seed=None) -> dict:
+        """
+        Orbital elements of a multi-shell population: one Walker delta per shell
+        (walker_elements), with a random RAAN/phase offset per shell.
+        :return: dict of arrays (as walker_elements) plus 'shell' (row of shell_table)
+        """
+        table = self.shell_table()
+        rng = np.random.default_rng(seed)
+        parts = []
+        for k, row in enumerate(table.itertuples(index=False)):
+            el = walker_elements(row.n_satellites, row.planes, phasing % row.planes if row.planes > 1 else 0,
+                                 row.inclination_deg, earth_radius + row.altitude_km)
+            el["raan"] = (el["raan"] + rng.uniform(0, 360)) % 360.0
+            el["ta"] = (el["ta"] + rng.uniform(0, 360)) % 360.0
+            el["shell"] = np.full(row.n_satellites, k)
+            parts.append(el)
+        return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
 
     def filter_by_country(self, country: str) -> List[SatelliteConstellation]:
         """Returns a list of constellations matching the country name."""
@@ -146,4 +399,11 @@ if __name__ == "__main__":
     
     # 4. Results
     print(f"Total satellites in orbit: {manager.get_total_satellite_count()}\n")
-    manager.summary()
\ No newline at end of file
+    manager.summary()
+
+    # 5. Multi-shell registry from the catalog
+    registry = ConstellationManager.from_json_file()
+    print(registry.shell_table())
+    print(registry.count_by_altitude_band())
+    population = registry.population_elements(seed=0)
+    print(f"Population: {len(population['sma'])} satellites in {len(registry.shell_table())} shells")
\ No newline at end of file
@@ -0,0 +1,169 @@
+'''
+Created on Oct 19, 2026
+
+Ground station contact scheduler
+(Do not use GMAT environment)
+From the passes of every satellite over every Station (AccessManager),
+builds a conflict-free contact plan:
+    - an antenna holds one contact at a time, with setup (slew) time between contacts
+    - a satellite holds one contact at a time (optional)
+Greedy weighted selection: passes are taken in decreasing value
+(priority x contact time, or priority x data volume) and accepted when
+they fit. Every antenna/satellite keeps its booked intervals sorted, so a
+conflict check is a bisect on its neighbours (O(log n)).
+
+@author: mcvalenti
+'''
+
+from bisect import bisect_right
+import numpy as np
+import pandas as pd
+from ground_segment import PassTable
+
+
+class Timeline:
+    """Sorted, non-overlapping intervals [start, end] of one resource."""
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def fits(self, start, end, gap=0.0):
+        """True if [start, end] keeps 'gap' seconds from every booked interval."""
+        k = bisect_right(self.starts, start)
+        if k > 0 and self.ends[k - 1] + gap > start:
+            return False
+        if k < len(self.starts) and self.starts[k] < end + gap:
+            return False
+        return True
+
+    def book(self, start, end):
+        k = bisect_right(self.starts, start)
+        self.starts.insert(k, start)
+        self.ends.insert(k, end)
+
+
+def build_pass_table(access_results):
+    """
+    Pass table of all satellites and stations.
+    :param access_results: list of dicts {'satellite': name, 'site': Station, 'passes': [Pass]}
+                           (as in the visualization input of Example_access), or a PassTable
+    :return: DataFrame: satellite, station, aos, los, max_elevation, duration_sec
+    """
+    if isinstance(access_results, PassTable):
+        return access_results.to_pandas().rename(columns={'site': 'station'})
+    rows = [(entry['satellite'], entry['site'].name, p.aos, p.los, p.max_elevation, p.duration_sec)
+            for entry in access_results for p in entry['passes']]
+    return pd.DataFrame(rows, columns=['satellite', 'station', 'aos', 'los', 'max_elevation', 'duration_sec'])
+
+
+class ContactScheduler:
+    """
+    Assigns passes to station antennas.
+    """
+    def __init__(self, stations, priorities=None, data_rates=None, objective='time',
+                 min_duration_sec=0.0, one_contact_per_satellite=True):
+        """
+        :param stations: list of Station (antennas, setup_sec)
+        :param priorities: {satellite: weight} (default 1)
+        :param data_rates: {station: downlink rate [Mbps]} (default 1), used by objective='data'
+        :param objective: 'time' (priority x contact time) or 'data' (priority x data volume)
+        :param min_duration_sec: shorter passes are not scheduled
+        :param one_contact_per_satellite: a satellite cannot be in two contacts at once
+        """
+        if objective not in ('time', 'data'):
+            raise ValueError(f"Unknown objective: {objective}")
+        self.stations = {st.name: st for st in stations}
+        self.priorities = priorities or {}
+        self.data_rates = data_rates or {}
+        self.objective = objective
+        self.min_duration_sec = min_duration_sec
+        self.one_contact_per_satellite = one_contact_per_satellite
+
+    def weights(self, table):
+        """Value of every pass of the table."""
+        priority = table['satellite'].map(self.priorities).fillna(1.0).to_numpy(dtype=float)
+        value = table['duration_sec'].to_numpy(dtype=float)
+        if self.objective == 'data':
+            value = value * table['station'].map(self.data_rates).fillna(1.0).to_numpy(dtype=float)
+        return priority * value
+
+    def schedule(self, pass_table):
+        """
+        Conflict-free contact plan.
+        :param pass_table: DataFrame from build_pass_table (or equivalent columns), or a PassTable
+        :return: DataFrame of the scheduled contacts (pass table columns + antenna, weight),
+                 sorted by AOS
+        """
+        if isinstance(pass_table, PassTable):
+            pass_table = build_pass_table(pass_table)
+        table = pass_table[pass_table['duration_sec'] >= self.min_duration_sec].reset_index(drop=True)
+        weight = self.weights(table)
+        aos = pd.to_datetime(table['aos']).to_numpy().astype('datetime64[ns]').astype(np.int64) / 1e9
+        los = pd.to_datetime(table['los']).to_numpy().astype('datetime64[ns]').astype(np.int64) / 1e9
+        # Highest value first; earlier AOS breaks ties
+        order = np.lexsort((aos, -weight))
+
+        antennas = {name: [Timeline() for _ in range(getattr(st, 'antennas', 1))]
+                    for name, st in self.stations.items()}
+        sat_timelines = {}
+        satellites = table['satellite'].to_numpy()
+        stations = table['station'].to_numpy()
+
+        selected, antenna_idx = [], []
+        for k in order:
+            station = stations[k]
+            if station not in antennas:
+                continue
+            start, end = aos[k], los[k]
+            if self.one_contact_per_satellite:
+                sat_line = sat_timelines.setdefault(satellites[k], Timeline())
+                if not sat_line.fits(start, end):
+                    continue
+            setup = getattr(self.stations[station], 'setup_sec', 0.0)
+            for n, line in enumerate(antennas[station]):
+                if line.fits(start, end, setup):
+                    line.book(start, end)
+                    if self.one_contact_per_satellite:
+                        sat_line.book(start, end)
+                    selected.append(k)
+                    antenna_idx.append(n)
+                    break
+
+        plan = table.iloc[selected].copy()
+        plan['antenna'] = antenna_idx
+        plan['weight'] = weight[selected]
+        return plan.sort_values('aos', ignore_index=True)
+
+    @staticmethod
+    def summary(pass_table, plan):
+        """Scheduled contacts and contact time per satellite, against what was visible."""
+        visible = pass_table.groupby('satellite')['duration_sec'].agg(['count', 'sum'])
+        scheduled = plan.groupby('satellite')['duration_sec'].agg(['count', 'sum'])
+        out = visible.join(scheduled, lsuffix='_visible', rsuffix='_scheduled').fillna(0)
+        out.columns = ['passes_visible', 'time_visible_sec', 'contacts', 'time_scheduled_sec']
+        return out
+
+
+if __name__ == "__main__":
+    from datetime import datetime
+    from ground_segment import Station
+
+    # Synthetic pass table: 20 satellites x 4 stations x 2 days
+    rng = np.random.default_rng(0)
+    stations = [Station(f"GS{k}", 0.0, 0.0, antennas=2, setup_sec=120.0) for k in range(4)]
+    n_passes = 20 * 4 * 2 * 2
+    t0 = datetime(2026, 2, 10)
+    aos = np.array(t0, dtype='datetime64[s]') + rng.uniform(0, 2 * 86400, n_passes).astype('timedelta64[s]')
+    duration = rng.uniform(120, 720, n_passes)
+    table = pd.DataFrame({
+        'satellite': rng.integers(0, 20, n_passes).astype(str),
+        'station': np.array([st.name for st in stations])[rng.integers(0, 4, n_passes)],
+        'aos': aos,
+        'los': aos + duration.astype('timedelta64[s]'),
+        'max_elevation': rng.uniform(10, 90, n_passes),
+        'duration_sec': duration
+    })
+
+    scheduler = ContactScheduler(stations, priorities={'0': 5.0}, min_duration_sec=180)
+    plan = scheduler.schedule(table)
+    print(f"{len(plan)} contacts scheduled out of {len(table)} passes")
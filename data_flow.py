@@ -0,0 +1,223 @@
+'''
+Created on Oct 19, 2026
+
+Onboard data flow: imaging -> recorder -> downlink
+(Do not use GMAT environment)
+Event-driven simulation over the pass timelines (no time stepping):
+    - imaging opportunities (ROI passes) add data to the recorder at their LOS
+    - station contacts drain the recorder FIFO with an elevation-dependent rate
+Within a contact, the elevation profile is rebuilt from the pass geometry
+(duration, maximum elevation, altitude) and the rate integrated over it,
+so the time each chunk reaches the ground (and its latency) is known.
+Inputs are pass tables (contact_scheduler.build_pass_table, or a contact plan).
+
+@author: mcvalenti
+'''
+
+from collections import deque
+import numpy as np
+import pandas as pd
+import constants as cts
+from ground_segment import PassTable
+
+# Adaptive coding & modulation steps: (minimum elevation [deg], rate [Mbps])
+DEFAULT_RATE_STEPS = ((5.0, 50.0), (15.0, 150.0), (30.0, 300.0), (50.0, 450.0))
+
+
+class LinkRateModel:
+    """
+    Downlink rate as a function of elevation, and rate integrated over a pass.
+    """
+    def __init__(self, altitude_km=550.0, min_elevation=5.0, rate_steps=DEFAULT_RATE_STEPS, samples=32):
+        """
+        :param altitude_km: satellite altitude, for the pass geometry [km]
+        :param min_elevation: elevation at AOS/LOS [deg]
+        :param rate_steps: ((elevation [deg], rate [Mbps]), ...) increasing elevation
+        :param samples: points per pass of the elevation profile
+        """
+        self.altitude_km = altitude_km
+        self.min_elevation = min_elevation
+        self.step_el = np.array([s[0] for s in rate_steps], dtype=float)
+        self.step_rate = np.array([s[1] for s in rate_steps], dtype=float)
+        self.samples = samples
+
+    def rate(self, elevation):
+        """Rate [Mbps] at the elevations (0 below the first step)."""
+        k = np.searchsorted(self.step_el, elevation, side='right') - 1
+        return np.where(k >= 0, self.step_rate[np.clip(k, 0, None)], 0.0)
+
+    def _earth_angle(self, elevation):
+        """Earth central angle between station and sub-satellite point [rad]"""
+        el = np.radians(elevation)
+        eta = np.arcsin(cts.Re / (cts.Re + self.altitude_km) * np.cos(el))
+        return np.pi / 2 - el - eta
+
+    def elevation_profile(self, duration_sec, max_elevation):
+        """
+        Elevation along every pass [deg], shape (n_pass, samples), and the
+        sample offsets from AOS [sec]. The along-track angle is linear in time:
+        cos(lambda) = cos(lambda_min) cos(phi(t)).
+        """
+        duration = np.asarray(duration_sec, dtype=float)[:, None]
+        max_el = np.maximum(np.asarray(max_elevation, dtype=float), self.min_elevation)[:, None]
+        lam_min = self._earth_angle(max_el)
+        lam_max = self._earth_angle(self.min_elevation)
+        half = np.arccos(np.clip(np.cos(lam_max) / np.cos(lam_min), -1.0, 1.0))
+
+        frac = np.linspace(0.0, 1.0, self.samples)[None, :]
+        lam = np.arccos(np.cos(lam_min) * np.cos(half * (2 * frac - 1)))
+        elevation = np.degrees(np.arctan2(np.cos(lam) - cts.Re / (cts.Re + self.altitude_km), np.sin(lam)))
+        return frac * duration, elevation
+
+    def pass_volume(self, duration_sec, max_elevation):
+        """
+        Cumulative downlink volume along every pass [Mbit].
+        :return: offsets from AOS (n_pass, samples) [sec], cumulative volume (n_pass, samples)
+        """
+        t, elevation = self.elevation_profile(duration_sec, max_elevation)
+        rate = self.rate(elevation)
+        steps = 0.5 * (rate[:, 1:] + rate[:, :-1]) * np.diff(t, axis=1)
+        return t, np.concatenate([np.zeros((len(t), 1)), np.cumsum(steps, axis=1)], axis=1)
+
+
+def _seconds(column, epoch):
+    return (pd.to_datetime(column).to_numpy() - epoch) / np.timedelta64(1, 's')
+
+
+class DataFlowSimulator:
+    """
+    Recorder fill/drain for every satellite of the pass tables.
+    """
+    def __init__(self, rate_model=None, imaging_rate_mbps=800.0, recorder_capacity_mbit=512e3):
+        """
+        :param rate_model: LinkRateModel (default one at 550 km)
+        :param imaging_rate_mbps: data generated while imaging [Mbps]
+        :param recorder_capacity_mbit: recorder size; data beyond it is lost [Mbit]
+        """
+        self.rate_model = rate_model if rate_model is not None else LinkRateModel()
+        self.imaging_rate_mbps = imaging_rate_mbps
+        self.recorder_capacity_mbit = recorder_capacity_mbit
+        self.timelines = {}
+
+    def run(self, imaging_table, downlink_table):
+        """
+        :param imaging_table: ROI passes (satellite, aos, los, duration_sec), DataFrame or PassTable
+        :param downlink_table: station contacts (satellite, aos, los, max_elevation, duration_sec),
+                               DataFrame (e.g. a ContactScheduler plan) or PassTable
+        :return: DataFrame per satellite: generated/downlinked/lost/backlog [Mbit],
+                 max_backlog [Mbit], latency mean/p95/max [h]
+        Backlog timelines (time, backlog) are kept in self.timelines.
+        """
+        if isinstance(imaging_table, PassTable):
+            imaging_table = imaging_table.to_pandas()
+        if isinstance(downlink_table, PassTable):
+            downlink_table = downlink_table.to_pandas()
+        epoch = min(pd.to_datetime(imaging_table['aos']).min(), pd.to_datetime(downlink_table['aos']).min())
+        epoch = np.datetime64(epoch, 'ns')
+
+        # Imaging chunks are available at LOS
+        img_t = _seconds(imaging_table['los'], epoch)
+        img_volume = imaging_table['duration_sec'].to_numpy(dtype=float) * self.imaging_rate_mbps
+
+        # Downlink capacity curves for all contacts at once
+        dl_aos = _seconds(downlink_table['aos'], epoch)
+        offsets, cum_volume = self.rate_model.pass_volume(downlink_table['duration_sec'].to_numpy(dtype=float),
+                                                         downlink_table['max_elevation'].to_numpy(dtype=float))
+
+        # One time-ordered event list: (time, kind, row); imaging (0) before downlink (1) on ties
+        events = pd.DataFrame({
+            'satellite': np.concatenate([imaging_table['satellite'].to_numpy(), downlink_table['satellite'].to_numpy()]),
+            'time': np.concatenate([img_t, dl_aos]),
+            'kind': np.concatenate([np.zeros(len(img_t), int), np.ones(len(dl_aos), int)]),
+            'row': np.concatenate([np.arange(len(img_t)), np.arange(len(dl_aos))])
+        }).sort_values(['satellite', 'time', 'kind'], kind='stable')
+
+        results = []
+        self.timelines = {}
+        for sat, ev in events.groupby('satellite', sort=True):
+            results.append(self._simulate(sat, ev['time'].to_numpy(), ev['kind'].to_numpy(), ev['row'].to_numpy(),
+                                          img_volume, dl_aos, offsets, cum_volume))
+        return pd.DataFrame(results).set_index('satellite')
+
+    def _simulate(self, sat, times, kinds, rows, img_volume, dl_aos, offsets, cum_volume):
+        recorder = deque()          # FIFO of [generation time, volume]
+        backlog = generated = downlinked = lost = max_backlog = 0.0
+        lat_values, lat_weights = [], []
+        line_t, line_b = [], []
+
+        for t, kind, row in zip(times, kinds, rows):
+            if kind == 0:
+                volume = img_volume[row]
+                stored = min(volume, self.recorder_capacity_mbit - backlog)
+                generated += volume
+                lost += volume - stored
+                if stored > 0:
+                    recorder.append([t, stored])
+                    backlog += stored
+            else:
+                cum = cum_volume[row]
+                capacity = cum[-1]
+                used = 0.0
+                while recorder and used < capacity:
+                    chunk = recorder[0]
+                    take = min(chunk[1], capacity - used)
+                    used += take
+                    t_done = dl_aos[row] + np.interp(used, cum, offsets[row])
+                    lat_values.append(t_done - chunk[0])
+                    lat_weights.append(take)
+                    chunk[1] -= take
+                    if chunk[1] <= 1e-9:
+                        recorder.popleft()
+                backlog -= used
+                downlinked += used
+            max_backlog = max(max_backlog, backlog)
+            line_t.append(t)
+            line_b.append(backlog)
+
+        self.timelines[sat] = (np.array(line_t), np.array(line_b))
+        latency = np.array(lat_values) / 3600.0
+        weights = np.array(lat_weights)
+        if len(latency):
+            order = np.argsort(latency)
+            cdf = np.cumsum(weights[order]) / weights.sum()
+            p95 = latency[order][min(np.searchsorted(cdf, 0.95), len(cdf) - 1)]
+            mean, worst = np.average(latency, weights=weights), latency.max()
+        else:
+            p95 = mean = worst = np.nan
+
+        return {
+            'satellite': sat,
+            'generated_mbit': generated,
+            'downlinked_mbit': downlinked,
+            'lost_mbit': lost,
+            'backlog_mbit': backlog,
+            'max_backlog_mbit': max_backlog,
+            'latency_mean_h': mean,
+            'latency_p95_h': p95,
+            'latency_max_h': worst
+        }
+
+
+if __name__ == "__main__":
+    # Synthetic constellation: 10 satellites, 30 days
+    rng = np.random.default_rng(0)
+    t0 = np.datetime64('2026-02-10T00:00:00', 's')
+
+    def random_passes(n, per_sat_day, min_dur, max_dur):
+        total = n * per_sat_day * 30
+        aos = t0 + rng.uniform(0, 30 * 86400, total).astype('timedelta64[s]')
+        duration = rng.uniform(min_dur, max_dur, total)
+        return pd.DataFrame({
+            'satellite': rng.integers(0, n, total).astype(str),
+            'aos': aos,
+            'los': aos + duration.astype('timedelta64[s]'),
+            'max_elevation': rng.uniform(5, 90, total),
+            'duration_sec': duration
+        })
+
+    imaging = random_passes(10, 8, 20, 60)
+    contacts = random_passes(10, 4, 240, 600)
+
+    sim = DataFlowSimulator(LinkRateModel(altitude_km=550.0))
+    report = sim.run(imaging, contacts)
+    print(report.describe().T[['mean', 'max']])
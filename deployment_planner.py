@@ -0,0 +1,179 @@
+'''
+Created on Oct 19, 2026
+
+Constellation deployment planner: plane targeting with J2 differential drift
+(Do not use GMAT environment)
+One launch batch is injected into one plane (launchWindows geometry). Each
+sub-batch waits at a parking (drift) altitude until the differential nodal
+drift brings it to its target plane, then raises to the operational altitude:
+    (RAAN_drift(parking) - RAAN_drift(operational)) * wait = target RAAN - injection RAAN
+Candidate parking altitudes x launch windows x target planes are solved as one
+array computation, and the plan that completes the deployment first (or with
+the lowest delta-v) within the wait and delta-v limits is selected.
+[Ref] Larson & Wertz - Sec. 7.6 ; Vallado - Sec. 6.3
+
+@author: mcvalenti
+'''
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Any
+from astropy.time import Time
+import constants as cts
+from analytics import J2_RAAN_drift, hohmann_dv
+from launchWindows import launch_windows, plane_raan
+
+
+@dataclass
+class DeploymentPlan:
+    """Selected launch window and parking altitude for one launch batch."""
+    launch_time: Any              # numpy datetime64
+    launch_plane: int             # plane reached directly at injection
+    direction: str                # 'ASC' / 'DESC'
+    parking_altitude: float       # [km]
+    target_planes: np.ndarray     # plane indexes served by the batch
+    wait_days: np.ndarray         # wait at parking altitude per target plane [days]
+    dv: float                     # delta-v per satellite (injection -> parking -> operational) [km/s]
+    completion_days: float        # from the start of the search to the last plane reached
+    candidates: pd.DataFrame      # every (window, parking altitude) evaluated
+
+
+def differential_drift(parking_alt, op_alt, inc, e=0.0):
+    """
+    Nodal drift of the parking orbit relative to the operational planes [deg/day]
+    :param parking_alt: [km]
+    :param op_alt: operational altitude [km]
+    :param inc: inclination [deg]
+    """
+    return J2_RAAN_drift(cts.Re + np.asarray(parking_alt, dtype=float), e, inc) - \
+        J2_RAAN_drift(cts.Re + op_alt, e, inc)
+
+
+def drift_wait_times(delta_raan, parking_alts, op_alt, inc, e=0.0, tol=1e-6):
+    """
+    Wait at each parking altitude to gain each RAAN difference.
+    The difference is wrapped in the direction of the drift.
+    :param delta_raan: target minus injection RAAN [deg], any shape S
+    :param parking_alts: candidate altitudes (M,) [km]
+    :return: wait [days], shape (M,) + S (inf where the drift is ~0 and the plane differs)
+    """
+    delta = np.asarray(delta_raan, dtype=float)
+    parking_alts = np.atleast_1d(np.asarray(parking_alts, dtype=float))
+    rate = differential_drift(parking_alts, op_alt, inc, e).reshape((-1,) + (1,) * delta.ndim)
+
+    gain = np.mod(delta, 360.0)
+    gain = np.where(gain > 360.0 - tol, 0.0, gain)
+    gain = np.where(rate < 0, np.where(gain > 0, gain - 360.0, 0.0), gain)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        wait = gain / rate
+    return np.where(gain == 0, 0.0, np.where(np.abs(rate) < tol, np.inf, wait))
+
+
+def deployment_dv(parking_alts, op_alt, injection_alt=None):
+    """
+    Delta-v per satellite: Hohmann injection -> parking plus parking -> operational [km/s]
+    :param injection_alt: default, injection directly at the parking altitude
+    """
+    parking_r = cts.Re + np.atleast_1d(np.asarray(parking_alts, dtype=float))
+    dv, _ = hohmann_dv(parking_r, cts.Re + op_alt)
+    if injection_alt is not None:
+        dv = dv + hohmann_dv(cts.Re + injection_alt, parking_r)[0]
+    return dv
+
+
+def plan_deployment(constellation, site, start, end, parking_alts, planes=None, op_alt=None,
+                    injection_alt=None, directions=('ASC', 'DESC'), max_wait_days=None,
+                    dv_budget=None, objective='completion'):
+    """
+    Launch window and parking altitude for one batch that fills several planes.
+    :param constellation: SatelliteConstellation with elements (generate_walker)
+    :param site: launch Site
+    :param start, end: launch date range (Astropy Time or string); the plane
+                       RAANs of the constellation refer to 'start'
+    :param parking_alts: candidate parking altitudes (M,) [km]
+    :param planes: target plane indexes (default: every plane)
+    :param op_alt: operational altitude [km] (default: constellation altitude)
+    :param injection_alt: injection altitude [km] (default: the parking altitude)
+    :param max_wait_days: limit to the longest wait of the batch
+    :param dv_budget: limit to the delta-v per satellite [km/s]
+    :param objective: 'completion' (earliest last plane) or 'dv'
+    :return: DeploymentPlan (None if no candidate meets the limits)
+    """
+    start = Time(start, scale='utc')
+    inc = float(constellation.inclination_deg)
+    op_alt = constellation.altitude_km if op_alt is None else op_alt
+    parking_alts = np.atleast_1d(np.asarray(parking_alts, dtype=float))
+    op_rate = float(J2_RAAN_drift(cts.Re + op_alt, 0.0, inc))
+
+    # Windows into any target plane; the operational planes drift with op_rate
+    windows = launch_windows(site, start, end, constellation=constellation, planes=planes,
+                             directions=directions, raan_epoch=start, raan_rate=op_rate)
+    if windows.empty:
+        return None
+    plane_ids, raan0 = plane_raan(constellation, planes)
+
+    days = windows['jd'].to_numpy() - start.jd                               # (W,)
+    targets = raan0[None, :] + op_rate * days[:, None]                        # (W, K)
+    delta = targets - windows['raan'].to_numpy()[:, None]
+
+    waits = drift_wait_times(delta, parking_alts, op_alt, inc)               # (M, W, K)
+    max_wait = waits.max(axis=-1)                                             # (M, W)
+    completion = days[None, :] + max_wait
+    dv = deployment_dv(parking_alts, op_alt, injection_alt)                  # (M,)
+
+    feasible = np.isfinite(max_wait)
+    if max_wait_days is not None:
+        feasible &= max_wait <= max_wait_days
+    if dv_budget is not None:
+        feasible &= (dv <= dv_budget)[:, None]
+
+    n_alt, n_win = max_wait.shape
+    candidates = pd.DataFrame({
+        'launch_time': np.tile(windows['launch_time'].to_numpy(), n_alt),
+        'launch_plane': np.tile(windows['plane'].to_numpy(), n_alt),
+        'direction': np.tile(windows['direction'].to_numpy(), n_alt),
+        'parking_altitude': np.repeat(parking_alts, n_win),
+        'max_wait_days': max_wait.ravel(),
+        'completion_days': completion.ravel(),
+        'dv': np.repeat(dv, n_win),
+        'feasible': feasible.ravel()
+    })
+    if not feasible.any():
+        return None
+
+    if objective == 'dv':
+        score = np.where(feasible, dv[:, None] + 1e-9 * completion, np.inf)
+    elif objective == 'completion':
+        score = np.where(feasible, completion, np.inf)
+    else:
+        raise ValueError(f"Unknown objective: {objective}")
+    m, w = np.unravel_index(np.argmin(score), score.shape)
+
+    return DeploymentPlan(
+        launch_time=windows['launch_time'].iloc[w],
+        launch_plane=int(windows['plane'].iloc[w]),
+        direction=windows['direction'].iloc[w],
+        parking_altitude=float(parking_alts[m]),
+        target_planes=plane_ids,
+        wait_days=waits[m, w],
+        dv=float(dv[m]),
+        completion_days=float(completion[m, w]),
+        candidates=candidates
+    )
+
+
+if __name__ == "__main__":
+    from ground_segment import Site
+    from constellation_env import SatelliteConstellation
+
+    ksc = Site("Cape Canaveral", 28.5, -80.6, 3)
+    shell = SatelliteConstellation.create_walker("Shell-1", 72, 6, 1, 53.0, 550)
+    shell.generate_walker(planes=6, phasing=1)
+
+    # One batch for planes 0, 1 and 2, parking between 300 and 540 km
+    plan = plan_deployment(shell, ksc, '2027-03-01', '2027-03-15',
+                           parking_alts=np.arange(300, 541, 10), planes=[0, 1, 2],
+                           max_wait_days=200)
+    print(f"Launch: {plan.launch_time} ({plan.direction}), parking at {plan.parking_altitude} km")
+    print(f"Deployment completed {np.round(plan.completion_days, 1)} days after the first window")
@@ -0,0 +1,177 @@
+'''
+Created on Oct 19, 2026
+
+Ephemeris interpolation over stored trajectories.
+Propagate once on a coarse grid (Propagator.run) and evaluate the state
+at arbitrary epochs with Hermite (position + velocity) or Lagrange
+(position only) interpolation, instead of re-propagating in GMAT.
+
+@author: mcvalenti
+'''
+
+import numpy as np
+from astropy.time import Time
+
+# Interpolation is evaluated in blocks to bound the (N, order, order) work arrays
+_BLOCK_SIZE = 65536
+
+
+class Ephemeris:
+    """
+    Wraps a trajectory array as returned by Propagator.run:
+        [time, x, y, z]                  (positions only)
+        [time, x, y, z, vx, vy, vz]      (with_velocity=True)
+    Times are offsets [sec] from start_epoch, positions in [km], velocities in [km/s].
+    """
+    def __init__(self, trajectory, start_epoch=None):
+        """
+        :param trajectory: numpy array with 4 or 7 columns (see class docstring)
+        :param start_epoch: Astropy Time (or ISO string) of t=0, needed only by at()
+        """
+        data = np.asarray(trajectory, dtype=float)
+        if data.ndim != 2 or data.shape[1] not in (4, 7):
+            raise ValueError("trajectory must have columns [time, x, y, z] or [time, x, y, z, vx, vy, vz]")
+        if data.shape[0] < 2:
+            raise ValueError("trajectory must contain at least 2 samples")
+
+        data = data[np.argsort(data[:, 0], kind='stable')]
+        if np.any(np.diff(data[:, 0]) <= 0):
+            raise ValueError("trajectory times must be strictly increasing")
+
+        self.times = data[:, 0]
+        self.pos = data[:, 1:4]
+        self.vel = data[:, 4:7] if data.shape[1] == 7 else None
+        self.start_epoch = Time(start_epoch) if start_epoch is not None else None
+
+    @property
+    def has_velocity(self):
+        return self.vel is not None
+
+    @property
+    def span(self):
+        """(first, last) time offset covered by the ephemeris [sec]"""
+        return self.times[0], self.times[-1]
+
+    def _check_range(self, t):
+        t0, t1 = self.span
+        if np.any(t < t0) or np.any(t > t1):
+            raise ValueError(f"Requested times outside ephemeris span [{t0}, {t1}] sec")
+
+    def _segment(self, t):
+        """Binary search of the segment [times[k], times[k+1]] containing every t."""
+        k = np.searchsorted(self.times, t, side='right') - 1
+        return np.clip(k, 0, len(self.times) - 2)
+
+    def _hermite(self, t):
+        """Cubic Hermite interpolation on the bracketing segment (needs velocities)."""
+        k = self._segment(t)
+        t0 = self.times[k]
+        h = self.times[k + 1] - t0
+        s = ((t - t0) / h)[:, None]
+        s2 = s * s
+        s3 = s2 * s
+        hh = h[:, None]
+
+        p0, p1 = self.pos[k], self.pos[k + 1]
+        v0, v1 = self.vel[k], self.vel[k + 1]
+
+        pos = ((2*s3 - 3*s2 + 1) * p0 + (s3 - 2*s2 + s) * hh * v0
+               + (-2*s3 + 3*s2) * p1 + (s3 - s2) * hh * v1)
+        vel = ((6*s2 - 6*s) * (p0 - p1) / hh
+               + (3*s2 - 4*s + 1) * v0 + (3*s2 - 2*s) * v1)
+        return pos, vel
+
+    def _lagrange(self, t, order):
+        """Lagrange interpolation over a window of 'order' samples centred on t."""
+        n = len(self.times)
+        k = self._segment(t)
+        start = np.clip(k - (order // 2 - 1), 0, n - order)
+        idx = start[:, None] + np.arange(order)
+        tn = self.times[idx]                                   # (N, order)
+
+        # L_j(t) = prod_{m != j} (t - t_m) / (t_j - t_m)
+        num = np.broadcast_to((t[:, None] - tn)[:, None, :], (len(t), order, order)).copy()
+        den = tn[:, :, None] - tn[:, None, :]
+        diag = np.arange(order)
+        num[:, diag, diag] = 1.0
+        den[:, diag, diag] = 1.0
+        basis = np.prod(num / den, axis=2)                     # (N, order)
+
+        pos = np.einsum('nj,njc->nc', basis, self.pos[idx])
+        vel = np.einsum('nj,njc->nc', basis, self.vel[idx]) if self.has_velocity else None
+        return pos, vel
+
+    def interpolate(self, times, method=None, order=8, return_error=False):
+        """
+        Vectorized state interpolation at arbitrary time offsets.
+        :param times: scalar or array of time offsets [sec] inside the ephemeris span
+        :param method: 'hermite' (requires velocities) or 'lagrange'.
+                       Default: 'hermite' when velocities are available.
+        :param order: number of samples of the Lagrange window
+        :param return_error: also return an estimated position error [km] per time
+        :return: array (N, 6) if velocities are available, otherwise (N, 3)
+                 [, error array (N,)]
+
+        Error estimate: difference against a second interpolant
+            hermite  -> Lagrange of the given order
+            lagrange -> Lagrange of order - 1
+        """
+        t = np.atleast_1d(np.asarray(times, dtype=float))
+        self._check_range(t)
+
+        if method is None:
+            method = 'hermite' if self.has_velocity else 'lagrange'
+        method = method.lower()
+        if method == 'hermite' and not self.has_velocity:
+            raise ValueError("Hermite interpolation requires velocities (Propagator.run(..., with_velocity=True))")
+        if method not in ('hermite', 'lagrange'):
+            raise ValueError(f"Unknown interpolation method: {method}")
+        order = int(min(max(order, 2), len(self.times)))
+
+        ncols = 6 if self.has_velocity else 3
+        states = np.empty((len(t), ncols))
+        error = np.empty(len(t)) if return_error else None
+
+        for b in range(0, len(t), _BLOCK_SIZE):
+            tb = t[b:b + _BLOCK_SIZE]
+            if method == 'hermite':
+                pos, vel = self._hermite(tb)
+                ref_order = order
+            else:
+                pos, vel = self._lagrange(tb, order)
+                ref_order = order - 1
+
+            states[b:b + _BLOCK_SIZE, :3] = pos
+            if self.has_velocity:
+                states[b:b + _BLOCK_SIZE, 3:] = vel
+
+            if return_error:
+                if ref_order >= 2:
+                    ref_pos, _ = self._lagrange(tb, ref_order)
+                    error[b:b + _BLOCK_SIZE] = np.linalg.norm(pos - ref_pos, axis=1)
+                else:
+                    error[b:b + _BLOCK_SIZE] = np.nan
+
+        if return_error:
+            return states, error
+        return states
+
+    def at(self, epochs, **kwargs):
+        """
+        Same as interpolate() but with Astropy Time epochs.
+        :param epochs: Astropy Time (scalar or array)
+        """
+        if self.start_epoch is None:
+            raise ValueError("Ephemeris has no start_epoch; use interpolate() with time offsets")
+        offsets = (Time(epochs) - self.start_epoch).sec
+        return self.interpolate(offsets, **kwargs)
+
+    def resample(self, times, **kwargs):
+        """
+        Returns a trajectory array in Propagator.run layout on a new time grid,
+        so it can be passed to AccessManager or the visualizer.
+        :param times: array of time offsets [sec]
+        """
+        t = np.atleast_1d(np.asarray(times, dtype=float))
+        states = self.interpolate(t, **kwargs)
+        return np.column_stack([t, states])
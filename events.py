@@ -0,0 +1,192 @@
+'''
+Created on Oct 19, 2026
+
+Physical events for event-driven propagation (Propagator.run_events).
+Every event is a scalar function g(t, state) whose zero crossing marks it:
+    ElevationEvent  - satellite rises/sets over a Station elevation mask
+    EclipseEvent    - Earth shadow entry/exit (cylindrical shadow)
+    NodeEvent       - equator crossings (ascending/descending node)
+    AltitudeEvent   - altitude threshold (e.g. re-entry in lifetime studies)
+g is evaluated vectorized over arrays of times and states. Between two
+integrator steps the state is Hermite-interpolated (ephemeris.Ephemeris),
+so event times are refined without re-propagating.
+
+@author: mcvalenti
+'''
+
+import numpy as np
+from astropy.time import TimeDelta
+from dataclasses import dataclass
+from typing import Optional, Any
+import constants as cts
+import frames
+from ephemeris import Ephemeris
+
+# Crossing directions of g
+RISING = 1
+FALLING = -1
+BOTH = 0
+
+
+@dataclass
+class EventRecord:
+    """One detected event."""
+    name: str
+    label: str              # e.g. 'AOS' / 'LOS', 'Umbra entry' / 'Umbra exit'
+    time_sec: float         # offset from the start of the run
+    direction: int          # +1: g rising through zero, -1: falling
+    state: np.ndarray       # [x, y, z, vx, vy, vz] at the event [km, km/s]
+    epoch: Optional[Any] = None   # Astropy Time, when the run has a start epoch
+    terminal: bool = False        # the event stopped the propagation
+
+
+class Event:
+    """
+    Base class of the events. Subclasses implement g(t, states, jd1, jd2):
+    :param t: time offsets (N,) [sec]
+    :param states: inertial states (N, 6) [km, km/s]
+    :param jd1, jd2: two-part Julian date of every time (None if the run has no epoch)
+    """
+    name = "Event"
+    labels = ("falling", "rising")   # label of a FALLING / RISING crossing
+    needs_epoch = False
+
+    def __init__(self, direction=BOTH, terminal=False, name=None):
+        """
+        :param direction: RISING, FALLING or BOTH crossings are reported
+        :param terminal: stop the propagation at the first occurrence
+        """
+        self.direction = direction
+        self.terminal = terminal
+        if name:
+            self.name = name
+
+    def g(self, t, states, jd1, jd2):
+        raise NotImplementedError
+
+    def label(self, direction):
+        return self.labels[1] if direction == RISING else self.labels[0]
+
+
+class ElevationEvent(Event):
+    """Satellite elevation over a Site/Station crosses its mask (AOS/LOS)."""
+    name = "Elevation"
+    labels = ("LOS", "AOS")
+    needs_epoch = True
+
+    def __init__(self, site, min_elevation=None, **kwargs):
+        super().__init__(**kwargs)
+        self.site = site
+        # Default to the station mask, or 0 deg for a Site/ROI
+        self.min_elevation = (min_elevation if min_elevation is not None
+                              else getattr(site, 'min_elevation', 0.0))
+        self.name = f"Elevation {site.name}"
+
+    def g(self, t, states, jd1, jd2):
+        r_ecef = frames.eci_to_ecef(states[:, :3], jd1, jd2)
+        _, el, _ = frames.look_angles(r_ecef, self.site.lat, self.site.lon, self.site.alt_m / 1000.0)
+        return el - self.min_elevation
+
+
+class EclipseEvent(Event):
+    """Earth shadow (cylindrical model): g < 0 in shadow."""
+    name = "Eclipse"
+    labels = ("Umbra entry", "Umbra exit")
+    needs_epoch = True
+
+    def g(self, t, states, jd1, jd2):
+        return frames.shadow_function(states[:, :3], frames.sun_position(jd1, jd2))
+
+
+class NodeEvent(Event):
+    """Equator crossing: RISING is the ascending node."""
+    name = "Node"
+    labels = ("Descending node", "Ascending node")
+
+    def g(self, t, states, jd1, jd2):
+        return states[:, 2]
+
+
+class AltitudeEvent(Event):
+    """Altitude (spherical Earth) crosses a threshold [km]."""
+    name = "Altitude"
+    labels = ("Below threshold", "Above threshold")
+
+    def __init__(self, threshold_km, **kwargs):
+        super().__init__(**kwargs)
+        self.threshold_km = threshold_km
+        self.name = f"Altitude {threshold_km} km"
+
+    def g(self, t, states, jd1, jd2):
+        return np.linalg.norm(states[:, :3], axis=1) - cts.Re - self.threshold_km
+
+
+def _julian_dates(start_epoch, t):
+    if start_epoch is None:
+        return None, None
+    return np.full(len(t), start_epoch.utc.jd1), start_epoch.utc.jd2 + t / 86400.0
+
+
+def _refine(event, segment, start_epoch, ta, tb, ga, gb, tol=1e-3, max_iter=60):
+    """Zero of g on [ta, tb] (Illinois regula falsi on the interpolated segment)."""
+    side = 0
+    for _ in range(max_iter):
+        if tb - ta < tol:
+            break
+        tc = (ta * gb - tb * ga) / (gb - ga)
+        if not ta < tc < tb:
+            tc = 0.5 * (ta + tb)
+        tt = np.array([tc])
+        jd1, jd2 = _julian_dates(start_epoch, tt)
+        gc = event.g(tt, segment.interpolate(tt), jd1, jd2)[0]
+        if gc == 0.0:
+            return tc
+        if (gc < 0) == (ga < 0):
+            ta, ga = tc, gc
+            if side == -1:
+                gb *= 0.5
+            side = -1
+        else:
+            tb, gb = tc, gc
+            if side == 1:
+                ga *= 0.5
+            side = 1
+    return (ta * gb - tb * ga) / (gb - ga) if gb != ga else 0.5 * (ta + tb)
+
+
+def detect_events(events, t0, s0, t1, s1, start_epoch=None, substeps=4):
+    """
+    Events between two consecutive integrator states.
+    g is sampled at 'substeps' points of the Hermite interpolant of the step,
+    so two crossings inside one long step are not missed.
+    :param events: list of Event
+    :param t0, s0, t1, s1: time [sec] and state [x, y, z, vx, vy, vz] at both ends
+    :param start_epoch: Astropy Time of t=0 (required by ElevationEvent/EclipseEvent)
+    :return: list of EventRecord, sorted by time
+    """
+    segment = Ephemeris(np.array([np.r_[t0, s0], np.r_[t1, s1]]))
+    ts = np.linspace(t0, t1, substeps + 1)
+    states = segment.interpolate(ts)
+    jd1, jd2 = _julian_dates(start_epoch, ts)
+
+    found = []
+    for event in events:
+        if event.needs_epoch and start_epoch is None:
+            raise ValueError(f"{event.name} requires the start_epoch of the run")
+        g = event.g(ts, states, jd1, jd2)
+        for k in np.nonzero((g[:-1] < 0) != (g[1:] < 0))[0]:
+            direction = RISING if g[k + 1] > g[k] else FALLING
+            if event.direction != BOTH and direction != event.direction:
+                continue
+            t_event = _refine(event, segment, start_epoch, ts[k], ts[k + 1], g[k], g[k + 1])
+            epoch = start_epoch + TimeDelta(t_event, format='sec') if start_epoch is not None else None
+            found.append(EventRecord(
+                name=event.name,
+                label=event.label(direction),
+                time_sec=float(t_event),
+                direction=direction,
+                state=segment.interpolate(t_event)[0],
+                epoch=epoch,
+                terminal=event.terminal
+            ))
+    return sorted(found, key=lambda rec: rec.time_sec)
@@ -0,0 +1,189 @@
+'''
+Created on Oct 19, 2026
+
+Lightweight Earth orientation and geometry helpers (numpy only).
+Used inside hot loops (event detection, streaming, ISL geometry) where
+building Astropy frames per sample is too slow.
+
+Approximations (good to ~1 km in LEO position):
+    MJ2000Eq -> Earth fixed = Rz(GMST) * Precession(IAU 1976),
+    no nutation nor polar motion, UT1 ~ UTC.
+    TEME (SGP4) ~ mean of date: TEME -> MJ2000Eq = Precession^T.
+    Sun position from the Astronomical Almanac low precision formulae.
+Users: AccessManager.calculate_access_profiles / calculate_access_table,
+pipeline (earth_fixed, AccessStage), isl, and the visualizer with precise=False.
+AccessManager.calculate_access and the visualizer with precise=True keep the
+full Astropy chain (GCRS -> ITRS -> AltAz).
+
+@author: mcvalenti
+'''
+
+import numpy as np
+import constants as cts
+
+# WGS84 ellipsoid
+WGS84_A = 6378.137 # [km]
+WGS84_F = 1 / 298.257223563
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+
+ARCSEC2RAD = np.pi / (180.0 * 3600.0)
+
+
+def gmst(jd1, jd2=0.0):
+    """
+    Greenwich Mean Sidereal Time (IAU 1982) [rad].
+    :param jd1, jd2: two-part Julian date (UT1 ~ UTC), scalars or arrays
+    """
+    T = ((np.asarray(jd1, dtype=float) - 2451545.0) + np.asarray(jd2, dtype=float)) / 36525.0
+    gmst_sec = (67310.54841 + (876600.0 * 3600.0 + 8640184.812866) * T
+                + 0.093104 * T**2 - 6.2e-6 * T**3)
+    return np.mod(gmst_sec, 86400.0) * (2 * np.pi / 86400.0)
+
+
+def _rot_z(angle):
+    """Rotation-of-axes matrices about Z, shape (..., 3, 3)"""
+    c, s = np.cos(angle), np.sin(angle)
+    z, o = np.zeros_like(c), np.ones_like(c)
+    return np.stack([np.stack([c, s, z], -1),
+                     np.stack([-s, c, z], -1),
+                     np.stack([z, z, o], -1)], -2)
+
+
+def _rot_y(angle):
+    """Rotation-of-axes matrices about Y, shape (..., 3, 3)"""
+    c, s = np.cos(angle), np.sin(angle)
+    z, o = np.zeros_like(c), np.ones_like(c)
+    return np.stack([np.stack([c, z, -s], -1),
+                     np.stack([z, o, z], -1),
+                     np.stack([s, z, c], -1)], -2)
+
+
+def precession_matrix(jd1, jd2=0.0):
+    """
+    IAU 1976 precession, J2000 mean equator/equinox -> mean of date. Shape (..., 3, 3)
+    """
+    T = ((np.asarray(jd1, dtype=float) - 2451545.0) + np.asarray(jd2, dtype=float)) / 36525.0
+    zeta = (2306.2181 * T + 0.30188 * T**2 + 0.017998 * T**3) * ARCSEC2RAD
+    z = (2306.2181 * T + 1.09468 * T**2 + 0.018203 * T**3) * ARCSEC2RAD
+    theta = (2004.3109 * T - 0.42665 * T**2 - 0.041833 * T**3) * ARCSEC2RAD
+    return _rot_z(-z) @ _rot_y(theta) @ _rot_z(-zeta)
+
+
+def eci_to_ecef_matrix(jd1, jd2=0.0):
+    """Rotation MJ2000Eq (GCRS) -> Earth fixed, shape (..., 3, 3)"""
+    return _rot_z(gmst(jd1, jd2)) @ precession_matrix(jd1, jd2)
+
+
+def eci_to_ecef(r, jd1, jd2=0.0, v=None):
+    """
+    Inertial (MJ2000Eq) position [and velocity] to Earth fixed.
+    :param r: positions (N, 3) [km]
+    :param jd1, jd2: two-part Julian date of every row (N,)
+    :param v: optional velocities (N, 3) [km/s]
+    :return: r_ecef (N, 3) [, v_ecef (N, 3) including the Earth rotation term]
+    """
+    m = eci_to_ecef_matrix(jd1, jd2)
+    r_ecef = np.einsum('...ij,...j->...i', m, r)
+    if v is None:
+        return r_ecef
+    v_ecef = np.einsum('...ij,...j->...i', m, v)
+    v_ecef = v_ecef - np.cross([0.0, 0.0, cts.omega_earth], r_ecef)
+    return r_ecef, v_ecef
+
+
+def teme_to_eci(r, jd1, jd2=0.0, v=None):
+    """
+    SGP4 TEME position [and velocity] to inertial MJ2000Eq (GCRS), so that
+    TLE states can be mixed with GMAT ephemerides (nutation neglected).
+    :param r: positions (N, 3) [km]
+    :param jd1, jd2: two-part Julian date of every row (N,)
+    :param v: optional velocities (N, 3) [km/s]
+    :return: r_eci (N, 3) [, v_eci (N, 3)]
+    """
+    m = np.swapaxes(precession_matrix(jd1, jd2), -1, -2)
+    r_eci = np.einsum('...ij,...j->...i', m, r)
+    if v is None:
+        return r_eci
+    return r_eci, np.einsum('...ij,...j->...i', m, v)
+
+
+def geodetic_to_ecef(lat, lon, alt_km=0.0):
+    """WGS84 geodetic [deg, deg, km] -> Earth fixed position [km]"""
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    n = WGS84_A / np.sqrt(1 - WGS84_E2 * np.sin(lat)**2)
+    return np.stack([(n + alt_km) * np.cos(lat) * np.cos(lon),
+                     (n + alt_km) * np.cos(lat) * np.sin(lon),
+                     (n * (1 - WGS84_E2) + alt_km) * np.sin(lat)], -1)
+
+
+def ecef_to_geodetic(r):
+    """
+    Earth fixed position (..., 3) [km] -> WGS84 lat, lon [deg], alt [km].
+    Bowring's method, two iterations (sub-millimetre in LEO).
+    """
+    x, y, z = r[..., 0], r[..., 1], r[..., 2]
+    p = np.hypot(x, y)
+    lon = np.arctan2(y, x)
+    lat = np.arctan2(z, p * (1 - WGS84_E2))
+    for _ in range(2):
+        n = WGS84_A / np.sqrt(1 - WGS84_E2 * np.sin(lat)**2)
+        alt = p / np.cos(lat) - n
+        lat = np.arctan2(z, p * (1 - WGS84_E2 * n / (n + alt)))
+    n = WGS84_A / np.sqrt(1 - WGS84_E2 * np.sin(lat)**2)
+    alt = p / np.cos(lat) - n
+    return np.degrees(lat), np.degrees(lon), alt
+
+
+def enu_matrix(lat, lon):
+    """Rotation Earth fixed -> local East/North/Up at a site, shape (3, 3)"""
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    sl, cl = np.sin(lat), np.cos(lat)
+    so, co = np.sin(lon), np.cos(lon)
+    return np.array([[-so, co, 0.0],
+                     [-sl * co, -sl * so, cl],
+                     [cl * co, cl * so, sl]])
+
+
+def look_angles(r_ecef, site_lat, site_lon, site_alt_km=0.0):
+    """
+    Azimuth, elevation [deg] and range [km] from a site to Earth fixed positions (N, 3).
+    """
+    rho = r_ecef - geodetic_to_ecef(site_lat, site_lon, site_alt_km)
+    enu = rho @ enu_matrix(site_lat, site_lon).T
+    rng = np.linalg.norm(enu, axis=-1)
+    el = np.degrees(np.arcsin(enu[..., 2] / rng))
+    az = np.mod(np.degrees(np.arctan2(enu[..., 0], enu[..., 1])), 360.0)
+    return az, el, rng
+
+
+def sun_position(jd1, jd2=0.0):
+    """
+    Low precision Sun position (Astronomical Almanac) in MJ2000Eq [km], shape (..., 3).
+    Accuracy ~0.01 deg, enough for eclipse and illumination geometry.
+    """
+    n = (np.asarray(jd1, dtype=float) - 2451545.0) + np.asarray(jd2, dtype=float)
+    L = np.radians(280.460 + 0.9856474 * n)
+    g = np.radians(357.528 + 0.9856003 * n)
+    lam = L + np.radians(1.915) * np.sin(g) + np.radians(0.020) * np.sin(2 * g)
+    eps = np.radians(23.439 - 0.0000004 * n)
+    dist = (1.00014 - 0.01671 * np.cos(g) - 0.00014 * np.cos(2 * g)) * cts.AU
+    r_of_date = np.stack([dist * np.cos(lam),
+                          dist * np.cos(eps) * np.sin(lam),
+                          dist * np.sin(eps) * np.sin(lam)], -1)
+    # Mean of date -> J2000 (transpose of the precession matrix)
+    return np.einsum('...ji,...j->...i', precession_matrix(jd1, jd2), r_of_date)
+
+
+def shadow_function(r, r_sun, body_radius=cts.Re):
+    """
+    Cylindrical Earth shadow. Positive in sunlight, negative in shadow [km]:
+    distance from the shadow axis minus the Earth radius when behind the Earth.
+    :param r: satellite positions (N, 3) [km]
+    :param r_sun: Sun positions (N, 3) [km], same frame
+    """
+    s_hat = r_sun / np.linalg.norm(r_sun, axis=-1, keepdims=True)
+    along = np.sum(r * s_hat, axis=-1)
+    perp = np.linalg.norm(r - along[..., None] * s_hat, axis=-1)
+    return np.where(along < 0, perp - body_radius, np.linalg.norm(r, axis=-1))
@@ -1,7 +1,11 @@
+import numpy as np
+import pandas as pd
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 from astropy import units as u
 from astropy.coordinates import EarthLocation
+import constants as cts
 
 @dataclass
 class Pass:
@@ -10,6 +14,161 @@ class Pass:
     los: datetime
     max_elevation: float
     duration_sec: float
+    # Optional per-sample profiles (AccessManager.calculate_access_profiles), float32
+    time_offsets: Optional[np.ndarray] = None   # from AOS [sec]
+    azimuth: Optional[np.ndarray] = None        # [deg]
+    elevation: Optional[np.ndarray] = None      # [deg]
+    range_km: Optional[np.ndarray] = None       # [km]
+    range_rate: Optional[np.ndarray] = None     # [km/s], positive when receding
+
+    def doppler(self, carrier_hz):
+        """Doppler shift along the pass [Hz] for a carrier frequency (one way)."""
+        if self.range_rate is None:
+            raise ValueError("Pass has no range-rate profile (use calculate_access_profiles)")
+        return (-carrier_hz * self.range_rate.astype(np.float64) / cts.c_light).astype(self.range_rate.dtype)
+
+    def doppler_rate(self, carrier_hz):
+        """Doppler rate along the pass [Hz/s]."""
+        return np.gradient(self.doppler(carrier_hz).astype(np.float64), self.time_offsets.astype(np.float64))
+
+class PassTable:
+    """
+    Columnar table of passes (many satellites x many sites):
+    int64 AOS/LOS epochs [ns since 1970-01-01 UTC], float32 metrics and
+    categorical satellite/site codes. Iterating yields Pass objects.
+    """
+    def __init__(self, aos_ns, los_ns, max_elevation, duration_sec, satellite_codes, site_codes,
+                 satellites=(), sites=(), site_objects=None):
+        self.aos_ns = np.asarray(aos_ns, dtype=np.int64)
+        self.los_ns = np.asarray(los_ns, dtype=np.int64)
+        self.max_elevation = np.asarray(max_elevation, dtype=np.float32)
+        self.duration_sec = np.asarray(duration_sec, dtype=np.float32)
+        self.satellite_codes = np.asarray(satellite_codes, dtype=np.int32)
+        self.site_codes = np.asarray(site_codes, dtype=np.int32)
+        self.satellites = list(satellites)      # code -> satellite name
+        self.sites = list(sites)                # code -> site name
+        self.site_objects = site_objects or {}  # site name -> Site (coordinates for plots)
+
+    @staticmethod
+    def _epochs_ns(datetimes):
+        return np.array(datetimes, dtype='datetime64[ns]').view(np.int64)
+
+    @classmethod
+    def from_passes(cls, passes, satellite="", site=None):
+        """Table of a list of Pass (one satellite, one site)."""
+        site_name = site.name if site is not None else ""
+        n = len(passes)
+        return cls(cls._epochs_ns([p.aos for p in passes]),
+                   cls._epochs_ns([p.los for p in passes]),
+                   [p.max_elevation for p in passes],
+                   [p.duration_sec for p in passes],
+                   np.zeros(n), np.zeros(n), [satellite], [site_name],
+                   {site_name: site} if site is not None else None)
+
+    @classmethod
+    def from_access(cls, access_results):
+        """
+        Table of many access results.
+        :param access_results: list of dicts {'site': Site, 'passes': [Pass] or PassTable,
+                               'satellite': name (optional)}
+        """
+        return cls.concat([item['passes'] if isinstance(item['passes'], PassTable)
+                           else cls.from_passes(item['passes'], item.get('satellite', ""), item['site'])
+                           for item in access_results])
+
+    @classmethod
+    def concat(cls, tables):
+        """Joins tables, merging their satellite and site categories."""
+        if not tables:
+            return cls([], [], [], [], [], [])
+        satellites = list(dict.fromkeys(name for t in tables for name in t.satellites))
+        sites = list(dict.fromkeys(name for t in tables for name in t.sites))
+        sat_index = {name: k for k, name in enumerate(satellites)}
+        site_index = {name: k for k, name in enumerate(sites)}
+        site_objects = {}
+        for t in tables:
+            site_objects.update(t.site_objects)
+
+        def recode(codes, names, index):
+            lookup = np.array([index[name] for name in names] or [0], dtype=np.int32)
+            return lookup[codes]
+
+        return cls(np.concatenate([t.aos_ns for t in tables]),
+                   np.concatenate([t.los_ns for t in tables]),
+                   np.concatenate([t.max_elevation for t in tables]),
+                   np.concatenate([t.duration_sec for t in tables]),
+                   np.concatenate([recode(t.satellite_codes, t.satellites, sat_index) for t in tables]),
+                   np.concatenate([recode(t.site_codes, t.sites, site_index) for t in tables]),
+                   satellites, sites, site_objects)
+
+    def __len__(self):
+        return len(self.aos_ns)
+
+    def __getitem__(self, index):
+        """Rows selected by a boolean mask, an index array or a slice."""
+        return PassTable(self.aos_ns[index], self.los_ns[index], self.max_elevation[index],
+                         self.duration_sec[index], self.satellite_codes[index], self.site_codes[index],
+                         self.satellites, self.sites, self.site_objects)
+
+    def __iter__(self):
+        aos = self.aos_ns.view('datetime64[ns]').astype('datetime64[us]').astype(datetime)
+        los = self.los_ns.view('datetime64[ns]').astype('datetime64[us]').astype(datetime)
+        for k in range(len(self)):
+            yield Pass(aos=aos[k], los=los[k], max_elevation=float(self.max_elevation[k]),
+                       duration_sec=float(self.duration_sec[k]))
+
+    def filter(self, satellite=None, site=None):
+        """Rows of one satellite and/or one site (by name)."""
+        mask = np.ones(len(self), dtype=bool)
+        if satellite is not None:
+            mask &= self.satellite_codes == self.satellites.index(satellite)
+        if site is not None:
+            mask &= self.site_codes == self.sites.index(site)
+        return self[mask]
+
+    def _group_stats(self, codes, names):
+        n = len(names)
+        count = np.bincount(codes, minlength=n)
+        total = np.bincount(codes, weights=self.duration_sec, minlength=n)
+        max_el = np.full(n, np.nan, dtype=np.float32)
+        if len(codes):
+            np.fmax.at(max_el, codes, self.max_elevation)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = total / count
+        return pd.DataFrame({'passes': count, 'total_duration_sec': total,
+                             'mean_duration_sec': mean, 'max_elevation': max_el},
+                            index=pd.Index(names, name='name'))
+
+    def stats_by_site(self):
+        """Number of passes, total/mean duration [sec] and best elevation per site."""
+        return self._group_stats(self.site_codes, self.sites)
+
+    def stats_by_satellite(self):
+        """Number of passes, total/mean duration [sec] and best elevation per satellite."""
+        return self._group_stats(self.satellite_codes, self.satellites)
+
+    def to_pandas(self):
+        """DataFrame view: datetime64 AOS/LOS, float32 metrics, categorical satellite/site."""
+        return pd.DataFrame({
+            'satellite': pd.Categorical.from_codes(self.satellite_codes, categories=self.satellites),
+            'site': pd.Categorical.from_codes(self.site_codes, categories=self.sites),
+            'aos': self.aos_ns.view('datetime64[ns]'),
+            'los': self.los_ns.view('datetime64[ns]'),
+            'max_elevation': self.max_elevation,
+            'duration_sec': self.duration_sec
+        }, copy=False)
+
+    def to_arrow(self):
+        """pyarrow Table (requires pyarrow); numeric columns are not copied."""
+        import pyarrow as pa
+        return pa.table({
+            'satellite': pa.DictionaryArray.from_arrays(self.satellite_codes, pa.array(self.satellites, pa.string())),
+            'site': pa.DictionaryArray.from_arrays(self.site_codes, pa.array(self.sites, pa.string())),
+            'aos': pa.array(self.aos_ns.view('datetime64[ns]')),
+            'los': pa.array(self.los_ns.view('datetime64[ns]')),
+            'max_elevation': pa.array(self.max_elevation),
+            'duration_sec': pa.array(self.duration_sec)
+        })
 
 class Site:
     """Base class for any geographical location."""
@@ -22,9 +181,15 @@ class Site:
 
 class Station(Site):
     """Ground station with a specific visibility mask."""
-    def __init__(self, name, lat, lon, alt_m=0, min_elevation=10.0):
+    def __init__(self, name, lat, lon, alt_m=0, min_elevation=10.0, antennas=1, setup_sec=0.0):
+        """
+        :param antennas: contacts the station can hold at the same time
+        :param setup_sec: slew/reconfiguration time between two contacts of one antenna [sec]
+        """
         super().__init__(name, lat, lon, alt_m)
         self.min_elevation = min_elevation
+        self.antennas = antennas
+        self.setup_sec = setup_sec
 
 class ROI(Site):
     """Target region for imaging or analysis."""
@@ -0,0 +1,241 @@
+'''
+Created on Oct 19, 2026
+
+Analytic ground-track solver with J2 secular rates
+(Do not use GMAT environment)
+    - nodal period and longitude shift per revolution
+    - repeat ground track solutions (R revolutions in D days)
+    - maximum revisit gap by latitude
+Every function is vectorized: altitudes/inclinations can be numpy arrays (grids).
+Circular (or near circular) orbits, spherical Earth.
+[Ref] Vallado - Sec. 9.6 / 11.4 ; Larson & Wertz - Sec. 7.2
+
+@author: mcvalenti
+'''
+
+import numpy as np
+import constants as cts
+from analytics import compute_Lmax
+
+# Seconds in a solar day (cts.secinday is the sidereal day)
+SOLAR_DAY_SEC = 86400.0
+
+
+def j2_secular_rates(a, e, i):
+    """
+    First order J2 secular rates.
+    :param a: semi-major axis [km]
+    :param e: eccentricity
+    :param i: inclination [deg]
+    :return: raan_dot, argp_dot, mean_anomaly_dot [rad/s]
+    """
+    a = np.asarray(a, dtype=float)
+    e = np.asarray(e, dtype=float)
+    i = np.radians(i)
+    n = np.sqrt(cts.mu_e / a**3)
+    p = a * (1 - e**2)
+    k = 1.5 * cts.J2 * (cts.Re / p)**2 * n
+    sin2 = np.sin(i)**2
+
+    raan_dot = -k * np.cos(i)
+    argp_dot = k * (2 - 2.5 * sin2)
+    m_dot = n + k * np.sqrt(1 - e**2) * (1 - 1.5 * sin2)
+    return raan_dot, argp_dot, m_dot
+
+
+def nodal_period(a, e, i):
+    """Time between consecutive ascending nodes [sec]"""
+    _, argp_dot, m_dot = j2_secular_rates(a, e, i)
+    return 2 * np.pi / (argp_dot + m_dot)
+
+
+def longitude_shift_per_rev(a, e, i):
+    """
+    Westward shift of the ascending node longitude per revolution [deg]:
+    Earth rotation minus the J2 nodal regression during one nodal period.
+    """
+    raan_dot, _, _ = j2_secular_rates(a, e, i)
+    return np.degrees((cts.omega_earth - raan_dot) * nodal_period(a, e, i))
+
+
+def revs_per_day(a, e, i):
+    """Nodal revolutions per nodal day (ground track repeats when this is R/D)"""
+    raan_dot, argp_dot, m_dot = j2_secular_rates(a, e, i)
+    return (argp_dot + m_dot) / (cts.omega_earth - raan_dot)
+
+
+def nodal_day(a, e, i):
+    """Time for the Earth to turn once relative to the orbit plane [sec]"""
+    raan_dot, _, _ = j2_secular_rates(a, e, i)
+    return 2 * np.pi / (cts.omega_earth - raan_dot)
+
+
+def repeat_altitude(revs, days, inc, e=0.0, alt_bounds=(150.0, 3000.0), iterations=60):
+    """
+    Altitude of the repeat ground track with 'revs' revolutions in 'days' nodal days.
+    Vectorized bisection (revs_per_day decreases with altitude).
+    :return: altitude [km], NaN when outside alt_bounds
+    """
+    target = np.asarray(revs, dtype=float) / np.asarray(days, dtype=float)
+    inc = np.asarray(inc, dtype=float)
+    shape = np.broadcast(target, inc, np.asarray(e)).shape
+    lo = np.full(shape, cts.Re + alt_bounds[0])
+    hi = np.full(shape, cts.Re + alt_bounds[1])
+
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        above = revs_per_day(mid, e, inc) > target
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+
+    a = 0.5 * (lo + hi)
+    valid = (revs_per_day(cts.Re + alt_bounds[0], e, inc) >= target) & \
+            (revs_per_day(cts.Re + alt_bounds[1], e, inc) <= target)
+    return np.where(valid, a - cts.Re, np.nan)
+
+
+def repeat_solutions(alt_min, alt_max, inclinations, max_days, e=0.0):
+    """
+    Every repeat ground track (R revs / D days, R and D coprime, D <= max_days)
+    between two altitudes, for each inclination.
+    :return: dict of arrays: revs, days, inc [deg], altitude [km], shift [deg/rev]
+    """
+    inclinations = np.atleast_1d(np.asarray(inclinations, dtype=float))
+    days = np.arange(1, max_days + 1)
+
+    # Revolutions per day covered by the altitude band (any inclination)
+    rpd = revs_per_day(cts.Re + np.array([alt_max, alt_min])[:, None], e, inclinations[None, :])
+    r_min = np.floor(rpd.min() * days)
+    r_max = np.ceil(rpd.max() * days)
+
+    counts = (r_max - r_min + 1).astype(int)
+    d_all = np.repeat(days, counts)
+    r_all = np.concatenate([np.arange(lo, hi + 1) for lo, hi in zip(r_min, r_max)])
+    coprime = np.gcd(r_all.astype(int), d_all) == 1
+    r_all, d_all = r_all[coprime], d_all[coprime]
+
+    # Pairs x inclinations
+    R = np.repeat(r_all, len(inclinations))
+    D = np.repeat(d_all, len(inclinations))
+    I = np.tile(inclinations, len(r_all))
+    alt = repeat_altitude(R, D, I, e, alt_bounds=(alt_min, alt_max))
+
+    keep = np.isfinite(alt)
+    alt = alt[keep]
+    return {
+        'revs': R[keep].astype(int),
+        'days': D[keep],
+        'inc': I[keep],
+        'altitude': alt,
+        'shift': longitude_shift_per_rev(cts.Re + alt, e, I[keep])
+    }
+
+
+def nearest_repeat(altitudes, inclinations, max_days, e=0.0):
+    """
+    Closest repeat ratio R/D (D <= max_days) for every point of an altitude/inclination
+    grid, with the ground track closure error after D days.
+    :return: dict of arrays broadcast over the grid: revs, days,
+             closure_km (equatorial distance between the track and its repeat)
+    """
+    alt = np.asarray(altitudes, dtype=float)
+    inc = np.asarray(inclinations, dtype=float)
+    ratio = revs_per_day(cts.Re + alt, e, inc)
+    shift_rad = np.radians(longitude_shift_per_rev(cts.Re + alt, e, inc))
+
+    days = np.arange(1, max_days + 1).reshape((-1,) + (1,) * ratio.ndim)
+    revs = np.round(ratio * days)
+    closure_km = np.abs(ratio * days - revs) * shift_rad * cts.Re
+
+    best = np.argmin(closure_km, axis=0)
+    take = lambda arr: np.take_along_axis(np.broadcast_to(arr, closure_km.shape), best[None], axis=0)[0]
+    return {
+        'revs': take(revs).astype(int),
+        'days': take(days),
+        'closure_km': take(closure_km)
+    }
+
+
+def revisit_gaps(altitude, inc, elevation_min, latitudes=None, horizon_days=None,
+                 n_lon=360, e=0.0, cyclic=False, iterations=3):
+    """
+    Maximum and mean revisit gap by latitude for one satellite (circular orbit).
+    Works in the frame of the orbit plane (which regresses with J2), where the
+    track is a fixed great circle and the ground point rotates at the relative rate
+    w = omega_earth - raan_dot. For every revolution the time of closest approach
+    to each point is found by fixed-point iteration, and the point is seen when its
+    distance to the orbit plane is below Lmax (analytics.compute_Lmax).
+    Vectorized over longitudes and revolutions, for each latitude.
+    :param altitude: [km]
+    :param inc: inclination [deg]
+    :param elevation_min: minimum elevation [deg]
+    :param latitudes: [deg], default every 5 deg between -85 and 85
+    :param horizon_days: analysis span [days] (use the repeat cycle D when known).
+                         Default: 1 day.
+    :param n_lon: longitude samples per latitude
+    :param cyclic: also count the gap from the last pass to the first one of the next
+                   cycle (only meaningful when horizon_days is an exact repeat cycle)
+    :return: dict: latitude [deg], max_gap_h, mean_gap_h (inf/NaN where never seen),
+                   coverage (fraction of longitudes seen at least once)
+    """
+    if latitudes is None:
+        latitudes = np.arange(-85.0, 86.0, 5.0)
+    latitudes = np.atleast_1d(np.asarray(latitudes, dtype=float))
+    horizon_sec = (horizon_days if horizon_days else 1.0) * SOLAR_DAY_SEC
+
+    a = cts.Re + altitude
+    raan_dot, argp_dot, m_dot = j2_secular_rates(a, e, inc)
+    u_dot = argp_dot + m_dot
+    w = cts.omega_earth - raan_dot
+    T_N = 2 * np.pi / u_dot
+    Lmax = np.radians(compute_Lmax(altitude, elevation_min))
+
+    # Orbit plane frame: node along X, pole (0, -sin i, cos i)
+    i_rad = np.radians(inc)
+    n_vec = np.array([1.0, 0.0, 0.0])
+    m_vec = np.array([0.0, np.cos(i_rad), np.sin(i_rad)])
+    pole = np.array([0.0, -np.sin(i_rad), np.cos(i_rad)])
+
+    t_node = np.arange(int(np.ceil(horizon_sec / T_N)) + 1) * T_N     # (n_rev,)
+    lons = np.linspace(-np.pi, np.pi, n_lon, endpoint=False)[:, None]   # (n_lon, 1)
+
+    max_gap = np.empty(len(latitudes))
+    mean_gap = np.empty(len(latitudes))
+    coverage = np.empty(len(latitudes))
+
+    for j, lat in enumerate(np.radians(latitudes)):
+        # Closest approach of every revolution: t = t_node + u_point(t) / u_dot
+        t = np.broadcast_to(t_node, (n_lon, len(t_node)))
+        for _ in range(iterations + 1):
+            ang = lons + w * t
+            x = np.stack([np.cos(lat) * np.cos(ang), np.cos(lat) * np.sin(ang),
+                          np.full_like(ang, np.sin(lat))], -1)
+            u = np.arctan2(x @ m_vec, x @ n_vec)
+            t = t_node + u / u_dot
+
+        dist = np.abs(np.arcsin(np.clip(x @ pole, -1, 1)))
+        t_seen = np.where((dist <= Lmax) & (t >= 0) & (t <= horizon_sec), t, np.inf)
+
+        t_sorted = np.sort(t_seen, axis=1)
+        n_seen = np.sum(np.isfinite(t_sorted), axis=1)
+        first = t_sorted[:, 0]
+        last = np.take_along_axis(t_sorted, np.maximum(n_seen - 1, 0)[:, None], axis=1)[:, 0]
+        with np.errstate(invalid='ignore'):
+            gaps = np.diff(t_sorted, axis=1)
+            wrap = first + horizon_sec - last
+        gaps = np.where(np.isfinite(gaps), gaps, 0.0).max(axis=1)
+        if cyclic:
+            gaps = np.maximum(gaps, wrap)
+        point_max = np.where(n_seen > 0, gaps, np.inf)
+
+        seen = n_seen > 0
+        coverage[j] = np.mean(seen)
+        max_gap[j] = point_max.max() / 3600.0
+        mean_gap[j] = (horizon_sec / n_seen[seen]).mean() / 3600.0 if seen.any() else np.nan
+
+    return {
+        'latitude': latitudes,
+        'max_gap_h': max_gap,
+        'mean_gap_h': mean_gap,
+        'coverage': coverage
+    }
@@ -0,0 +1,251 @@
+'''
+Created on Oct 19, 2026
+
+Inter-satellite links (ISL): time-varying visibility graph and latency routing
+(Do not use GMAT environment)
+    - links between satellites closer than a maximum range whose line of sight
+      clears the Earth plus an atmosphere grazing height
+    - neighbour pruning with a uniform grid (cell = maximum range): only pairs
+      in the same or adjacent cells are tested, all pairs of one step at once
+    - ground-to-ground routes of minimum latency (Dijkstra, heapq) over time
+Positions come from a constellation cube (n_sats, n_steps, 3+), e.g.
+Propagator.run_many, or analytically from Walker elements (walker_positions).
+
+@author: mcvalenti
+'''
+
+import heapq
+import numpy as np
+import pandas as pd
+import constants as cts
+import frames
+from ground_track import j2_secular_rates
+from time_grid import TimeGrid
+
+# The 13 "forward" neighbour cells; with the own cell every pair is visited once
+_NEIGHBOURS = np.array([(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+                        if (dx, dy, dz) > (0, 0, 0)])
+
+
+def walker_positions(elements, times):
+    """
+    Inertial positions of circular orbits with J2 secular drift (RAAN and
+    argument of latitude), vectorized over satellites and times.
+    :param elements: dict of arrays sma [km], inc, raan, aop, ta [deg] (constellation_env.walker_elements)
+    :param times: offsets from the element epoch (n_steps,) [sec]
+    :return: (n_sats, n_steps, 3) [km]
+    """
+    a = np.asarray(elements['sma'], dtype=float)[:, None]
+    inc = np.asarray(elements['inc'], dtype=float)[:, None]
+    raan_dot, argp_dot, m_dot = j2_secular_rates(a, 0.0, inc)
+    t = np.asarray(times, dtype=float)[None, :]
+
+    raan = np.radians(np.asarray(elements['raan'], dtype=float))[:, None] + raan_dot * t
+    u = np.radians(np.asarray(elements['aop'], dtype=float) + np.asarray(elements['ta'], dtype=float))[:, None] \
+        + (argp_dot + m_dot) * t
+    i = np.radians(inc)
+    return a[..., None] * np.stack([np.cos(raan) * np.cos(u) - np.sin(raan) * np.sin(u) * np.cos(i),
+                                    np.sin(raan) * np.cos(u) + np.cos(raan) * np.sin(u) * np.cos(i),
+                                    np.broadcast_to(np.sin(u) * np.sin(i), raan.shape)], -1)
+
+
+def line_of_sight(p, q, min_radius):
+    """True where the segment p-q stays above min_radius [km] (p, q: (M, 3))."""
+    d = q - p
+    t = np.clip(-np.sum(p * d, axis=1) / np.maximum(np.sum(d * d, axis=1), 1e-12), 0.0, 1.0)
+    closest = p + t[:, None] * d
+    return np.sum(closest * closest, axis=1) > min_radius**2
+
+
+def candidate_pairs(r, cell_size):
+    """
+    Pairs (i, j), i != j, of positions in the same or adjacent grid cells.
+    :param r: positions (N, 3) [km]
+    :return: i, j index arrays (each unordered pair once)
+    """
+    cells = np.floor(r / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    dims = cells.max(axis=0) + 2
+    key = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+
+    pairs_i, pairs_j = [], []
+    offsets = [np.zeros(3, dtype=np.int64)] + list(_NEIGHBOURS)
+    for n, off in enumerate(offsets):
+        c = cells + off
+        nkey = (c[:, 0] * dims[1] + c[:, 1]) * dims[2] + c[:, 2]
+        lo = np.searchsorted(sorted_key, nkey, side='left')
+        hi = np.searchsorted(sorted_key, nkey, side='right')
+        counts = hi - lo
+        total = counts.sum()
+        if total == 0:
+            continue
+        i = np.repeat(np.arange(len(r)), counts)
+        j = order[np.repeat(lo, counts) + np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)]
+        if n == 0:
+            keep = i < j          # own cell: each pair once, no self links
+            i, j = i[keep], j[keep]
+        pairs_i.append(i)
+        pairs_j.append(j)
+    if not pairs_i:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+def isl_edges(r, max_range_km=5000.0, grazing_height_km=80.0):
+    """
+    ISL graph of one time step.
+    :param r: positions (N, 3) [km]
+    :return: i, j, distance [km] of every usable link
+    """
+    i, j = candidate_pairs(r, max_range_km)
+    dist = np.linalg.norm(r[i] - r[j], axis=1)
+    keep = dist <= max_range_km
+    i, j, dist = i[keep], j[keep], dist[keep]
+    keep = line_of_sight(r[i], r[j], cts.Re + grazing_height_km)
+    return i[keep], j[keep], dist[keep]
+
+
+def ground_links(r, r_site, min_elevation=25.0):
+    """
+    Satellites visible from a ground point.
+    :param r: satellite positions (N, 3) [km]
+    :param r_site: site position (3,) [km], same frame
+    :return: satellite indexes, distance [km]
+    """
+    rho = r - r_site
+    dist = np.linalg.norm(rho, axis=1)
+    sin_el = rho @ (r_site / np.linalg.norm(r_site)) / dist
+    visible = np.nonzero(sin_el >= np.sin(np.radians(min_elevation)))[0]
+    return visible, dist[visible]
+
+
+def shortest_path(n_nodes, i, j, weight, source, target):
+    """
+    Dijkstra (binary heap) on an undirected graph given by edge arrays.
+    :return: total weight, list of nodes (inf, [] when unreachable)
+    """
+    # Adjacency in CSR form
+    src = np.concatenate([i, j])
+    dst = np.concatenate([j, i])
+    w = np.concatenate([weight, weight])
+    order = np.argsort(src, kind='stable')
+    dst, w = dst[order], w[order]
+    start = np.searchsorted(src[order], np.arange(n_nodes + 1))
+
+    best = np.full(n_nodes, np.inf)
+    previous = np.full(n_nodes, -1)
+    best[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if node == target:
+            break
+        if d > best[node]:
+            continue
+        for k in range(start[node], start[node + 1]):
+            nd = d + w[k]
+            if nd < best[dst[k]]:
+                best[dst[k]] = nd
+                previous[dst[k]] = node
+                heapq.heappush(heap, (nd, dst[k]))
+
+    if not np.isfinite(best[target]):
+        return np.inf, []
+    path = [target]
+    while path[-1] != source:
+        path.append(previous[path[-1]])
+    return best[target], path[::-1]
+
+
+class ISLNetwork:
+    """
+    Time-varying ISL graph of a constellation and ground-to-ground routing.
+    """
+    def __init__(self, positions, times, start_epoch, max_range_km=5000.0, grazing_height_km=80.0,
+                 min_elevation=25.0):
+        """
+        :param positions: inertial cube (n_sats, n_steps, 3+) [km] (Propagator.run_many or walker_positions)
+        :param times: offsets of the steps [sec]
+        :param start_epoch: Astropy Time of t=0 (to place the ground sites)
+        :param max_range_km: maximum ISL range [km]
+        :param grazing_height_km: minimum height of the line of sight [km]
+        :param min_elevation: minimum elevation of the ground-satellite links [deg]
+        """
+        self.positions = np.asarray(positions)[..., :3]
+        self.times = np.asarray(times, dtype=float)
+        self.start_epoch = start_epoch
+        self.grid = TimeGrid.from_time(start_epoch, self.times)
+        self.max_range_km = max_range_km
+        self.grazing_height_km = grazing_height_km
+        self.min_elevation = min_elevation
+        self._graphs = {}
+
+    @property
+    def n_sats(self):
+        return self.positions.shape[0]
+
+    def graph(self, step):
+        """ISL edges (i, j, distance [km]) of one step, cached."""
+        if step not in self._graphs:
+            self._graphs[step] = isl_edges(self.positions[:, step], self.max_range_km, self.grazing_height_km)
+        return self._graphs[step]
+
+    def site_position(self, site, step):
+        """Inertial position of a Site at one step [km]"""
+        jd1, jd2 = self.grid[step].jd
+        r_ecef = frames.geodetic_to_ecef(site.lat, site.lon, site.alt_m / 1000.0)
+        return frames.eci_to_ecef_matrix(jd1[0], jd2[0]).T @ r_ecef
+
+    def route(self, site_a, site_b, step):
+        """
+        Minimum latency route between two sites at one step.
+        :return: latency [ms], satellite indexes of the route ([] if no route)
+        """
+        i, j, dist = self.graph(step)
+        r = self.positions[:, step]
+        source, target = self.n_sats, self.n_sats + 1
+        up, d_up = ground_links(r, self.site_position(site_a, step), self.min_elevation)
+        down, d_down = ground_links(r, self.site_position(site_b, step), self.min_elevation)
+
+        all_i = np.concatenate([i, np.full(len(up), source), np.full(len(down), target)])
+        all_j = np.concatenate([j, up, down])
+        all_d = np.concatenate([dist, d_up, d_down])
+        total, path = shortest_path(self.n_sats + 2, all_i, all_j, all_d, source, target)
+        return total / cts.c_light * 1000.0, [int(node) for node in path[1:-1]]
+
+    def routes(self, site_a, site_b, steps=None):
+        """
+        Routes over time.
+        :return: DataFrame: time_sec, latency_ms, hops (ISLs), path
+        """
+        steps = range(len(self.times)) if steps is None else steps
+        rows = []
+        for step in steps:
+            latency, path = self.route(site_a, site_b, step)
+            rows.append((self.times[step], latency, max(len(path) - 1, 0), path))
+        return pd.DataFrame(rows, columns=['time_sec', 'latency_ms', 'hops', 'path'])
+
+    def degree(self, step):
+        """Number of ISLs of every satellite at one step."""
+        i, j, _ = self.graph(step)
+        return np.bincount(np.concatenate([i, j]), minlength=self.n_sats)
+
+
+if __name__ == "__main__":
+    from astropy.time import Time
+    from constellation_env import walker_elements
+    from ground_segment import Site
+
+    # OneWeb-like shell: 12 planes x 49 satellites, 1200 km, 87.9 deg
+    elements = walker_elements(588, 12, 1, 87.9, cts.Re + 1200.0)
+    times = np.arange(0, 3600, 60.0)
+    network = ISLNetwork(walker_positions(elements, times), times, Time("2026-02-10T12:00:00"),
+                         max_range_km=4000.0)
+
+    print(f"{network.n_sats} satellites, mean degree {np.round(network.degree(0).mean(), 1)}")
+
+    london = Site("London", 51.5, -0.13)
+    buenos_aires = Site("BuenosAires", -34.6, -58.48)
+    print(network.routes(london, buenos_aires).head())
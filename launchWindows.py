@@ -1,36 +1,57 @@
 '''
 Created on 20 Apr. 2026
 
+Launch windows into a target orbit plane from a launch site.
+Every day of a date range (GMST evaluated vectorized for all days at once),
+for ascending (ASC) and/or descending (DESC) launches, and for one target
+RAAN or every plane of a SatelliteConstellation (optionally drifting with J2).
+
 @author: mvalenti
 '''
 
 import numpy as np
+import pandas as pd
 from astropy.time import Time
-import astropy.units as u
+import frames
 
 deg2rad=np.pi/180.0
 omega_earth = 15.041067 # [deg/hour]
+# Solar hours between two consecutive sidereal returns
+SIDEREAL_HOURS = 360.0 / omega_earth
 
 def launch_azimuth(orb_inc,  site_lat, launch_dir):
     """
     Compute Site Launch Azimuth (Beta)
     orb_inc: inclination of the desired orbit [deg]
     site_lat: Latitude of the Launch Site [deg]
+    launch_dir: 'ASC' or 'DESC'
+    return: Beta [rad] (vectorized on inclination and latitude)
     """
     beta0 = np.arcsin(np.cos(orb_inc*deg2rad)/np.cos(site_lat*deg2rad))
 
     if launch_dir == 'ASC':
-        beta = beta0 if beta0 > 0 else 2*np.pi+beta0
+        beta = np.where(beta0 > 0, beta0, 2*np.pi+beta0)
     elif launch_dir == 'DESC':
         beta = np.pi - beta0
+    else:
+        raise ValueError(f"Unknown launch direction: {launch_dir} (use 'ASC' or 'DESC')")
     return beta
 
-def longitude_nearest(site_azimuth, orb_inc):
+def longitude_nearest(site_lat, orb_inc, launch_dir):
     """
-    Compute the angle in the equatorial plane from the Ascending node 
+    Compute the angle in the equatorial plane from the Ascending node
     to the longitude of the launch site (delta) - [Wertz]
+    Signed, so retrograde orbits (delta < 0) and descending launches
+    (delta = 180 - delta_asc) are handled.
+    return: delta [deg]
     """
-    return np.arccos(np.cos(site_azimuth*deg2rad)/np.sin(orb_inc*deg2rad))
+    lat = site_lat*deg2rad
+    inc = orb_inc*deg2rad
+    arg_lat = np.arcsin(np.sin(lat)/np.sin(inc))     # argument of latitude of the site (ASC)
+    delta = np.arctan2(np.cos(inc)*np.sin(arg_lat), np.cos(arg_lat))/deg2rad
+    if launch_dir == 'DESC':
+        delta = 180.0 - delta
+    return delta
 
 def gmst_launch(RAAN, long_near, site_lon):
     """
@@ -38,34 +59,108 @@ def gmst_launch(RAAN, long_near, site_lon):
     """
     return RAAN+long_near-site_lon
 
+def plane_raan(constellation, planes=None):
+    """
+    RAAN of the planes of a SatelliteConstellation (requires generate_walker).
+    :param planes: plane index or list of indexes (default: every plane)
+    :return: plane indexes, RAAN [deg]
+    """
+    if constellation.elements is None:
+        raise ValueError(f"{constellation.name}: call generate_walker() before searching launch windows")
+    all_planes, first = np.unique(constellation.elements['plane'], return_index=True)
+    raan = constellation.elements['raan'][first]
+    if planes is not None:
+        keep = np.isin(all_planes, np.atleast_1d(planes))
+        all_planes, raan = all_planes[keep], raan[keep]
+    return all_planes, raan
+
+def launch_windows(site, start, end, inc=None, raan=None, constellation=None, planes=None,
+                   directions=('ASC', 'DESC'), raan_epoch=None, raan_rate=0.0):
+    """
+    Every launch window into the target plane(s) between two dates.
+    :param site: ground_segment.Site (lat, lon [deg])
+    :param start, end: date range (Astropy Time or string)
+    :param inc: target inclination [deg] (default: constellation inclination)
+    :param raan: target RAAN [deg], scalar or array of planes
+    :param constellation: SatelliteConstellation, target planes from its elements
+    :param planes: plane index(es) of the constellation (default: all)
+    :param directions: 'ASC' and/or 'DESC'
+    :param raan_epoch: epoch of the RAAN values (default: start)
+    :param raan_rate: drift of the target planes [deg/day] (e.g. analytics.J2_RAAN_drift)
+    :return: DataFrame with one row per window, sorted by time:
+             launch_time, jd, plane, direction, azimuth [deg], raan [deg]
+    """
+    start = Time(start, scale='utc')
+    end = Time(end, scale='utc')
+    raan_epoch = Time(raan_epoch, scale='utc') if raan_epoch is not None else start
+
+    if constellation is not None:
+        plane_ids, raan = plane_raan(constellation, planes)
+        inc = float(constellation.inclination_deg) if inc is None else inc
+    else:
+        raan = np.atleast_1d(np.asarray(raan, dtype=float))
+        plane_ids = np.arange(len(raan))
+    if inc is None:
+        raise ValueError("Target inclination is required")
+    if np.abs(np.sin(site.lat*deg2rad)) > np.sin(inc*deg2rad):
+        raise ValueError(f"Inclination {inc} deg is not reachable by a direct launch from latitude {site.lat} deg")
+
+    # 0h UT of every day (two-part JD), and GMST of all of them at once
+    day0 = np.floor(start.jd - 0.5) + 0.5
+    jd_days = np.arange(day0, end.jd)
+    gmst0 = np.degrees(frames.gmst(jd_days))[None, :]              # (1, n_days)
+    raan0 = raan[:, None] + raan_rate * (jd_days[None, :] - raan_epoch.jd)   # (n_planes, n_days)
+
+    rows = []
+    for launch_dir in directions:
+        delta = longitude_nearest(site.lat, inc, launch_dir)
+        beta = float(np.degrees(launch_azimuth(inc, site.lat, launch_dir)))
+        ut_hours = np.zeros_like(raan0)
+        # Second pass accounts for the plane drift during the day
+        for _ in range(2):
+            raan_t = raan0 + raan_rate * ut_hours / 24.0
+            ut_hours = np.mod(gmst_launch(raan_t, delta, site.lon) - gmst0, 360.0) / omega_earth
+        # A second window the same day when the plane returns before 24 h
+        for ut in (ut_hours, ut_hours + SIDEREAL_HOURS):
+            plane_idx, day_idx = np.nonzero(ut < 24.0)
+            jd = jd_days[day_idx] + ut[plane_idx, day_idx] / 24.0
+            rows.append(pd.DataFrame({
+                'jd': jd,
+                'plane': plane_ids[plane_idx],
+                'direction': launch_dir,
+                'azimuth': beta,
+                'raan': np.mod(raan0[plane_idx, day_idx] + raan_rate * ut[plane_idx, day_idx] / 24.0, 360.0)
+            }))
+
+    windows = pd.concat(rows, ignore_index=True)
+    windows = windows[(windows['jd'] >= start.jd) & (windows['jd'] <= end.jd)]
+    windows = windows.sort_values('jd', ignore_index=True)
+    windows.insert(0, 'launch_time', Time(windows['jd'].to_numpy(), format='jd', scale='utc').datetime64)
+    return windows
+
+
+if __name__ == "__main__":
+    from ground_segment import Site
+
+    # Space X - Launch Site (Vandenberg)
+    vandenberg = Site("Vandenberg", 34.633, -120.613, 112)
+
+    # Orbit Configuration
+    orb_inc = 97.4 # [deg]
+    RAAN = 120.0
+
+    # Scenario
+    launch_direction='DESC' # ['ASC' or 'DESC']
+    date_str= '2027-01-27 00:00:00'
 
-# Space X - Launch Site (Vandenberg)
-lat_site = 34.633 # [deg]
-lon_site = -120.613 # [deg]
-h_site = 0.112 # [m]
-
-# Orbit Configuration
-orb_inc = 97.4 # [deg]
-
-# Scenario
-launch_direction='DESC' # ['ASC' or 'DESC']
-date_str= '2027-01-27 00:00:00'
-t0hs=Time(date_str, scale='utc')
-
-Beta=launch_azimuth(orb_inc,lat_site, launch_direction)
-delta=longitude_nearest(Beta/deg2rad, orb_inc)
-RAAN = 120.0
-gmst_launch = gmst_launch(RAAN, delta/deg2rad, lon_site)
-gmst0hs = t0hs.sidereal_time('mean', 'greenwich')
-gmst0hs_deg = gmst0hs.deg
-delta_gmst = (gmst_launch - gmst0hs_deg) % 360
-ut_hours = delta_gmst / omega_earth
-print('============')
-print ('RESULTS')
-print('============')
-print (f'Launch Azimut Beta: {np.round(Beta/deg2rad,2)}')
-print (f'Longitude angle from the nearest node to the site, delta: {delta/deg2rad}')
-print(f'GMST Launch: {gmst_launch}')
-print(f'GMST 0hs: {gmst0hs_deg}')
-print(f'Delta GMST: {delta_gmst}')
-print (f'Launch UT: {np.round(ut_hours,2)}')
+    Beta=launch_azimuth(orb_inc, vandenberg.lat, launch_direction)
+    delta=longitude_nearest(vandenberg.lat, orb_inc, launch_direction)
+    day = launch_windows(vandenberg, date_str, '2027-01-28 00:00:00', inc=orb_inc, raan=RAAN,
+                         directions=(launch_direction,))
+    print('============')
+    print ('RESULTS')
+    print('============')
+    print (f'Launch Azimut Beta: {np.round(Beta/deg2rad,2)}')
+    print (f'Longitude angle from the ascending node to the site, delta: {np.round(delta,4)}')
+    print(f'GMST Launch: {gmst_launch(RAAN, delta, vandenberg.lon) % 360}')
+    print(day)
@@ -0,0 +1,171 @@
+'''
+Created on Oct 19, 2026
+
+Sun-synchronous and frozen orbit design (J2/J3 secular theory)
+(Do not use GMAT environment)
+    - SSO inclination for an altitude (and SSO altitude for an inclination)
+    - frozen eccentricity / argument of perigee
+    - LTAN evolution over the mission life and inclination tolerance
+    - RAAN for a desired LTAN at an epoch
+Every function is vectorized: altitudes/inclinations can be numpy arrays,
+so whole altitude ranges are designed at once.
+Node rates come from analytics.J2_RAAN_drift [deg/day].
+[Ref] Vallado - Sec. 11.4 ; Larson & Wertz - Sec. 6.2 / 7.2
+
+@author: mcvalenti
+'''
+
+import numpy as np
+import constants as cts
+import frames
+from analytics import J2_RAAN_drift, compute_sma
+
+# Mean motion of the Sun: one revolution per tropical year [deg/day]
+SSO_RATE = 360.0 / 365.2422
+# Conversion of a node drift relative to the Sun [deg] to local time [min]
+MIN_PER_DEG = 4.0
+
+
+def sso_inclination(altitude, e=0.0):
+    """
+    Inclination that makes the node precess with the mean Sun.
+    cos(i) = SSO_RATE / RAAN drift at i=0
+    :param altitude: [km]
+    :param e: eccentricity
+    :return: inclination [deg], NaN where no SSO exists (too high orbits)
+    """
+    a = cts.Re + np.asarray(altitude, dtype=float)
+    cos_i = SSO_RATE / J2_RAAN_drift(a, e, 0.0)
+    with np.errstate(invalid='ignore'):
+        return np.where(np.abs(cos_i) <= 1.0, np.degrees(np.arccos(cos_i)), np.nan)
+
+
+def sso_altitude(inc, e=0.0):
+    """
+    Altitude of the sun-synchronous orbit with inclination 'inc' (> 90 deg).
+    :param inc: inclination [deg]
+    :return: altitude [km], NaN for prograde inclinations
+    """
+    drift_i0 = SSO_RATE / np.cos(np.radians(inc))         # RAAN drift at i=0 [deg/day]
+    with np.errstate(invalid='ignore'):
+        # J2_RAAN_drift(a, e, 0) = -2.06474e14 a^(-7/2) (1-e^2)^(-2)
+        a = (-2.06474e14 / (drift_i0 * (1 - e**2)**2))**(2.0 / 7.0)
+    return np.where(drift_i0 < 0, a - cts.Re, np.nan)
+
+
+def sso_from_period(period_min, e=0.0):
+    """
+    SSO design from the orbital period.
+    :param period_min: period [min]
+    :return: altitude [km], inclination [deg]
+    """
+    altitude = compute_sma(np.asarray(period_min, dtype=float)) - cts.Re
+    return altitude, sso_inclination(altitude, e)
+
+
+def frozen_orbit(altitude, inc):
+    """
+    Frozen eccentricity (J2/J3 balance): perigee fixed at the northern
+    most point, so eccentricity and argument of perigee stay constant.
+    e = -0.5 (J3/J2) (Re/a) sin(i), aop = 90 deg
+    :param altitude: [km]
+    :param inc: inclination [deg]
+    :return: eccentricity, argument of perigee [deg]
+    """
+    a = cts.Re + np.asarray(altitude, dtype=float)
+    e = -0.5 * (cts.J3 / cts.J2) * (cts.Re / a) * np.sin(np.radians(inc))
+    return e, np.full_like(e, 90.0)
+
+
+def ltan_drift(altitude, inc, e=0.0):
+    """
+    Drift of the Local Time of the Ascending Node [min/day]:
+    node precession minus the mean motion of the Sun.
+    """
+    a = cts.Re + np.asarray(altitude, dtype=float)
+    return (J2_RAAN_drift(a, e, inc) - SSO_RATE) * MIN_PER_DEG
+
+
+def ltan_evolution(ltan_hours, altitude, inc, days, e=0.0, decay_km_per_day=0.0):
+    """
+    LTAN over the mission life (mean Sun, linear altitude decay).
+    Inputs broadcast: e.g. altitude (N, 1) against days (1, M) gives (N, M).
+    :param ltan_hours: LTAN at injection [h]
+    :param altitude: altitude at injection [km]
+    :param inc: inclination [deg]
+    :param days: elapsed days
+    :param decay_km_per_day: altitude loss rate [km/day] (e.g. from analytics.drag_decay_per_rev)
+    :return: LTAN [h], wrapped to [0, 24)
+    """
+    days = np.asarray(days, dtype=float)
+    h0 = np.asarray(altitude, dtype=float)
+    drift0 = ltan_drift(h0, inc, e)
+    if np.all(decay_km_per_day == 0):
+        offset_min = drift0 * days
+    else:
+        # Mean drift rate over the decay (trapezoid between initial and final altitude)
+        drift1 = ltan_drift(h0 - decay_km_per_day * days, inc, e)
+        offset_min = 0.5 * (drift0 + drift1) * days
+    return np.mod(ltan_hours + offset_min / 60.0, 24.0)
+
+
+def inclination_tolerance(altitude, max_ltan_drift_min, mission_days, e=0.0):
+    """
+    Maximum injection inclination error that keeps the LTAN drift below a limit
+    over the mission (first order: d(RAAN drift)/di = -K sin i).
+    :param altitude: [km]
+    :param max_ltan_drift_min: allowed LTAN change [min]
+    :param mission_days: mission life [days]
+    :return: inclination tolerance [deg]
+    """
+    a = cts.Re + np.asarray(altitude, dtype=float)
+    inc = sso_inclination(altitude, e)
+    d_rate = np.abs(J2_RAAN_drift(a, e, 0.0) * np.sin(np.radians(inc)))   # [deg/day/rad]
+    delta_i = max_ltan_drift_min / MIN_PER_DEG / (d_rate * mission_days)
+    return np.degrees(delta_i)
+
+
+def raan_for_ltan(ltan_hours, epoch):
+    """
+    RAAN that places the ascending node at the LTAN, for an epoch.
+    RAAN = right ascension of the mean Sun + (LTAN - 12h) * 15 deg/h
+    The mean Sun is on the Greenwich meridian at 12h UT (mean solar time):
+    RA mean Sun = GMST - UT * 15 deg/h + 180 deg (no equation of time)
+    :param ltan_hours: [h]
+    :param epoch: Astropy Time
+    :return: RAAN [deg] in [0, 360)
+    """
+    jd1, jd2 = epoch.utc.jd1, epoch.utc.jd2
+    ut_hours = np.mod(np.mod(jd1 - 0.5, 1.0) + jd2, 1.0) * 24.0
+    ra_mean_sun = np.degrees(frames.gmst(jd1, jd2)) - ut_hours * 15.0 + 180.0
+    return np.mod(ra_mean_sun + (np.asarray(ltan_hours) - 12.0) * 15.0, 360.0)
+
+
+def design_sso(altitudes, ltan_hours=10.5, mission_years=5.0, max_ltan_drift_min=15.0,
+               frozen=True):
+    """
+    SSO design table over an altitude range.
+    :param altitudes: [km]
+    :param ltan_hours: nominal LTAN [h]
+    :param mission_years: mission life [years]
+    :param max_ltan_drift_min: allowed LTAN change over the mission [min]
+    :param frozen: use the frozen eccentricity (otherwise circular)
+    :return: dict of arrays: altitude, inc, ecc, aop, inc_tolerance, ltan_end
+    """
+    altitudes = np.atleast_1d(np.asarray(altitudes, dtype=float))
+    mission_days = mission_years * 365.25
+    inc = sso_inclination(altitudes)
+    if frozen:
+        ecc, aop = frozen_orbit(altitudes, inc)
+        inc = sso_inclination(altitudes, ecc)
+    else:
+        ecc, aop = np.zeros_like(altitudes), np.zeros_like(altitudes)
+
+    return {
+        'altitude': altitudes,
+        'inc': inc,
+        'ecc': ecc,
+        'aop': aop,
+        'inc_tolerance': inclination_tolerance(altitudes, max_ltan_drift_min, mission_days, ecc),
+        'ltan_end': ltan_evolution(ltan_hours, altitudes, inc, mission_days, ecc)
+    }
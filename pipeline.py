@@ -0,0 +1,224 @@
+'''
+Created on Oct 19, 2026
+
+Streaming pipeline: propagation -> transform -> access / coverage
+(Do not use GMAT environment)
+Propagator.run_stream (or any iterable of trajectory chunks [t, x, y, z, ...])
+feeds generator stages one chunk at a time:
+    earth_fixed      trajectory chunk -> StateChunk (TimeGrid, inertial and Earth fixed positions)
+    AccessStage      AOS/LOS of a Site; an open pass is carried over to the next chunk
+    CoverageStage    visible fraction and maximum revisit gap over a grid of ground points;
+                     the last visible time of every point is carried over
+Every stage yields the chunks it receives, so stages chain as generators and
+their results (stage.passes, stage.table()) can be read after every chunk.
+Memory is constant in the run length: one chunk plus the accumulators.
+Geometry uses frames (~1 km Earth orientation, as calculate_access_profiles).
+
+@author: mcvalenti
+'''
+
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+import pandas as pd
+import frames
+from ground_segment import Pass, PassTable
+from time_grid import TimeGrid
+
+# Ground points x time samples evaluated at once by CoverageStage
+COVERAGE_BLOCK = 2_000_000
+
+
+@dataclass
+class StateChunk:
+    """One chunk of a trajectory."""
+    grid: TimeGrid                       # epoch + offsets of the samples
+    r: np.ndarray                        # inertial positions (k, 3) [km]
+    r_ecef: np.ndarray                   # Earth fixed positions (k, 3) [km]
+    v: Optional[np.ndarray] = None       # inertial velocities (k, 3) [km/s]
+
+    @property
+    def times(self):
+        return self.grid.offsets
+
+
+def chunked(trajectory, chunk_steps=1440):
+    """Splits a trajectory array already in memory into chunks (run_stream layout)."""
+    for k in range(0, len(trajectory), chunk_steps):
+        yield trajectory[k:k + chunk_steps]
+
+
+def earth_fixed(chunks, epoch):
+    """
+    Transform stage: trajectory chunks [t, x, y, z(, vx, vy, vz)] -> StateChunk.
+    :param epoch: Astropy Time or ISO string of t=0
+    """
+    for data in chunks:
+        data = np.asarray(data, dtype=float)
+        grid = TimeGrid.from_time(epoch, data[:, 0])
+        yield StateChunk(grid, data[:, 1:4], grid.eci_to_ecef(data[:, 1:4]),
+                         data[:, 4:7] if data.shape[1] >= 7 else None)
+
+
+def pipeline(chunks, *stages):
+    """Chains stages: pipeline(src, a, b) is b(a(src))."""
+    for stage in stages:
+        chunks = stage(chunks)
+    return chunks
+
+
+def drain(chunks):
+    """Runs a pipeline to the end (results stay in the stages)."""
+    for _ in chunks:
+        pass
+
+
+class AccessStage:
+    """
+    Streaming AOS/LOS detection over a Site (same rules as calculate_access:
+    AOS at the first visible sample, LOS at the first sample below the mask,
+    a pass still open at the end of the run has no LOS and is not reported).
+    Frames: the Earth-fixed positions of earth_fixed (frames.py, ~1 km in LEO),
+    not the Astropy chain of calculate_access.
+    """
+    def __init__(self, site, satellite=""):
+        """
+        :param site: A Station or ROI object
+        :param satellite: name stored in the PassTable
+        """
+        self.site = site
+        self.satellite = satellite
+        self.min_elevation = getattr(site, 'min_elevation', 0.0)
+        self.passes = []
+        self._open = None          # (AOS offset [sec], max elevation) of a pass crossing chunks
+
+    def __call__(self, chunks):
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+
+    def update(self, chunk):
+        """Adds the passes closed inside the chunk; returns them."""
+        _, el, _ = frames.look_angles(chunk.r_ecef, self.site.lat, self.site.lon, self.site.alt_m / 1000.0)
+        t = chunk.times
+        edges = np.diff(np.r_[self._open is not None, el >= self.min_elevation, False].astype(np.int8))
+        starts = list(np.nonzero(edges == 1)[0])
+        stops = np.nonzero(edges == -1)[0]
+        if self._open is not None:
+            starts.insert(0, -1)   # pass carried from the previous chunk
+
+        closed = []
+        for k, i0 in enumerate(starts):
+            i1 = stops[k]
+            if i0 < 0:
+                t_aos, max_el = self._open
+                max_el = max(max_el, float(el[:i1].max())) if i1 > 0 else max_el
+            else:
+                t_aos, max_el = t[i0], float(el[i0:i1].max())
+            if i1 == len(t):
+                self._open = (t_aos, max_el)    # still visible at the end of the chunk
+                break
+            closed.append((t_aos, t[i1], max_el))
+        else:
+            self._open = None
+
+        if closed:
+            aos, los, max_el = map(np.array, zip(*closed))
+            grid = TimeGrid(chunk.grid.jd1, chunk.grid.jd2, np.r_[aos, los])
+            epochs = grid.datetime64().astype('datetime64[us]').tolist()
+            new = [Pass(aos=epochs[k], los=epochs[len(closed) + k], max_elevation=float(max_el[k]),
+                        duration_sec=float(los[k] - aos[k])) for k in range(len(closed))]
+            self.passes.extend(new)
+            return new
+        return []
+
+    def table(self):
+        """Passes found so far as a PassTable."""
+        return PassTable.from_passes(self.passes, self.satellite, self.site)
+
+
+class CoverageStage:
+    """
+    Streaming coverage of a grid of ground points: fraction of samples with
+    the satellite above the elevation mask, first access and maximum revisit gap.
+    """
+    def __init__(self, lat, lon, min_elevation=10.0):
+        """
+        :param lat, lon: ground points [deg] (same shape, e.g. from np.meshgrid)
+        :param min_elevation: elevation mask [deg]
+        """
+        self.lat = np.ravel(lat).astype(float)
+        self.lon = np.ravel(lon).astype(float)
+        self.sin_mask = np.sin(np.radians(min_elevation))
+        self.points = frames.geodetic_to_ecef(self.lat, self.lon)
+        lat_r, lon_r = np.radians(self.lat), np.radians(self.lon)
+        self.up = np.column_stack([np.cos(lat_r) * np.cos(lon_r), np.cos(lat_r) * np.sin(lon_r), np.sin(lat_r)])
+
+        n = len(self.lat)
+        self.samples = 0
+        self.visible = np.zeros(n, dtype=np.int64)
+        self.first_seen = np.full(n, np.nan)
+        self.last_seen = np.full(n, -np.inf)
+        self.max_gap = np.zeros(n)
+
+    def __call__(self, chunks):
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+
+    def update(self, chunk):
+        """Accumulates one chunk (in time blocks of COVERAGE_BLOCK point-samples)."""
+        block = max(1, COVERAGE_BLOCK // len(self.lat))
+        for b in range(0, len(chunk.times), block):
+            t = chunk.times[b:b + block]
+            rho = chunk.r_ecef[b:b + block, None, :] - self.points[None]          # (k, P, 3)
+            sin_el = np.einsum('kpj,pj->kp', rho, self.up) / np.linalg.norm(rho, axis=-1)
+            vis = sin_el >= self.sin_mask
+
+            self.samples += len(t)
+            self.visible += vis.sum(axis=0)
+            seen = np.where(vis, t[:, None], -np.inf)
+            # Last visible time before every sample (carried over from previous blocks)
+            previous = np.maximum.accumulate(np.vstack([self.last_seen[None], seen[:-1]]), axis=0)
+            gaps = np.where(vis & np.isfinite(previous), t[:, None] - previous, 0.0)
+            self.max_gap = np.maximum(self.max_gap, gaps.max(axis=0))
+
+            first = np.where(vis.any(axis=0), t[np.argmax(vis, axis=0)], np.nan)
+            self.first_seen = np.where(np.isnan(self.first_seen), first, self.first_seen)
+            self.last_seen = np.maximum(self.last_seen, seen.max(axis=0))
+
+    def table(self):
+        """
+        Coverage so far, one row per ground point:
+        lat, lon, visible_fraction, first_access_sec, max_gap_h
+        (max gap counts the time between consecutive visible samples)
+        """
+        return pd.DataFrame({
+            'lat': self.lat,
+            'lon': self.lon,
+            'visible_fraction': self.visible / max(self.samples, 1),
+            'first_access_sec': self.first_seen,
+            'max_gap_h': self.max_gap / 3600.0
+        })
+
+
+if __name__ == "__main__":
+    import constants as cts
+    from ground_segment import Station
+    from isl import walker_positions
+
+    # 7 days at 60 s, generated chunk by chunk (one day per chunk), as Propagator.run_stream would
+    elements = {'sma': [cts.Re + 550.0], 'inc': [97.6], 'raan': [0.0], 'aop': [0.0], 'ta': [0.0]}
+    def source(days, step=60.0):
+        for d in range(days):
+            t = d * 86400.0 + np.arange(0, 86400, step)
+            yield np.column_stack([t, walker_positions(elements, t)[0]])
+
+    access = AccessStage(Station("Cordoba", -31.52, -64.46, min_elevation=10.0), satellite="SSO-550")
+    lat, lon = np.meshgrid(np.arange(-80, 81, 5.0), np.arange(-180, 180, 5.0))
+    coverage = CoverageStage(lat, lon, min_elevation=10.0)
+
+    for _ in pipeline(earth_fixed(source(7), "2026-02-10T12:00:00"), access, coverage):
+        pass
+    print(access.table().stats_by_site())
+    print(coverage.table().groupby('lat')[['visible_fraction', 'max_gap_h']].mean().iloc[::4])
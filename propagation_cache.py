@@ -0,0 +1,190 @@
+'''
+Created on Oct 19, 2026
+
+Memoization of propagation and access results.
+Results are keyed on their inputs (state and epoch the GMAT spacecraft
+starts from, propagator configuration, duration and step) and kept in
+an in-memory LRU. Optionally, propagations are also written to a
+TrajectoryStore (spill_dir) and read back on memory misses, e.g. after
+a notebook kernel restart.
+
+@author: mcvalenti
+'''
+
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from trajectory_store import TrajectoryStore, make_key
+
+CARTESIAN_FIELDS = ("X", "Y", "Z", "VX", "VY", "VZ")
+
+
+class PropagationCache:
+    """
+    LRU cache around Propagator.run and AccessManager.calculate_access.
+
+    A cache hit writes the final epoch and state of the cached run back to
+    the satellite's gmat_obj, so hits and misses leave it in the same state.
+    """
+    def __init__(self, maxsize=64, spill_dir=None):
+        """
+        :param maxsize: maximum number of results kept in memory
+        :param spill_dir: optional directory for on-disk results
+        """
+        self.maxsize = maxsize
+        self.spill_dir = spill_dir
+        self.store = TrajectoryStore(spill_dir) if spill_dir else None
+        self._lru = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- LRU ----------
+    def _get(self, key):
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return self._lru[key]
+        return None
+
+    def _put(self, key, value):
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+            self.evictions += 1
+
+    # ---------- keys ----------
+    @staticmethod
+    def propagation_inputs(propagator, satellite, duration_sec, step_size, **kwargs):
+        """
+        Inputs that fully determine the result of Propagator.run.
+        The state is read from the GMAT spacecraft, not from satellite.initial_state:
+        Propagator.run leaves the spacecraft at its final state, and the next run
+        starts from there.
+        """
+        from space_env import normalize_force_config
+
+        state = PropagationCache.spacecraft_state(satellite)
+        config = getattr(propagator, 'config', None) or {}
+        return dict(
+            satellite=satellite.name,
+            epoch=state['Epoch'],
+            force_model=normalize_force_config(config),
+            integrator=[config.get('integrator', 'PrinceDormand78'), config.get('accuracy')],
+            step=step_size,
+            state=[state[k] for k in CARTESIAN_FIELDS],
+            duration=float(duration_sec),
+            options=kwargs
+        )
+
+    @staticmethod
+    def spacecraft_state(satellite):
+        """Epoch and Cartesian state [km, km/s] of the GMAT spacecraft."""
+        sat_obj = satellite.gmat_obj
+        state = {'Epoch': sat_obj.GetField("Epoch")}
+        state.update({k: float(sat_obj.GetField(k)) for k in CARTESIAN_FIELDS})
+        return state
+
+    @staticmethod
+    def restore_state(satellite, state):
+        """Writes a spacecraft_state back to the GMAT spacecraft (epoch first)."""
+        for field_name, value in state.items():
+            if value is not None:
+                satellite.gmat_obj.SetField(field_name, value)
+
+    @staticmethod
+    def access_key(trajectory, start_epoch, site):
+        """Key of an access computation: trajectory content, epoch and site geometry."""
+        digest = hashlib.sha1(np.ascontiguousarray(trajectory, dtype=float).tobytes()).hexdigest()
+        return make_key(
+            trajectory=digest,
+            epoch=start_epoch,
+            site=[site.name, site.lat, site.lon, site.alt_m],
+            min_elevation=getattr(site, 'min_elevation', 0.0)
+        )
+
+    # ---------- memoized calls ----------
+    def run(self, propagator, satellite, duration_sec, step_size=60, **kwargs):
+        """
+        Memoized Propagator.run. Same arguments, same result: on a hit the
+        spacecraft is moved to the final state of the cached run, as a run would.
+        The returned array is read-only since it is shared with the cache.
+        """
+        inputs = self.propagation_inputs(propagator, satellite, duration_sec, step_size, **kwargs)
+        key = 'run_' + make_key(**inputs)
+
+        cached = self._get(key)
+        if cached is not None:
+            trajectory, final_state = cached
+            self.restore_state(satellite, final_state)
+            return trajectory
+
+        if self.store is not None:
+            store_key = self.store.find(**inputs)
+            # Entries without the final spacecraft state are propagated again
+            final_state = self.store.metadata(store_key).get('attrs', {}).get('final_state') if store_key else None
+            if final_state is not None:
+                self.disk_hits += 1
+                trajectory = np.array(self.store.load(store_key))
+                trajectory.flags.writeable = False
+                self._put(key, (trajectory, final_state))
+                self.restore_state(satellite, final_state)
+                return trajectory
+
+        self.misses += 1
+        trajectory = np.asarray(propagator.run(satellite, duration_sec, step_size=step_size, **kwargs))
+        trajectory.flags.writeable = False
+        final_state = self.spacecraft_state(satellite)
+        self._put(key, (trajectory, final_state))
+        if self.store is not None:
+            self.store.save(trajectory, attrs={'final_state': final_state}, **inputs)
+        return trajectory
+
+    def access(self, trajectory, start_epoch, site):
+        """Memoized AccessManager.calculate_access."""
+        from access_manager import AccessManager
+
+        key = 'access_' + self.access_key(trajectory, start_epoch, site)
+        passes = self._get(key)
+        if passes is not None:
+            return list(passes)
+
+        path = os.path.join(self.spill_dir, f"{key}.pkl") if self.spill_dir else None
+        if path and os.path.exists(path):
+            with open(path, 'rb') as f:
+                passes = pickle.load(f)
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            passes = AccessManager.calculate_access(trajectory, start_epoch, site)
+            if path:
+                with open(path, 'wb') as f:
+                    pickle.dump(passes, f)
+
+        self._put(key, tuple(passes))
+        return list(passes)
+
+    # ---------- stats ----------
+    def stats(self):
+        """Hit/miss counters of the cache."""
+        requests = self.hits + self.disk_hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._lru),
+            'hit_rate': (self.hits + self.disk_hits) / requests if requests else 0.0
+        }
+
+    def clear(self):
+        """Empties the in-memory LRU (on-disk results are kept)."""
+        self._lru.clear()
+
+
+# Shared instance for notebooks and example scripts
+default_cache = PropagationCache()
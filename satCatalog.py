@@ -1,4 +1,5 @@
 import requests
+import numpy as np
 
 
 def request_CelesTrack(group_name):
@@ -96,3 +97,26 @@ def request_celestrak_data(search_value="STARLINK", search_type="GROUP"):
 
     # --- HOW TO USE IT ---
 
+
+def gp_elements(records):
+    """
+    Mean elements of a list of CelesTrak records as numpy arrays.
+    Accepts GP JSON records (request_CelesTrack / request_by_name) or
+    TLE records (request_celestrak_data). Each record becomes a TLEHandler
+    (from_json with TLE lines, from_omm otherwise) and the elements come
+    from TLEHandler.orbit_elements_table.
+    :return: dict of arrays: name, sma [km], ecc, inc [deg], raan [deg], mean_motion [rev/day]
+    """
+    from space_env import TLEHandler
+
+    handlers = [TLEHandler.from_json(rec) if "TLE_LINE2" in rec else TLEHandler.from_omm(rec)
+                for rec in records if "TLE_LINE2" in rec or "MEAN_MOTION" in rec]
+    table = TLEHandler.orbit_elements_table(handlers)
+    return {
+        "name": table.index.to_numpy(dtype=object),
+        "sma": table["a"].to_numpy(dtype=float),
+        "ecc": table["e"].to_numpy(dtype=float),
+        "inc": np.degrees(table["inc"].to_numpy(dtype=float)),
+        "raan": np.degrees(table["raan"].to_numpy(dtype=float)),
+        "mean_motion": table["n_rad_min"].to_numpy(dtype=float) * 1440.0 / (2 * np.pi)
+    }
@@ -1,18 +1,50 @@
 from sgp4.api import Satrec, jday, WGS84
 from astropy.time import Time
 from astropy import units as u
-from astropy.coordinates import TEME, CartesianRepresentation, ITRS
+from astropy.coordinates import TEME, CartesianRepresentation, GCRS, ITRS, EarthLocation
 import numpy as np
+import pandas as pd
+from contextlib import contextmanager
 from gmat_env import get_gmat
 import constants as cts
+from time_grid import TimeGrid
 
 # Get GMAT's motor instance
 gmat = get_gmat()
 
+# Depth of nested batch_initialize() blocks; while > 0 gmat.Initialize() is deferred
+_DEFERRED_INIT = 0
+
+@contextmanager
+def batch_initialize():
+    """
+    Defers gmat.Initialize() for every Satellite configured inside the block
+    and initializes the GMAT object graph only once, on exit.
+    Usage:
+        with batch_initialize():
+            for sat, el in zip(sats, elements):
+                sat.set_keplerian(**el)
+    """
+    global _DEFERRED_INIT
+    _DEFERRED_INIT += 1
+    try:
+        yield
+    finally:
+        _DEFERRED_INIT -= 1
+    if _DEFERRED_INIT == 0:
+        gmat.Initialize()
+
+def _initialize():
+    """gmat.Initialize(), unless running inside batch_initialize()"""
+    if _DEFERRED_INIT == 0:
+        gmat.Initialize()
+
 class Satellite:
     def __init__(self, name="MySat"):
         self.name = name
         self.gmat_obj = gmat.Construct("Spacecraft", name)
+        # Last state written with set_keplerian / set_cartesian
+        self.initial_state = {}
         
     def set_keplerian(self, **elements):
         """Configure kepelerian elements"""
@@ -42,7 +74,9 @@ class Satellite:
                     # intentamos SetField pero sin convertir a string
                     self.gmat_obj.SetField(gmat_key, float(value))
         
-        gmat.Initialize()
+        self.initial_state = {'type': 'Keplerian'}
+        self.initial_state.update({k: getattr(self, k) for k in mappings if hasattr(self, k)})
+        _initialize()
 
     def get_keplerian_period(self):
         """
@@ -95,15 +129,21 @@ class Satellite:
         self.gmat_obj.SetField("VY", float(vel[1]))
         self.gmat_obj.SetField("VZ", float(vel[2]))
         
-        gmat.Initialize()
+        self.initial_state = {
+            'type': 'Cartesian',
+            'epoch': gmat_epoch,
+            'pos': [float(p) for p in pos],
+            'vel': [float(v) for v in vel]
+        }
+        _initialize()
     
     def get_subsatellite_points(self, trajectory, start_epoch):
         """
         Converts an inertial trajectory array into geodetic coordinates 
         for this satellite instance.
         """
-        time_offsets = trajectory[:, 0] * u.second
-        times = start_epoch + time_offsets
+        # One Time array for the whole trajectory (TimeGrid)
+        times = TimeGrid.from_time(start_epoch, trajectory[:, 0]).to_time(format='isot')
         
         cartesian_km = CartesianRepresentation(trajectory[:, 1:4].T * u.km)
         gcrs_coords = GCRS(cartesian_km, obstime=times)
@@ -118,77 +158,170 @@ class Satellite:
             "alt_km": geo_location.height.to(u.km).value
         }
 
+# ==============
+#  Force models
+# ==============
+# Default: JGM2 Earth gravity with GMAT's default degree/order
+DEFAULT_FORCE_CONFIG = {'gravity': 'Earth', 'potential_file': 'JGM2.cof'}
+
+# Cheaper models for survey runs: config={'model': 'point_mass'} or {'model': 'j2'}
+FORCE_MODEL_PRESETS = {
+    'point_mass': {'degree': 0, 'order': 0},
+    'j2': {'degree': 2, 'order': 0},
+}
+
+# Config keys that belong to the integrator, not to the force model
+INTEGRATOR_KEYS = ('integrator', 'accuracy')
+
+# GMAT objects shared by every Propagator built with the same settings
+_FORCE_MODEL_CACHE = {}
+_INTEGRATOR_CACHE = {}
+
+def normalize_force_config(config=None):
+    """
+    Complete force model settings from a Propagator config dict.
+    Keys: gravity (body), degree, order, potential_file,
+          drag (bool), atmosphere (GMAT model name), srp (bool),
+          model ('point_mass' or 'j2' preset)
+    """
+    config = config or {}
+    cfg = dict(DEFAULT_FORCE_CONFIG)
+    if config.get('model'):
+        cfg.update(FORCE_MODEL_PRESETS[config['model'].lower()])
+    cfg.update({k: v for k, v in config.items() if k != 'model' and k not in INTEGRATOR_KEYS})
+    if cfg.get('drag'):
+        cfg.setdefault('atmosphere', 'JacchiaRoberts')
+    return cfg
+
+def build_force_model(config=None):
+    """
+    GMAT ForceModel for the given config. Identical settings return the
+    same (cached) GMAT object instead of constructing a new one.
+    Degree 0 builds a point-mass model; degree 2 / order 0 is J2 only.
+    """
+    cfg = normalize_force_config(config)
+    key = tuple(sorted((k, str(v)) for k, v in cfg.items()))
+    if key in _FORCE_MODEL_CACHE:
+        return _FORCE_MODEL_CACHE[key]
+
+    gmat = get_gmat()
+    tag = len(_FORCE_MODEL_CACHE)
+    body = cfg['gravity']
+    force_model = gmat.Construct("ForceModel", f"FM_{tag}")
+
+    degree = cfg.get('degree')
+    if degree is not None and int(degree) == 0:
+        grav = gmat.Construct("PointMassForce", f"PM_{body}_{tag}")
+        grav.SetField("BodyName", body)
+    else:
+        grav = gmat.Construct("GravityField", f"Grav_{body}_{tag}")
+        grav.SetField("PotentialFile", cfg['potential_file'])
+        grav.SetField("BodyName", body)
+        if degree is not None:
+            # Degree/Order must be native int
+            grav.SetField("Degree", int(degree))
+            grav.SetField("Order", int(cfg.get('order', degree)))
+    force_model.AddForce(grav)
+
+    if cfg.get('drag'):
+        drag = gmat.Construct("DragForce", f"Drag_{tag}")
+        atmosphere = gmat.Construct(cfg['atmosphere'], f"Atmos_{tag}")
+        drag.SetField("AtmosphereModel", cfg['atmosphere'])
+        drag.SetReference(atmosphere)
+        force_model.AddForce(drag)
+
+    if cfg.get('srp'):
+        srp = gmat.Construct("SolarRadPressure", f"SRP_{tag}")
+        force_model.AddForce(srp)
+
+    _FORCE_MODEL_CACHE[key] = force_model
+    return force_model
+
+def build_integrator(config=None):
+    """
+    GMAT integrator for the given config ('integrator', 'accuracy' keys),
+    cached like the force models. Default: PrinceDormand78.
+    """
+    config = config or {}
+    kind = config.get('integrator', 'PrinceDormand78')
+    accuracy = config.get('accuracy')
+    key = (kind, accuracy)
+    if key in _INTEGRATOR_CACHE:
+        return _INTEGRATOR_CACHE[key]
+
+    gmat = get_gmat()
+    integrator = gmat.Construct(kind, f"Int_{kind}_{len(_INTEGRATOR_CACHE)}")
+    if accuracy is not None:
+        integrator.SetField("Accuracy", float(accuracy))
+
+    _INTEGRATOR_CACHE[key] = integrator
+    return integrator
+
 class Propagator:
     def __init__(self, name="MainProp", config=None):
-        gmat = get_gmat()
+        """
+        :param config: force model / integrator settings, e.g.
+                       {'gravity': 'Earth', 'degree': 2, 'order': 0, 'drag': True}
+                       {'model': 'point_mass'}  (see normalize_force_config)
+        """
         self.name = name
+        self.config = config
         
         # ==============
         #  ForceModel
         # ==============
-        self.force_model = gmat.Construct("ForceModel", f"FM_{name}")
-        self.earthgrav = gmat.Construct("GravityField")
-        self.earthgrav.SetField("PotentialFile","JGM2.cof")
-        self.earthgrav.SetField("BodyName","Earth")
-        self.earthgrav.Help()
-        self.force_model.AddForce(self.earthgrav)
+        self.force_model = build_force_model(config)
         # ==============
-        #  Propagator
+        #  Integrator
         # ==============
-        self.gmat_prop = gmat.Construct("PropSetup", f"Prop_{name}")
+        self.integrator = build_integrator(config)
         # ==============
-        #  Integrator
+        #  Propagator
         # ==============
-        self.integrator = gmat.Construct("PrinceDormand78", f"Int_{name}")
-        
+        # PropSetup of the last run: every run builds its own (see _prop_setup)
+        self.gmat_prop = None
+        self._n_setups = 0
+
+    def _prop_setup(self, sat_objs):
+        """
+        Builds a fresh PropSetup holding only these spacecraft. A PropSetup
+        keeps every object added to it, so a reused one would also step (and
+        put first in the state vector) the spacecraft of earlier runs.
+        :return: internal propagator, ready to step
+        """
+        gmat = get_gmat()
+        self.gmat_prop = gmat.Construct("PropSetup", f"Prop_{self.name}_{self._n_setups}")
+        self._n_setups += 1
         # Assign the integrator and force model
         self.gmat_prop.SetReference(self.integrator)
         self.gmat_prop.SetReference(self.force_model)
-        
-    #     # Configuracion por defecto si no se provee una
-    #     if config is None:
-    #         config = {'gravity': 'Earth', 'degree': 0, 'order': 0}
-        
-    #     self.config = config
-    #     self._setup_forces(config)
-
-    # def _setup_forces(self, config):
-    #     """Configura el modelo de fuerzas usando enteros nativos para Degree/Order."""
-    #     gmat = get_gmat()
-
-    #     if 'gravity' in config:
-    #         body = config['gravity']
-    #         if config.get('degree', 0) > 0:
-    #             grav = gmat.Construct("GravityField", f"Grav_{body}")
-                
-    #             grav.SetField("BodyName", body)
-    #             # El Test 1 demostró que esto debe ser int
-    #             grav.SetField("Degree", int(config['degree']))
-    #             grav.SetField("Order", int(config['order']))
-    #         else:
-    #             grav = gmat.Construct("PointMassForce", f"PM_{body}")
-    #             grav.SetField("BodyName", body)
-            
-    #         self.force_model.AddForce(grav)
-
-    def run(self, satellite, duration_sec, step_size=60):
-        gmat = get_gmat()
         # Top level initialization
         gmat.Initialize()
+        for sat_obj in sat_objs:
+            self.gmat_prop.AddPropObject(sat_obj)
+        self.gmat_prop.PrepareInternals()
+        return self.gmat_prop.GetPropagator()
+
+    def run(self, satellite, duration_sec, step_size=60, with_velocity=False):
+        """
+        Propagates the satellite on a fixed step grid.
+        The first row is the initial state at t=0, then one row per step at
+        t = k * step_size (same convention as run_stream, run_many and run_events).
+        :param with_velocity: if True rows are [time, x, y, z, vx, vy, vz],
+                              otherwise [time, x, y, z]
+        """
         sat_obj = satellite.gmat_obj       
         # Spacecraft that is propagated
-        self.gmat_prop.AddPropObject(sat_obj)
-        self.gmat_prop.PrepareInternals()
-        
-        # Refresh the integrator reference
-        internal_prop = self.gmat_prop.GetPropagator()
+        internal_prop = self._prop_setup([sat_obj])
        
-        data = []
+        n_cols = 7 if with_velocity else 4
+        data = [[0.0] + list(internal_prop.GetState()[:n_cols - 1])] # initial state (t=0)
         current_time = 0.0
         
         for _ in range(0, int(duration_sec), step_size):
             # Propagar
             internal_prop.Step(float(step_size)) # take a step
+            current_time += step_size
             
             # Get Iterator state
             state = internal_prop.GetState() # To force sat_obj Update
@@ -202,12 +335,143 @@ class Propagator:
             sat_obj.SetField("VZ", state[5])
             
             pos = [state[0], state[1], state[2]]
+            if with_velocity:
+                pos += [state[3], state[4], state[5]]
             data.append([current_time] + pos)
             
-            current_time += step_size
-            
         return np.array(data)
 
+    def run_stream(self, satellite, duration_sec, step_size=60, chunk_steps=1440, with_velocity=False):
+        """
+        Streaming version of run(): yields the trajectory in chunks of
+        chunk_steps rows (same layout and time convention as run()), so
+        long runs are consumed (pipeline.py) without building the whole array.
+        The spacecraft fields are updated at the end of every chunk.
+        :param chunk_steps: rows per chunk (1440 = one day at 60 s)
+        :yield: numpy array [time, x, y, z(, vx, vy, vz)] of every chunk
+        """
+        sat_obj = satellite.gmat_obj
+        internal_prop = self._prop_setup([sat_obj])
+
+        # Initial state (t=0) in the first row, then one row per step
+        n_rows = len(range(0, int(duration_sec), step_size)) + 1
+        n_cols = 7 if with_velocity else 4
+        for k0 in range(0, n_rows, chunk_steps):
+            k1 = min(k0 + chunk_steps, n_rows)
+            chunk = np.empty((k1 - k0, n_cols))
+            chunk[:, 0] = np.arange(k0, k1) * float(step_size)
+            for row, k in enumerate(range(k0, k1)):
+                if k:
+                    internal_prop.Step(float(step_size)) # take a step
+                state = internal_prop.GetState()
+                chunk[row, 1:] = state[:n_cols - 1]
+
+            # Leave the spacecraft at the last state of the chunk
+            for field_name, value in zip(("X", "Y", "Z", "VX", "VY", "VZ"), internal_prop.GetState()[:6]):
+                sat_obj.SetField(field_name, float(value))
+            yield chunk
+
+    def run_many(self, satellites, duration_sec, step_size=60):
+        """
+        Propagates several spacecraft together in this single PropSetup:
+        GMAT integrates all of them in one state vector, and every step is
+        read out in bulk instead of stepping each satellite in its own loop.
+        Same time convention as run(): initial states at t=0, then one per step.
+        :param satellites: list of Satellite objects
+        :return: times (n_steps + 1,) [sec], states (n_sats, n_steps + 1, 6) [km, km/s]
+        """
+        internal_prop = self._prop_setup([satellite.gmat_obj for satellite in satellites])
+
+        n_sats = len(satellites)
+        n_steps = len(range(0, int(duration_sec), step_size))
+        times = np.arange(n_steps + 1) * float(step_size)
+        states = np.empty((n_steps + 1, n_sats * 6))
+
+        # Propagation state vector: 6 elements per spacecraft, in AddPropObject order
+        states[0] = np.asarray(internal_prop.GetState(), dtype=float)[:n_sats * 6]
+        for k in range(1, n_steps + 1):
+            internal_prop.Step(float(step_size)) # take a step
+            states[k] = np.asarray(internal_prop.GetState(), dtype=float)[:n_sats * 6]
+
+        states = states.reshape(n_steps + 1, n_sats, 6).transpose(1, 0, 2)
+
+        # Leave every spacecraft at its final state (once, not every step)
+        if n_steps:
+            for satellite, final in zip(satellites, states[:, -1]):
+                for field_name, value in zip(("X", "Y", "Z", "VX", "VY", "VZ"), final):
+                    satellite.gmat_obj.SetField(field_name, float(value))
+
+        return times, np.ascontiguousarray(states)
+
+    def run_events(self, satellite, duration_sec, events, start_epoch=None, max_step=None, substeps=4):
+        """
+        Event-driven propagation. The integrator takes its natural adaptive
+        steps (GMAT limits them to max_step if given) instead of a fixed grid, and
+        the events (see events.py) are located between steps by interpolation.
+        A terminal event (e.g. AltitudeEvent(120, terminal=True)) stops the run.
+        :param events: list of events.Event objects
+        :param start_epoch: Astropy Time of t=0, needed by elevation/eclipse events
+        :param max_step: optional upper bound of the step [sec] (integrator MaxStep)
+        :param substeps: samples of the event functions inside every step
+        :return: sparse trajectory [time, x, y, z, vx, vy, vz] at the integrator steps
+                 (last sample at duration_sec), list of events.EventRecord (event log)
+        """
+        from events import detect_events
+        from ephemeris import Ephemeris
+
+        sat_obj = satellite.gmat_obj
+        internal_prop = self._prop_setup([sat_obj])
+
+        if max_step is not None:
+            # Restored after the run: the integrator is shared (build_integrator cache)
+            default_max_step = internal_prop.GetNumber("MaxStep")
+            internal_prop.SetField("MaxStep", float(max_step))
+
+        t = 0.0
+        last_dt = 0.0
+        state = np.asarray(internal_prop.GetState(), dtype=float)[:6]
+        data = [np.r_[t, state]]
+        log = []
+
+        try:
+            while t < duration_sec:
+                remaining = duration_sec - t
+                if remaining > last_dt:
+                    internal_prop.Step() # natural (adaptive) step
+                    dt = internal_prop.GetStepTaken()
+                else:
+                    dt = remaining       # last step lands on duration_sec
+                    internal_prop.Step(float(dt))
+                last_dt = dt
+
+                new_state = np.asarray(internal_prop.GetState(), dtype=float)[:6]
+                found = detect_events(events, t, state, t + dt, new_state, start_epoch, substeps)
+                if t + dt > duration_sec:
+                    # The adaptive step grew past the end: clip the last sample to duration_sec
+                    step = Ephemeris(np.array([np.r_[t, state], np.r_[t + dt, new_state]]))
+                    new_state = step.interpolate(duration_sec)[0]
+                    found = [rec for rec in found if rec.time_sec <= duration_sec]
+                    dt = duration_sec - t
+                t, state = t + dt, new_state
+
+                stop = next((rec for rec in found if rec.terminal), None)
+                if stop is not None:
+                    log.extend(rec for rec in found if rec.time_sec <= stop.time_sec)
+                    t, state = stop.time_sec, stop.state
+                    data.append(np.r_[t, state])
+                    break
+                log.extend(found)
+                data.append(np.r_[t, state])
+        finally:
+            if max_step is not None:
+                internal_prop.SetField("MaxStep", default_max_step)
+
+        # Leave the spacecraft at the last state
+        for field_name, value in zip(("X", "Y", "Z", "VX", "VY", "VZ"), state):
+            sat_obj.SetField(field_name, float(value))
+
+        return np.array(data), log
+
 class TLEHandler:
     """
     Handles TLE (Two-Line Element) data using SGP4 for propagation 
@@ -229,6 +493,8 @@ class TLEHandler:
         # Only call twoline2rv if lines are actually provided as strings
         if isinstance(line1, str) and isinstance(line2, str):
             self.satrec = Satrec.twoline2rv(line1, line2)
+        # Orbit elements are computed once per handler (see get_orbit_elements)
+        self._elements = None
         
     @classmethod
     def from_json(cls, data):
@@ -296,17 +562,44 @@ class TLEHandler:
             'vel': np.array(v)
         }
     
+    def propagate(self, grid):
+        """
+        SGP4 states on a whole time grid in one call (Satrec.sgp4_array).
+        :param grid: TimeGrid (epoch + offsets [sec])
+        :return: numpy array [time_offset, x, y, z, vx, vy, vz] in TEME [km, km/s]
+        """
+        jd1, jd2 = grid.jd
+        error, r, v = self.satrec.sgp4_array(jd1, jd2)
+        if np.any(error != 0):
+            raise RuntimeError(f"SGP4 Propagation Error: Code {error[error != 0][0]}")
+        return np.column_stack([grid.offsets, r, v])
+
     def get_orbit_elements(self):
         """
         Extracts orbital elements for SGP4 and SMAD.
+        Elements are computed on the first call and cached in the handler.
+        Handlers built with from_omm (no TLE lines) take them from the satrec.
         """
+        if self._elements is None:
+            if isinstance(self.line1, str) and isinstance(self.line2, str):
+                self._elements = self._elements_from_lines()
+            else:
+                self._elements = self._elements_from_satrec()
+        return dict(self._elements)
+
+    def _semi_major_axis(self, n_rad_min):
+        """Semi-major axis [km] from the mean motion [rad/min]."""
+        n_rad_sec = n_rad_min / 60.0
+        return (self.mu / (n_rad_sec**2))**(1/3)
+
+    def _elements_from_lines(self):
+        """Parse the fixed-width fields of the TLE lines."""
         # Mean Motion (revs/day)
         n_rev_day = float(self.line2[52:63])
         n_rad_min = (n_rev_day * 2 * np.pi) / 1440.0 # Standard for SGP4 init
         
         # Semi-major axis (a) for SMAD [km]
-        n_rad_sec = (n_rev_day * 2 * np.pi) / 86400.0
-        a = (self.mu / (n_rad_sec**2))**(1/3)
+        a = self._semi_major_axis(n_rad_min)
         
         return {
             'a': a,
@@ -320,6 +613,35 @@ class TLEHandler:
             'n_rad_min': n_rad_min
         }
 
+    def _elements_from_satrec(self):
+        """Read the elements the satrec was initialized with (OMM handlers)."""
+        sat = self.satrec
+        n_rad_min = sat.no_kozai
+        a = self._semi_major_axis(n_rad_min)
+        
+        return {
+            'a': a,
+            'h': a - self.Re,
+            'e': sat.ecco,
+            'inc': sat.inclo,
+            'raan': sat.nodeo,
+            'argp': sat.argpo,
+            'm': sat.mo,
+            'bstar': sat.bstar,
+            'n_rad_min': n_rad_min
+        }
+
+    @staticmethod
+    def orbit_elements_table(handlers):
+        """
+        Bulk version of get_orbit_elements.
+        :param handlers: iterable of TLEHandler objects
+        :return: pandas DataFrame, one row per handler indexed by name
+        """
+        handlers = list(handlers)
+        rows = [h.get_orbit_elements() for h in handlers]
+        return pd.DataFrame(rows, index=[h.name for h in handlers])
+
     def to_geodetic(self, epoch_str=None):
         """
         Transforms TEME Cartesian coordinates to Geodetic coordinates (Lat, Lon, Alt).
@@ -0,0 +1,30 @@
+'''
+Created on Oct 19, 2026
+
+Constellation registry shells against the catalog counts
+
+@author: mcvalenti
+'''
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from constellation_env import ConstellationManager, SatelliteConstellation, plane_groups
+
+
+def test_shell_totals_match_the_catalog():
+    registry = ConstellationManager.from_json_file(os.path.join(ROOT, 'Constellations_LEO_2026.JSON'))
+    for constellation in registry.constellations:
+        total = sum(s.n_satellites for s in constellation.shells())
+        assert total == constellation.approx_satellites, constellation.name
+    assert registry.shell_table()['n_satellites'].sum() == registry.get_total_satellite_count()
+    assert len(registry.population_elements(seed=0)['sma']) == registry.get_total_satellite_count()
+
+
+def test_spares_go_to_an_extra_plane():
+    iridium = SatelliteConstellation(name="Iridium", approx_satellites=75, inclination_deg=86.4,
+                                     configuration="6 planes x 11 sat (+9 spares)")
+    assert [(s.planes, s.sats_per_plane) for s in iridium.shells()] == [(6, 11), (1, 9)]
+    assert plane_groups(20, 6, 11) == [(1, 11), (1, 9)]
@@ -0,0 +1,75 @@
+'''
+Created on Oct 19, 2026
+
+PropagationCache keys (runs with the benchmarks' GMAT stand-in)
+
+@author: mcvalenti
+'''
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks import gmat_standin
+gmat_standin.install()
+
+from space_env import Satellite, Propagator
+from propagation_cache import PropagationCache
+
+ELEMENTS = dict(sma=6928.0, ecc=0.0, inc=97.6, raan=0.0, aop=0.0, ta=0.0)
+
+
+def new_satellite(name):
+    sat = Satellite(name)
+    sat.set_keplerian(**ELEMENTS)
+    return sat
+
+
+def test_run_after_run_is_keyed_on_the_moved_state(tmp_path):
+    cache = PropagationCache(spill_dir=str(tmp_path))
+    sat = new_satellite("CacheSat")
+    cache.run(Propagator("CacheProp1"), sat, 600)
+    # sat now sits at its 600 s state: this run starts from there
+    moved = cache.run(Propagator("CacheProp2"), sat, 1200)
+
+    fresh = new_satellite("CacheSat")
+    expected = Propagator("CacheProp3").run(new_satellite("CacheSat"), 1200)
+    cached = cache.run(Propagator("CacheProp4"), fresh, 1200)
+
+    assert not np.allclose(moved[0, 1:4], cached[0, 1:4])
+    np.testing.assert_allclose(cached, expected)
+    assert cache.stats()['misses'] == 3
+
+
+def test_same_inputs_hit():
+    cache = PropagationCache()
+    first = cache.run(Propagator("CacheProp5"), new_satellite("HitSat"), 600)
+    second = cache.run(Propagator("CacheProp6"), new_satellite("HitSat"), 600)
+    assert second is first
+    assert cache.stats()['hits'] == 1
+
+
+def test_default_config_and_none_share_the_key():
+    sat = new_satellite("KeySat")
+    a = PropagationCache.propagation_inputs(Propagator("CacheProp7"), sat, 600, 60)
+    b = PropagationCache.propagation_inputs(Propagator("CacheProp8", config={'gravity': 'Earth'}), sat, 600, 60)
+    c = PropagationCache.propagation_inputs(Propagator("CacheProp9", config={'model': 'j2'}), sat, 600, 60)
+    assert a == b
+    assert a != c
+
+
+def test_hit_leaves_the_spacecraft_where_a_miss_does(tmp_path):
+    cache = PropagationCache(spill_dir=str(tmp_path))
+    missed = new_satellite("StateSat")
+    cache.run(Propagator("CacheProp10"), missed, 900)
+    final = PropagationCache.spacecraft_state(missed)
+
+    hit = new_satellite("StateSat")
+    cache.run(Propagator("CacheProp11"), hit, 900)
+    disk_hit = new_satellite("StateSat")
+    PropagationCache(spill_dir=str(tmp_path)).run(Propagator("CacheProp12"), disk_hit, 900)
+
+    assert cache.stats()['hits'] == 1
+    for sat in (hit, disk_hit):
+        assert PropagationCache.spacecraft_state(sat) == final
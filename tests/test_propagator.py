@@ -0,0 +1,50 @@
+'''
+Created on Oct 19, 2026
+
+Propagator run methods (runs with the benchmarks' GMAT stand-in)
+
+@author: mcvalenti
+'''
+
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks import gmat_standin
+gmat_standin.install()
+
+from space_env import Satellite, Propagator
+
+
+def new_satellite(name, ta=0.0):
+    sat = Satellite(name)
+    sat.set_keplerian(sma=6928.0, ecc=0.0, inc=53.0, raan=0.0, aop=0.0, ta=ta)
+    return sat
+
+
+def test_run_many_after_run_on_the_same_propagator():
+    prop = Propagator("SharedProp")
+    prop.run(new_satellite("RunSat", ta=180.0), 600)
+    times, states = prop.run_many([new_satellite("ManySatA"), new_satellite("ManySatB", ta=90.0)], 600)
+
+    for k, ta in enumerate((0.0, 90.0)):
+        alone = Propagator(f"AloneProp{k}").run(new_satellite(f"AloneSat{k}", ta=ta), 600, with_velocity=True)
+        np.testing.assert_allclose(states[k], alone[:, 1:])
+    np.testing.assert_allclose(times, alone[:, 0])
+
+
+def test_run_methods_share_the_time_convention():
+    run = Propagator("ConvProp1").run(new_satellite("ConvSat"), 600, with_velocity=True)
+    stream = np.vstack(list(Propagator("ConvProp2").run_stream(new_satellite("ConvSat"), 600, chunk_steps=4,
+                                                               with_velocity=True)))
+    times, states = Propagator("ConvProp3").run_many([new_satellite("ConvSat")], 600)
+    events, _ = Propagator("ConvProp4").run_events(new_satellite("ConvSat"), 600, [])
+
+    # Initial state at t=0, last row after the last step
+    assert run.shape == (11, 7)
+    np.testing.assert_allclose(run[:, 0], np.arange(11) * 60.0)
+    np.testing.assert_allclose(stream, run)
+    np.testing.assert_allclose(np.column_stack([times, states[0]]), run)
+    np.testing.assert_allclose(events[0], run[0])
+    np.testing.assert_allclose(events[-1], run[-1], rtol=1e-6)
@@ -0,0 +1,116 @@
+'''
+Created on Oct 19, 2026
+
+Time grids as plain float arrays
+(Do not use GMAT environment)
+A trajectory is sampled at an epoch plus offsets [sec]. Instead of one
+Astropy Time per sample (or Time + TimeDelta arrays), the grid keeps the
+epoch as a two-float Julian date (UTC) and the offsets as one float array:
+    - jd pairs for SGP4 (Satrec.sgp4_array) and the frames rotations
+    - datetime64[ns] with integer arithmetic for tables (PassTable)
+    - one Astropy Time only at the boundaries (Astropy frames, user output)
+Offsets are added in UTC days, so a leap second inside the grid is ignored.
+
+@author: mcvalenti
+'''
+
+import numpy as np
+from astropy.time import Time
+import frames
+
+SEC_PER_DAY = 86400.0
+
+
+class TimeGrid:
+    """
+    Epoch (two-float JD, UTC) plus offsets from it [sec].
+    """
+    def __init__(self, jd1, jd2, offsets):
+        """
+        :param jd1, jd2: two-part Julian date of the epoch (UTC)
+        :param offsets: offsets from the epoch (N,) [sec]
+        """
+        # Keep the whole day in jd1 and the fraction in jd2
+        day = np.floor(jd2)
+        self.jd1 = float(jd1 + day)
+        self.jd2 = float(jd2 - day)
+        self.offsets = np.atleast_1d(np.asarray(offsets, dtype=float))
+
+    @classmethod
+    def from_time(cls, epoch, offsets):
+        """
+        :param epoch: Astropy Time, ISO string or datetime
+        :param offsets: offsets from the epoch [sec] (e.g. trajectory[:, 0])
+        """
+        epoch = epoch if isinstance(epoch, Time) else Time(epoch)
+        epoch = epoch.utc
+        return cls(epoch.jd1, epoch.jd2, offsets)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """Sub-grid (same epoch) from an index, slice or mask."""
+        return TimeGrid(self.jd1, self.jd2, self.offsets[index])
+
+    @property
+    def epoch(self):
+        """Epoch as an Astropy Time."""
+        return Time(self.jd1, self.jd2, format='jd', scale='utc')
+
+    @property
+    def jd(self):
+        """
+        Two-part Julian date of every sample: whole days (jd1) and fraction (jd2),
+        as expected by Satrec.sgp4_array and frames.
+        """
+        frac = self.jd2 + self.offsets / SEC_PER_DAY
+        day = np.floor(frac)
+        return self.jd1 + day, frac - day
+
+    def to_time(self, index=None, format='jd'):
+        """
+        One Astropy Time (array) for the samples, at API boundaries.
+        :param index: optional index/slice/mask of the samples
+        :param format: output format of the Time ('jd', 'isot', ...)
+        """
+        jd1, jd2 = self.jd if index is None else self[index].jd
+        times = Time(jd1, jd2, format='jd', scale='utc')
+        times.format = format
+        return times
+
+    def datetime64(self, index=None):
+        """UTC datetime64[ns] of the samples (integer nanoseconds from the epoch)."""
+        offsets = self.offsets if index is None else self.offsets[index]
+        epoch_ns = np.datetime64(self.epoch.datetime64, 'ns')
+        return epoch_ns + np.round(offsets * 1e9).astype('timedelta64[ns]')
+
+    def gmst(self):
+        """GMST of every sample [rad]"""
+        return frames.gmst(*self.jd)
+
+    def eci_to_ecef(self, r, v=None):
+        """
+        Inertial positions [and velocities] of the samples to Earth fixed (frames).
+        :param r: (N, 3), or (n_sats, N, 3) for a whole constellation [km]
+        """
+        jd1, jd2 = self.jd
+        return frames.eci_to_ecef(r, jd1, jd2, v)
+
+    def teme_to_eci(self, r, v=None):
+        """SGP4 TEME positions [and velocities] of the samples to MJ2000Eq (frames)."""
+        jd1, jd2 = self.jd
+        return frames.teme_to_eci(r, jd1, jd2, v)
+
+
+if __name__ == "__main__":
+    from astropy import units as u
+
+    offsets = np.arange(0, 7 * 86400, 10.0)
+    epoch = Time("2026-02-10T12:00:00", scale='utc')
+
+    grid = TimeGrid.from_time(epoch, offsets)
+    jd1, jd2 = grid.jd
+    times_astropy = epoch + offsets * u.second
+    error = ((jd1 - times_astropy.jd1) + (jd2 - times_astropy.jd2)) * SEC_PER_DAY
+    print("Max difference [s]: ", np.abs(error).max())
@@ -0,0 +1,172 @@
+'''
+Created on Oct 19, 2026
+
+Orbital traffic: spatial density of the whole population by altitude and latitude
+(Do not use GMAT environment)
+Each object contributes its time-averaged residence distribution, computed
+analytically (no propagation):
+    - altitude: fraction of the period with r < R from the eccentric anomaly
+          r = a (1 - e cos E),  F(R) = (E - e sin E) / pi
+    - latitude: argument of latitude uniform over the period
+          F(phi) = 1/2 + asin(sin(phi) / sin(i)) / pi
+Both are independent when the perigee circulates (J2), so the fraction of
+time in every (altitude, latitude) cell is their product. Dividing by the
+volume of the spherical zone gives objects/km^3. Everything is vectorized
+over the population: N objects x bins.
+[Ref] Kessler (1981) - Derivation of the collision probability between orbiting objects
+
+@author: mcvalenti
+'''
+
+import numpy as np
+import pandas as pd
+import constants as cts
+
+# Default bins
+ALTITUDE_EDGES = np.arange(200.0, 2001.0, 20.0)   # [km]
+LATITUDE_EDGES = np.arange(-90.0, 91.0, 5.0)      # [deg]
+
+
+def altitude_fractions(sma, ecc, alt_edges):
+    """
+    Fraction of the period spent in every altitude bin.
+    :param sma: semi-major axes (N,) [km]
+    :param ecc: eccentricities (N,)
+    :param alt_edges: bin edges (B+1,) [km]
+    :return: (N, B)
+    """
+    a = np.asarray(sma, dtype=float)[:, None]
+    e = np.asarray(ecc, dtype=float)[:, None]
+    r = cts.Re + np.asarray(alt_edges, dtype=float)[None, :]
+
+    eccentric = e > 1e-8
+    e_safe = np.where(eccentric, e, 1.0)
+    E = np.arccos(np.clip((1.0 - r / a) / e_safe, -1.0, 1.0))
+    cdf = np.where(eccentric, (E - e * np.sin(E)) / np.pi, (r >= a).astype(float))
+    return np.diff(cdf, axis=1)
+
+
+def latitude_fractions(inc, lat_edges):
+    """
+    Fraction of the period spent in every latitude bin.
+    :param inc: inclinations (N,) [deg]
+    :param lat_edges: bin edges (L+1,) [deg]
+    :return: (N, L)
+    """
+    sin_i = np.abs(np.sin(np.radians(np.asarray(inc, dtype=float))))[:, None]
+    sin_phi = np.sin(np.radians(np.asarray(lat_edges, dtype=float)))[None, :]
+
+    inclined = sin_i > 1e-8
+    ratio = np.clip(sin_phi / np.where(inclined, sin_i, 1.0), -1.0, 1.0)
+    cdf = np.where(inclined, 0.5 + np.arcsin(ratio) / np.pi, (sin_phi >= 0).astype(float))
+    return np.diff(cdf, axis=1)
+
+
+def zone_volumes(alt_edges, lat_edges):
+    """
+    Volume of every spherical zone (altitude bin x latitude band) [km^3]
+    V = 2 pi / 3 (r2^3 - r1^3) (sin(phi2) - sin(phi1))
+    :return: (B, L)
+    """
+    r = cts.Re + np.asarray(alt_edges, dtype=float)
+    sin_phi = np.sin(np.radians(np.asarray(lat_edges, dtype=float)))
+    return (2 * np.pi / 3) * np.diff(r**3)[:, None] * np.diff(sin_phi)[None, :]
+
+
+class TrafficDensityModel:
+    """
+    Population of objects (mean elements + weight) and its spatial density.
+    Sources (constellation shells, catalog groups) are kept separately, so
+    adding a shell only computes its own contribution.
+    """
+    def __init__(self, alt_edges=ALTITUDE_EDGES, lat_edges=LATITUDE_EDGES):
+        self.alt_edges = np.asarray(alt_edges, dtype=float)
+        self.lat_edges = np.asarray(lat_edges, dtype=float)
+        self.volumes = zone_volumes(self.alt_edges, self.lat_edges)
+        self.sources = {}      # name -> dict(sma, ecc, inc, weight)
+        self._counts = {}      # name -> expected objects per cell (B, L)
+
+    def add_population(self, name, sma, ecc, inc, weight=None):
+        """
+        Adds (or replaces) a source of objects.
+        :param sma, ecc, inc: arrays (N,) [km, -, deg]
+        :param weight: objects represented by every entry (default 1)
+        """
+        sma = np.atleast_1d(np.asarray(sma, dtype=float))
+        weight = np.ones_like(sma) if weight is None else np.broadcast_to(np.asarray(weight, dtype=float), sma.shape)
+        ecc = np.broadcast_to(np.asarray(ecc, dtype=float), sma.shape)
+        inc = np.broadcast_to(np.asarray(inc, dtype=float), sma.shape)
+        self.sources[name] = dict(sma=sma, ecc=ecc, inc=inc, weight=weight)
+
+        p_alt = altitude_fractions(sma, ecc, self.alt_edges)          # (N, B)
+        p_lat = latitude_fractions(inc, self.lat_edges)               # (N, L)
+        self._counts[name] = p_alt.T @ (weight[:, None] * p_lat)      # (B, L)
+
+    def add_shells(self, manager, prefix=''):
+        """
+        Adds every shell of a ConstellationManager (circular orbits),
+        one source per constellation.
+        """
+        table = manager.shell_table()
+        for name, shells in table.groupby('constellation', observed=True):
+            self.add_population(prefix + str(name),
+                                sma=cts.Re + shells['altitude_km'].to_numpy(),
+                                ecc=0.0,
+                                inc=shells['inclination_deg'].to_numpy(),
+                                weight=shells['n_satellites'].to_numpy())
+
+    def add_catalog(self, name, elements):
+        """
+        Adds catalog objects, e.g. satCatalog.gp_elements(request_CelesTrack('active')).
+        """
+        self.add_population(name, elements['sma'], elements['ecc'], elements['inc'])
+
+    def remove(self, name):
+        self.sources.pop(name, None)
+        self._counts.pop(name, None)
+
+    def counts(self, sources=None):
+        """Expected (time-averaged) number of objects per cell (B, L)."""
+        names = self._counts.keys() if sources is None else sources
+        total = np.zeros(self.volumes.shape)
+        for name in names:
+            total += self._counts[name]
+        return total
+
+    def density(self, sources=None):
+        """Spatial density per cell [objects/km^3], shape (altitude bins, latitude bins)."""
+        return self.counts(sources) / self.volumes
+
+    def altitude_profile(self, sources=None):
+        """Density by altitude, averaged over all latitudes [objects/km^3]."""
+        return pd.Series(self.counts(sources).sum(axis=1) / self.volumes.sum(axis=1),
+                         index=0.5 * (self.alt_edges[:-1] + self.alt_edges[1:]),
+                         name='density')
+
+    def density_table(self, sources=None):
+        """Long format table: altitude, latitude (bin centres), count, density."""
+        alt_c = 0.5 * (self.alt_edges[:-1] + self.alt_edges[1:])
+        lat_c = 0.5 * (self.lat_edges[:-1] + self.lat_edges[1:])
+        counts = self.counts(sources)
+        return pd.DataFrame({
+            'altitude_km': np.repeat(alt_c, len(lat_c)),
+            'latitude_deg': np.tile(lat_c, len(alt_c)),
+            'count': counts.ravel(),
+            'density': (counts / self.volumes).ravel()
+        })
+
+    def total_objects(self, sources=None):
+        """Objects inside the bins (checks the bins cover the population)."""
+        return float(self.counts(sources).sum())
+
+
+if __name__ == "__main__":
+    from constellation_env import ConstellationManager
+
+    registry = ConstellationManager.from_json_file()
+    model = TrafficDensityModel()
+    model.add_shells(registry)
+    print(f"{len(model.sources)} sources, {np.round(model.total_objects())} objects")
+
+    profile = model.altitude_profile()
+    print("Peak density: ", profile.max(), "[objects/km^3] at", profile.idxmax(), "km")
@@ -0,0 +1,190 @@
+'''
+Created on Oct 19, 2026
+
+Persistent trajectory store.
+Saves propagated ephemerides as .npy files (memory-mappable) plus a JSON
+metadata file (satellites, epoch, force model, step, ...). Entries are
+content-addressed: the key is a hash of the propagation inputs, so an
+identical run is read back from disk instead of propagated again.
+
+Layout of an entry <key> inside the store directory:
+    <key>.npy        trajectory, [time, x, y, z(, vx, vy, vz)] rows
+                     2D (n_steps, cols) or 3D (n_sats, n_steps, cols)
+    <key>_times.npy  time offsets [sec], used to slice time windows
+    <key>.json       metadata
+
+@author: mcvalenti
+'''
+
+import os
+import json
+import hashlib
+import numpy as np
+from astropy.time import Time
+
+
+def _json_default(obj):
+    """JSON encoder for the values found in propagation inputs."""
+    if isinstance(obj, Time):
+        return obj.utc.isot
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def make_key(**params):
+    """
+    Content address of a propagation: SHA-256 of the canonical JSON of its inputs.
+    :param params: any JSON-serializable inputs (satellite state, epoch, force model, step, ...)
+    """
+    canonical = json.dumps(params, sort_keys=True, default=_json_default)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+
+class TrajectoryStore:
+    """
+    Directory of trajectories addressed by the hash of their inputs.
+    Loaded arrays are read-only memory maps: slicing by satellite or
+    time window only reads the requested part of the file.
+    """
+    def __init__(self, root_dir='TrajectoryStore'):
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+        # Metadata of entries opened with create() and not finalized yet
+        self._pending_meta = {}
+
+    # ---------- paths ----------
+    def _data_path(self, key):
+        return os.path.join(self.root_dir, f"{key}.npy")
+
+    def _times_path(self, key):
+        return os.path.join(self.root_dir, f"{key}_times.npy")
+
+    def _meta_path(self, key):
+        return os.path.join(self.root_dir, f"{key}.json")
+
+    def exists(self, key):
+        return os.path.exists(self._meta_path(key)) and os.path.exists(self._data_path(key))
+
+    def keys(self):
+        """Keys of all complete entries in the store."""
+        return sorted(f[:-5] for f in os.listdir(self.root_dir)
+                      if f.endswith('.json') and self.exists(f[:-5]))
+
+    def metadata(self, key):
+        with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_metadata(self, key, meta):
+        tmp = self._meta_path(key) + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2, default=_json_default)
+        # Metadata is written last: an entry without it is never served
+        os.replace(tmp, self._meta_path(key))
+
+    @staticmethod
+    def _inputs(satellite, epoch, force_model, step, **extra):
+        return dict(satellite=satellite, epoch=epoch, force_model=force_model, step=step, **extra)
+
+    # ---------- write ----------
+    def save(self, trajectory, satellite, epoch, force_model=None, step=None, attrs=None, **extra):
+        """
+        Stores a trajectory and returns its key.
+        :param trajectory: array (n_steps, cols) or (n_sats, n_steps, cols), time in column 0
+        :param satellite: satellite name, or list of names (one per row of a 3D array)
+        :param epoch: Astropy Time (or ISO string) of t=0
+        :param force_model: propagator configuration (dict)
+        :param step: step size [sec]
+        :param attrs: optional JSON-serializable data kept in the metadata, not part of the key
+        :param extra: other propagation inputs (initial state, duration, ...), part of the key
+        """
+        data = np.asarray(trajectory, dtype=float)
+        if data.ndim not in (2, 3):
+            raise ValueError("trajectory must be 2D (n_steps, cols) or 3D (n_sats, n_steps, cols)")
+
+        key = make_key(**self._inputs(satellite, epoch, force_model, step, **extra))
+        out = self.create(key, data.shape, satellite, epoch, force_model, step, attrs=attrs, **extra)
+        out[...] = data
+        self.finalize(key, out)
+        return key
+
+    def create(self, key, shape, satellite, epoch, force_model=None, step=None, attrs=None, **extra):
+        """
+        Opens a writable memory map for a new entry, so large constellation runs can be
+        written satellite by satellite without holding everything in memory.
+        Call finalize(key, array) once every row has been written.
+        """
+        names = [satellite] if isinstance(satellite, str) else list(satellite)
+        if len(shape) == 3 and len(names) != shape[0]:
+            raise ValueError(f"{len(names)} satellite names for {shape[0]} trajectories")
+
+        self._pending_meta[key] = {
+            'key': key,
+            'satellites': names,
+            'epoch': epoch,
+            'force_model': force_model,
+            'step': step,
+            'shape': list(shape),
+            'columns': ['time', 'x', 'y', 'z', 'vx', 'vy', 'vz'][:shape[-1]],
+            'inputs': extra,
+            'attrs': attrs or {},
+        }
+        return np.lib.format.open_memmap(self._data_path(key), mode='w+', dtype=np.float64, shape=tuple(shape))
+
+    def finalize(self, key, array):
+        """Flushes a memory map opened with create() and publishes its metadata."""
+        array.flush()
+        times = array[0, :, 0] if array.ndim == 3 else array[:, 0]
+        np.save(self._times_path(key), np.asarray(times))
+        self._write_metadata(key, self._pending_meta.pop(key))
+
+    # ---------- read ----------
+    def find(self, satellite, epoch, force_model=None, step=None, **extra):
+        """Key of a stored run with exactly these inputs, or None."""
+        key = make_key(**self._inputs(satellite, epoch, force_model, step, **extra))
+        return key if self.exists(key) else None
+
+    def load(self, key, satellites=None, t_start=None, t_stop=None):
+        """
+        Returns a (read-only, memory-mapped) slice of a stored trajectory.
+        :param satellites: name or list of names to select (3D entries only)
+        :param t_start, t_stop: time window [sec from epoch], inclusive
+        """
+        if not self.exists(key):
+            raise KeyError(f"No trajectory stored with key {key}")
+        meta = self.metadata(key)
+        data = np.load(self._data_path(key), mmap_mode='r')
+        times = np.load(self._times_path(key), mmap_mode='r')
+
+        i0 = 0 if t_start is None else int(np.searchsorted(times, t_start, side='left'))
+        i1 = len(times) if t_stop is None else int(np.searchsorted(times, t_stop, side='right'))
+
+        if data.ndim == 2:
+            if satellites is not None:
+                raise ValueError("Entry holds a single satellite; 'satellites' selection not applicable")
+            return data[i0:i1]
+
+        if satellites is None:
+            return data[:, i0:i1]
+        if isinstance(satellites, str):
+            return data[meta['satellites'].index(satellites), i0:i1]
+        idx = [meta['satellites'].index(name) for name in satellites]
+        return data[idx, i0:i1]
+
+    def get_or_run(self, run_fn, satellite, epoch, force_model=None, step=None, **extra):
+        """
+        Serves the trajectory from disk when these inputs were already propagated,
+        otherwise calls run_fn() (e.g. lambda: prop.run(sat, duration, step)) and stores it.
+        :return: (key, memory-mapped trajectory)
+        """
+        key = self.find(satellite, epoch, force_model, step, **extra)
+        if key is None:
+            key = self.save(run_fn(), satellite, epoch, force_model, step, **extra)
+        return key, self.load(key)
+
+    def delete(self, key):
+        for path in (self._data_path(key), self._times_path(key), self._meta_path(key)):
+            if os.path.exists(path):
+                os.remove(path)
@@ -1,42 +1,204 @@
+import numpy as np
 import plotly.graph_objects as go
 from astropy import units as u
 from astropy.coordinates import CartesianRepresentation, GCRS, ITRS, EarthLocation
 from astropy.time import Time
+from ground_segment import PassTable
+from time_grid import TimeGrid
+import frames
+
+# Default decimation of the tracks: maximum deviation [deg] and points per trace
+TRACK_TOLERANCE_DEG = 0.05
+TRACK_MAX_POINTS = 20000
+# RDP starts from blocks of this many samples (bounds the split depth on long tracks)
+TRACK_RDP_BLOCK = 4096
 
 
 """
- 2D - PLOT
+ TRACK PROCESSING
 """
-def graficar_2d_plotly(trayectoria, epoch="2025-01-01T12:00:00"):
-    # 1. Procesamiento de coordenadas con Astropy
-    t_ref = Time(epoch, format='isot', scale='utc')
-    tiempos = t_ref + trayectoria[:, 0] * u.second
-    
-    # Convertimos de Inercial (GCRS) a Terrestre (ITRS)
-    cartesianas = CartesianRepresentation(trayectoria[:, 1:4].T * u.km)
+def geodetic_track(trajectory, epoch, precise=True):
+    """
+    Sub-satellite points of an inertial trajectory.
+    :param trajectory: numpy array [time, x, y, z, ...] (GCRS / MJ2000Eq) [sec, km]
+    :param epoch: Astropy Time or ISO string of t=0
+    :param precise: Astropy GCRS -> ITRS, or frames (~1 km, much faster for long runs)
+    :return: lat, lon [deg], alt [km]
+    """
+    grid = TimeGrid.from_time(epoch, trajectory[:, 0])
+    if not precise:
+        return frames.ecef_to_geodetic(grid.eci_to_ecef(trajectory[:, 1:4]))
+
+    tiempos = grid.to_time()
+    cartesianas = CartesianRepresentation(trajectory[:, 1:4].T * u.km)
     gcrs_coords = GCRS(cartesianas, obstime=tiempos)
     itrs_coords = gcrs_coords.transform_to(ITRS(obstime=tiempos))
-    
-    # Obtenemos Latitud, Longitud y Altura Geodésica
     location = EarthLocation.from_geocentric(itrs_coords.x, itrs_coords.y, itrs_coords.z)
-    lats = location.lat.value
-    lons = location.lon.value
-    alts = location.height.to(u.km).value
+    return location.lat.value, location.lon.value, location.height.to(u.km).value
+
+
+def simplify_track(x, y, tolerance, max_points=None, block=TRACK_RDP_BLOCK):
+    """
+    Ramer-Douglas-Peucker: indexes of the points to keep so that the
+    polyline deviates less than 'tolerance' from the original samples.
+    All segments of one level are split at once (numpy), so the Python
+    loop runs once per level, not once per segment.
+    :param max_points: if more points are needed, keep the max_points with the
+                       largest split tolerance (same as RDP with a larger tolerance)
+    :param block: the track is first cut every 'block' samples (the cuts are kept).
+                  On a long periodic track every orbit ties as the farthest point and
+                  plain RDP peels one orbit per level (quadratic in the run length).
+    """
+    n = len(x)
+    if n < 3:
+        return np.arange(n)
+    # Tolerance below which every point is dropped (min over its split ancestors)
+    score = np.zeros(n)
+    cuts = np.r_[np.arange(0, n - 1, block or n), n - 1]
+    score[cuts] = np.inf
+    starts, ends = cuts[:-1], cuts[1:]
+    limit = np.full(len(starts), np.inf)
+    while len(starts):
+        lengths = ends - starts - 1
+        inner = lengths > 0
+        starts, ends, limit, lengths = starts[inner], ends[inner], limit[inner], lengths[inner]
+        if len(starts) == 0:
+            break
+        offsets = np.cumsum(lengths) - lengths
+        seg = np.repeat(np.arange(len(starts)), lengths)
+        idx = np.arange(lengths.sum()) - offsets[seg] + starts[seg] + 1
+
+        dx, dy = (x[ends] - x[starts])[seg], (y[ends] - y[starts])[seg]
+        px, py = x[idx] - x[starts][seg], y[idx] - y[starts][seg]
+        seg2 = dx * dx + dy * dy
+        t = np.clip((px * dx + py * dy) / np.where(seg2 > 0, seg2, 1.0), 0.0, 1.0)
+        d2 = (px - t * dx)**2 + (py - t * dy)**2
+
+        # Farthest point of every segment
+        d2_max = np.maximum.reduceat(d2, offsets)
+        first = np.nonzero(d2 == d2_max[seg])[0]
+        first = first[np.unique(seg[first], return_index=True)[1]]
+        m = idx[first]
+        eff = np.minimum(np.sqrt(d2_max), limit)
+        split = eff > tolerance
+        score[m[split]] = eff[split]
+        starts, ends = np.r_[starts[split], m[split]], np.r_[m[split], ends[split]]
+        limit = np.r_[eff[split], eff[split]]
+
+    kept = np.nonzero(score > tolerance)[0]
+    if max_points and len(kept) > max_points:
+        kept = np.sort(kept[np.argsort(-score[kept], kind='stable')[:max(max_points, 2)]])
+    return kept
+
+
+def split_antimeridian(lat, lon, customdata=None):
+    """
+    Breaks a track where it crosses +-180 deg: the crossing point is interpolated
+    on both edges of the map and a NaN gap is inserted between them.
+    :param customdata: optional per-point values (N, k), interpolated at the crossings
+    :return: lat, lon, customdata with the gaps
+    """
+    lon = np.mod(np.asarray(lon, dtype=float) + 180.0, 360.0) - 180.0
+    lat = np.asarray(lat, dtype=float)
+    d = np.diff(lon)
+    a = np.nonzero(np.abs(d) > 180.0)[0]
+    if len(a) == 0:
+        return lat, lon, customdata
+    b = a + 1
+
+    east = d[a] < 0                       # e.g. 179 -> -179
+    edge = np.where(east, 180.0, -180.0)
+    lon_b = lon[b] + np.where(east, 360.0, -360.0)
+    f = (edge - lon[a]) / (lon_b - lon[a])
+    lat_c = lat[a] + f * (lat[b] - lat[a])
+    nan = np.full(len(a), np.nan)
+
+    at = np.repeat(b, 3)
+    lat = np.insert(lat, at, np.column_stack([lat_c, nan, lat_c]).ravel())
+    lon = np.insert(lon, at, np.column_stack([edge, nan, -edge]).ravel())
+    if customdata is not None:
+        customdata = np.asarray(customdata, dtype=float)
+        c = customdata[a] + f[:, None] * (customdata[b] - customdata[a])
+        gap = np.full_like(c, np.nan)
+        customdata = np.insert(customdata, at, np.stack([c, gap, c], 1).reshape(-1, c.shape[1]), axis=0)
+    return lat, lon, customdata
+
+
+def track_segments(lat, lon, customdata=None, tolerance_deg=TRACK_TOLERANCE_DEG, max_points=TRACK_MAX_POINTS):
+    """
+    Decimated track ready for a trace: RDP on the unwrapped longitude, then split
+    at the antimeridian. At most 'max_points' are kept (the tolerance grows if
+    needed), so the trace size does not depend on the number of samples.
+    :param tolerance_deg: maximum deviation [deg] (None: keep every sample)
+    """
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    if tolerance_deg is None:
+        idx = np.arange(len(lat))
+    else:
+        lon_unwrapped = np.degrees(np.unwrap(np.radians(lon)))
+        idx = simplify_track(lon_unwrapped, lat, tolerance_deg, max_points)
+    return split_antimeridian(lat[idx], lon[idx], None if customdata is None else np.asarray(customdata)[idx])
+
+
+def track_trace(lat, lon, customdata=None, hovertemplate=None, webgl=False, **kwargs):
+    """
+    Line trace of a (decimated) track. Hover text is built by the browser from
+    customdata + hovertemplate, not one string per point.
+    :param webgl: Scattergl on lon/lat axes (WebGL) instead of Scattergeo (SVG)
+    """
+    lat = np.asarray(lat, dtype=np.float32)
+    lon = np.asarray(lon, dtype=np.float32)
+    if customdata is not None:
+        customdata = np.asarray(customdata, dtype=np.float32)
+    if webgl:
+        return go.Scattergl(x=lon, y=lat, mode='lines', customdata=customdata,
+                            hovertemplate=hovertemplate, **kwargs)
+    return go.Scattergeo(lat=lat, lon=lon, mode='lines', customdata=customdata,
+                         hovertemplate=hovertemplate, **kwargs)
+
+
+def webgl_map_layout(fig, title=None):
+    """Equirectangular lon/lat axes for Scattergl traces."""
+    fig.update_layout(
+        title=title,
+        xaxis=dict(range=[-180, 180], title='Longitude [deg]', dtick=30),
+        yaxis=dict(range=[-90, 90], title='Latitude [deg]', dtick=30, scaleanchor='x'),
+        margin={"r":0,"t":50,"l":0,"b":0}
+    )
+    return fig
+
+
+"""
+ 2D - PLOT
+"""
+def graficar_2d_plotly(trayectoria, epoch="2025-01-01T12:00:00", tolerance_deg=TRACK_TOLERANCE_DEG, webgl=False):
+    """
+    :param tolerance_deg: track decimation (RDP) [deg], None keeps every sample
+    :param webgl: Scattergl on lon/lat axes instead of the geo map
+    """
+    # 1. Procesamiento de coordenadas con Astropy (GCRS -> ITRS -> geodésicas)
+    t_ref = Time(epoch, format='isot', scale='utc')
+    lats, lons, alts = geodetic_track(trayectoria, t_ref)
+
+    # Traza decimada y cortada en el antimeridiano; hover desde customdata
+    lats, lons, datos = track_segments(lats, lons, np.column_stack([trayectoria[:, 0], alts]), tolerance_deg)
 
     # 2. Creación del gráfico 2D
     fig = go.Figure()
 
     # Añadir la línea de la trayectoria
-    fig.add_trace(go.Scattergeo(
-        lat=lats,
-        lon=lons,
-        mode='lines',
+    fig.add_trace(track_trace(
+        lats, lons, datos,
+        hovertemplate="T: %{customdata[0]:.1f}s<br>Alt: %{customdata[1]:.1f} km<extra></extra>",
+        webgl=webgl,
         line=dict(width=2, color='red'),
-        name='Trayectoria GMAT',
-        hoverinfo='text',
-        text=[f"T: {t:.1f}s<br>Alt: {a:.1f} km" for t, a in zip(trayectoria[:, 0], alts)]
+        name='Trayectoria GMAT'
     ))
 
+    if webgl:
+        return webgl_map_layout(fig, "Ground Track 2D (Proyección Equirrectangular)")
+
     # Configuración del Layout para Mapa 2D
     fig.update_layout(
         title="Ground Track 2D (Proyección Equirrectangular)",
@@ -65,31 +227,18 @@ def graficar_2d_plotly(trayectoria, epoch="2025-01-01T12:00:00"):
  3D - PLOT
 """
 
-def plot_ground_track(trayectoria, epoch="2000-01-01T12:00:00"):
-    # 1. Extraer datos del array de GMAT
-    tiempos_seg = trayectoria[:, 0]
-    pos_km = trayectoria[:, 1:4]
-    
-    # 2. Configurar tiempos con Astropy
-    t_ref = Time(epoch, format='isot', scale='utc')
-    tiempos = t_ref + tiempos_seg * u.second
-    
-    # 3. Transformación de Inercial (GCRS) a Terrestre (ITRS)
+def plot_ground_track(trayectoria, epoch="2000-01-01T12:00:00", tolerance_deg=TRACK_TOLERANCE_DEG):
+    # 1. Latitud y Longitud Geodésica (WGS84) con Astropy
     # GMAT usa MJ2000, que en Astropy mapeamos a GCRS con alta precisión
-    cartesianas = CartesianRepresentation(pos_km.T * u.km)
-    gcrs_coords = GCRS(cartesianas, obstime=tiempos)
-    itrs_coords = gcrs_coords.transform_to(ITRS(obstime=tiempos))
-    
-    # 4. Obtener Latitud y Longitud Geodésica (WGS84)
-    location = EarthLocation.from_geocentric(itrs_coords.x, itrs_coords.y, itrs_coords.z)
-    lat = location.lat.value
-    lon = location.lon.value
-    
-    # 5. Crear el Globo 3D con Plotly
-    fig = go.Figure(data=go.Scattergeo(
-        lat=lat,
-        lon=lon,
-        mode='lines',
+    t_ref = Time(epoch, format='isot', scale='utc')
+    lat, lon, _ = geodetic_track(trayectoria, t_ref)
+
+    # 2. Decimación (RDP) y corte en el antimeridiano
+    lat, lon, _ = track_segments(lat, lon, tolerance_deg=tolerance_deg)
+
+    # 3. Crear el Globo 3D con Plotly
+    fig = go.Figure(data=track_trace(
+        lat, lon,
         line=dict(width=2, color='magenta')
     ))
 
@@ -114,37 +263,39 @@ def plot_ground_track(trayectoria, epoch="2000-01-01T12:00:00"):
 """
  Access PLOT
 """
-def plot_ground_track_with_access(trajectory, epoch, sites_data=None):
+def plot_ground_track_with_access(trajectory, epoch, sites_data=None, tolerance_deg=TRACK_TOLERANCE_DEG, webgl=False):
     """
     Plots the satellite ground track and adds markers for Sites.
     Circle size represents cumulative pass duration.
     
     :param trajectory: numpy array [time, x, y, z]
     :param epoch: Astropy Time or ISO string
-    :param sites_data: List of dicts [{'site': site_obj, 'passes': [pass_list]}]
+    :param sites_data: List of dicts [{'site': site_obj, 'passes': [pass_list] or PassTable}]
+                       or a PassTable of several sites (statistics grouped per site)
+    :param tolerance_deg: track decimation (RDP) [deg], None keeps every sample
+    :param webgl: Scattergl on lon/lat axes instead of the geo map
     """
-    # 1. Trajectory Processing (Your existing logic)
-    t_ref = Time(epoch)
-    tiempos = t_ref + trajectory[:, 0] * u.second
-    cartesianas = CartesianRepresentation(trajectory[:, 1:4].T * u.km)
-    gcrs_coords = GCRS(cartesianas, obstime=tiempos)
-    itrs_coords = gcrs_coords.transform_to(ITRS(obstime=tiempos))
-    
-    location = EarthLocation.from_geocentric(itrs_coords.x, itrs_coords.y, itrs_coords.z)
-    lats = location.lat.value
-    lons = location.lon.value
+    # 1. Trajectory Processing: geodetic track, decimated and split at the antimeridian
+    lats, lons, _ = geodetic_track(trajectory, Time(epoch))
+    lats, lons, times = track_segments(lats, lons, trajectory[:, :1], tolerance_deg)
 
     fig = go.Figure()
 
     # Add Satellite Path
-    fig.add_trace(go.Scattergeo(
-        lat=lats, lon=lons,
-        mode='lines',
+    fig.add_trace(track_trace(
+        lats, lons, times,
+        hovertemplate="T: %{customdata[0]:.1f}s<extra></extra>",
+        webgl=webgl,
         line=dict(width=1.5, color='red'),
         name='Satellite Path'
     ))
 
     # 2. Add Sites with variable bubble size
+    if isinstance(sites_data, PassTable):
+        stats = sites_data.stats_by_site()
+        sites_data = [{'site': sites_data.site_objects[name], 'count': int(row.passes),
+                       'total_duration': float(row.total_duration_sec)}
+                      for name, row in stats.iterrows() if name in sites_data.site_objects]
     if sites_data:
         site_lats = []
         site_lons = []
@@ -154,10 +305,15 @@ def plot_ground_track_with_access(trajectory, epoch, sites_data=None):
 
         for item in sites_data:
             site = item['site']
-            passes = item['passes']
+            passes = item.get('passes', ())
             
             # Calculate total duration for this site
-            total_duration = sum(p.duration_sec for p in passes)
+            if 'total_duration' in item:
+                total_duration, n_passes = item['total_duration'], item['count']
+            elif isinstance(passes, PassTable):
+                total_duration, n_passes = float(passes.duration_sec.sum()), len(passes)
+            else:
+                total_duration, n_passes = sum(p.duration_sec for p in passes), len(passes)
             
             site_lats.append(site.lat)
             site_lons.append(site.lon)
@@ -169,13 +325,11 @@ def plot_ground_track_with_access(trajectory, epoch, sites_data=None):
             
             hover_texts.append(
                 f"Site: {site.name}<br>"
-                f"Total Passes: {len(passes)}<br>"
+                f"Total Passes: {n_passes}<br>"
                 f"Total Time: {total_duration:.1f}s"
             )
 
-        fig.add_trace(go.Scattergeo(
-            lat=site_lats,
-            lon=site_lons,
+        markers = dict(
             text=hover_texts,
             name='Ground Sites',
             mode='markers',
@@ -185,7 +339,14 @@ def plot_ground_track_with_access(trajectory, epoch, sites_data=None):
                 opacity=0.7,
                 line=dict(width=1, color='white')
             )
-        ))
+        )
+        if webgl:
+            fig.add_trace(go.Scattergl(x=site_lons, y=site_lats, **markers))
+        else:
+            fig.add_trace(go.Scattergeo(lat=site_lats, lon=site_lons, **markers))
+
+    if webgl:
+        return webgl_map_layout(fig, "Satellite Ground Track & Site Access Duration")
 
     fig.update_layout(
         title="Satellite Ground Track & Site Access Duration",
@@ -203,4 +364,66 @@ def plot_ground_track_with_access(trajectory, epoch, sites_data=None):
 
     # visual_data = [{'site': station_cordoba, 'passes': passes_cordoba}]
     # fig = plot_ground_track_with_access(trajectory_data, start_epoch, visual_data)
-    # fig.show()
\ No newline at end of file
+    # fig.show()
+
+"""
+ CONSTELLATION PLOT
+"""
+def plot_constellation_tracks(positions, times, epoch, planes=None, tolerance_deg=0.1,
+                              max_points=TRACK_MAX_POINTS, webgl=True):
+    """
+    Ground tracks of a whole constellation, one trace per plane (the satellites
+    of a plane are joined with gaps). Every track is decimated on its own and the
+    point budget of a trace is shared by its satellites, so the figure size is
+    bounded whatever the number of samples.
+    :param positions: inertial cube (n_sats, n_steps, 3+) [km] (Propagator.run_many or isl.walker_positions)
+    :param times: offsets of the steps [sec]
+    :param epoch: Astropy Time or ISO string of t=0
+    :param planes: plane label of every satellite (default: one trace per satellite)
+    :param tolerance_deg: track decimation (RDP) [deg]
+    :param max_points: decimated samples per trace (each antimeridian crossing adds a 3 point gap)
+    :param webgl: Scattergl on lon/lat axes (default) or Scattergeo
+    """
+    positions = np.asarray(positions)[..., :3]
+    n_sats = positions.shape[0]
+    planes = np.arange(n_sats) if planes is None else np.asarray(planes)
+
+    # Sub-satellite points of the whole cube with frames (rotations computed once per step)
+    grid = TimeGrid.from_time(epoch, times)
+    lat, lon, alt = frames.ecef_to_geodetic(grid.eci_to_ecef(positions))
+
+    fig = go.Figure()
+    for plane in np.unique(planes):
+        members = np.nonzero(planes == plane)[0]
+        budget = max(max_points // len(members), 2)
+        seg_lat, seg_lon, seg_data = [], [], []
+        for k in members:
+            data = np.column_stack([grid.offsets, alt[k], np.full(len(grid), k)])
+            la, lo, cd = track_segments(lat[k], lon[k], data, tolerance_deg, budget)
+            seg_lat += [la, [np.nan]]
+            seg_lon += [lo, [np.nan]]
+            seg_data += [cd, np.full((1, 3), np.nan)]
+        fig.add_trace(track_trace(
+            np.concatenate(seg_lat), np.concatenate(seg_lon), np.concatenate(seg_data),
+            hovertemplate="Sat %{customdata[2]:.0f}<br>T: %{customdata[0]:.0f}s<br>"
+                          "Alt: %{customdata[1]:.1f} km<extra>%{fullData.name}</extra>",
+            webgl=webgl,
+            line=dict(width=1),
+            name=f"Plane {plane}"
+        ))
+
+    title = f"Constellation ground tracks ({n_sats} satellites)"
+    if webgl:
+        return webgl_map_layout(fig, title)
+    fig.update_layout(
+        title=title,
+        geo=dict(projection_type='equirectangular', showland=True, showcountries=True),
+        margin={"r":0,"t":50,"l":0,"b":0}
+    )
+    return fig
+
+# elements = walker_elements(588, 12, 1, 87.9, cts.Re + 1200.0)
+# times = np.arange(0, 3 * 86400, 30.0)
+# fig = plot_constellation_tracks(walker_positions(elements, times), times, "2026-02-10T12:00:00",
+#                                 planes=np.repeat(np.arange(12), 49))
+# fig.show()